@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+codepoints.py - Codepoint Lookup Benchmark
+
+Times .u lookups by name words and by regexp with the old scans (a
+unicodedata.name() call per codepoint, per query) and with the name index in
+modules/codepoints.py, checks that both give the same answers, and reports
+how long the index takes to build.
+
+Usage: benchmarks/codepoints.py
+"""
+
+import os
+import re
+import sys
+import time
+import unicodedata
+from itertools import islice
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import tools
+tools.debug = True
+
+from modules import codepoints
+
+words = ['snowman', 'hammer', 'greek small alpha', 'arrow', 'latin capital a',
+         'smiling face', 'cjk', 'zzzz']
+regexps = ['BBBB', 'SNOW.*MAN$', '^DOUBLE', 'FACE WITH', 'ZZZZ']
+
+
+def simple(arg):
+    arg = arg.upper()
+
+    r_label = re.compile('\\b' + arg.replace(' ', '.*\\b') + '\\b')
+
+    results = []
+    for cp in range(0xFFFF):
+        u = chr(cp)
+        try: name = unicodedata.name(u)
+        except ValueError: continue
+
+        if r_label.search(name):
+            results.append((len(name), u, cp, name))
+    if not results:
+        r_label = re.compile('\\b' + arg.replace(' ', '.*\\b'))
+        for cp in range(0xFFFF):
+            u = chr(cp)
+            try: name = unicodedata.name(u)
+            except ValueError: continue
+
+            if r_label.search(name):
+                results.append((len(name), u, cp, name))
+
+    if not results:
+        return None
+
+    length, u, cp, name = sorted(results)[0]
+    return codepoints.about(u, cp, name)
+
+
+def extended(arg):
+    r_search = re.compile(arg.upper())
+
+    for cp in range(1, 0x10FFFF):
+        u = chr(cp)
+        name = unicodedata.name(u, '-')
+
+        if r_search.search(name):
+            yield codepoints.about(u, cp, name)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(argv):
+    _, build = timed(codepoints.load_index)
+    print('index built in %.0f ms' % build)
+
+    for arg in words:
+        old, old_ms = timed(simple, arg)
+        new, new_ms = timed(codepoints.codepoint_simple, arg)
+        assert old == new, (arg, old, new)
+        print('.u %-20s %8.1f ms %8.2f ms' % (arg, old_ms, new_ms))
+
+    for arg in regexps:
+        # .u shows at most four results
+        old, old_ms = timed(lambda: list(islice(extended(arg), 4)))
+        new, new_ms = timed(lambda: list(islice(codepoints.codepoint_extended(arg), 4)))
+        assert old == new, (arg, old, new)
+        print('.u %-20s %8.1f ms %8.2f ms' % (arg, old_ms, new_ms))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
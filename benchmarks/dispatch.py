@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+dispatch.py - Dispatch Benchmark
+
+Replays a recorded channel log through the legacy dispatch loop (every bound
+regexp of every priority) and through the compiled dispatch index, checks
+that both pick the same handlers, and reports regexp tests and time per line.
+
+Usage: benchmarks/dispatch.py [logfile] [rounds]
+"""
+
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import bot
+import irc
+
+default_log = os.path.join(root, 'benchmarks', 'data', 'channel.log')
+
+
+class Config(object):
+    nick = 'begiak'
+    name = 'begiak'
+    channels = ['#apertium']
+    password = None
+    host = 'irc.example.net'
+    prefix = r'\.'
+    owner = 'owner'
+    admins = []
+    ignore = []
+
+
+def load_bot():
+    # build the bot by hand: Phenny.setup would run every module's setup()
+    phenny = bot.Phenny.__new__(bot.Phenny)
+    irc.Bot.__init__(phenny, Config.nick, Config.name, Config.channels)
+    phenny.config = Config
+    phenny.doc = {}
+    phenny.stats = {}
+    phenny.variables = {}
+    phenny.loading = set()
+    phenny.setup_lock = threading.RLock()
+
+    directory = os.path.join(root, 'modules')
+    for fn in sorted(os.listdir(directory)):
+        if not fn.endswith('.py') or fn.startswith('_'):
+            continue
+
+        name = fn[:-3]
+        try:
+            loader = importlib.machinery.SourceFileLoader(name, os.path.join(directory, fn))
+            module = loader.load_module()
+            phenny.register(module)
+            phenny.bind_commands()
+        except Exception:
+            phenny.variables.pop(name, None)
+
+    phenny.bind_commands()
+    return phenny
+
+
+def parse(line):
+    if line.startswith(':'):
+        source, line = line[1:].split(' ', 1)
+
+    if ' :' in line:
+        middle, text = line.split(' :', 1)
+    else:
+        middle, text = line, ''
+
+    return middle.split()[0], text
+
+
+def legacy(phenny, event, text):
+    tested, matched = 0, []
+
+    for priority in ('high', 'medium', 'low'):
+        for regexp, funcs in list(phenny.commands[priority].items()):
+            for func in funcs:
+                if event != func.event and func.event != '*': continue
+
+                tested += 1
+                if regexp.fullmatch(text):
+                    matched.append(func)
+
+    return tested, matched
+
+
+def indexed(phenny, event, text):
+    tested, matched = 0, []
+
+    for order, regexp, func in phenny.index.candidates(event, text):
+        tested += 1
+        if regexp.fullmatch(text):
+            matched.append(func)
+
+    return tested, matched
+
+
+def measure(fn, phenny, lines, rounds):
+    tested = 0
+    start = time.perf_counter()
+
+    for i in range(rounds):
+        for event, text in lines:
+            tested += fn(phenny, event, text)[0]
+
+    elapsed = time.perf_counter() - start
+    count = len(lines) * rounds
+    return tested / count, elapsed / count * 1e6
+
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else default_log
+    rounds = int(argv[2]) if len(argv) > 2 else 20
+
+    with open(path, encoding='utf-8') as f:
+        lines = [parse(line.rstrip('\r\n')) for line in f if line.strip()]
+
+    phenny = load_bot()
+    handlers = sum(len(funcs) for commands in phenny.commands.values()
+                   for funcs in commands.values())
+    print('%d lines, %d modules, %d bound handlers' % (len(lines), len(phenny.variables), handlers))
+
+    for event, text in lines:
+        if legacy(phenny, event, text)[1] != indexed(phenny, event, text)[1]:
+            print('MISMATCH: %s %r' % (event, text))
+            return 1
+
+    for name, fn in (('legacy', legacy), ('indexed', indexed)):
+        tests, usec = measure(fn, phenny, lines, rounds)
+        print('%-8s %6.1f regexp tests/line %8.1f us/line' % (name, tests, usec))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
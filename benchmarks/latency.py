@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+latency.py - Command Latency Benchmark
+
+Runs commands through the bot's dispatcher against an HTTP cassette (see
+cassettes.py) and reports how long each took to answer, with and without
+simulated network latency. The first run needs a network and records the
+cassette; later runs replay it and give the same numbers every time.
+
+Usage: benchmarks/latency.py [cassette] [latency] [jitter]
+"""
+
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import bot
+import cassettes
+import irc
+
+default_cassette = os.path.join(root, 'benchmarks', 'data', 'latency.json')
+
+commands = [
+    '.t en-es hello world',
+    '.t en-es|es-ca hello world',
+    '.listpairs en',
+    '.identlang hola mundo',
+    '.ety pear',
+]
+
+
+class Config(object):
+    nick = 'begiak'
+    name = 'begiak'
+    channels = ['#apertium']
+    password = None
+    host = 'irc.example.net'
+    prefix = r'\.'
+    owner = 'owner'
+    admins = []
+    ignore = []
+    APy_url = 'https://apertium.org/apy'
+    APy_analyseURL = 'https://apertium.org/apy'
+
+
+class Bot(bot.Phenny):
+    # build the bot by hand: Phenny.setup would run every module's setup()
+    def __init__(self, names):
+        irc.Bot.__init__(self, Config.nick, Config.name, Config.channels)
+        self.config = Config
+        self.doc = {}
+        self.stats = {}
+        self.variables = {}
+        self.modules = {}
+        self.loading = set()
+        self.setup_lock = threading.RLock()
+        self.replies = []
+
+        for name in names:
+            path = os.path.join(root, 'modules', name + '.py')
+            module = importlib.machinery.SourceFileLoader(name, path).load_module()
+            self.modules[name] = module
+            self.register(module)
+
+        self.bind_commands()
+
+        # answer on this thread, so the time taken is the command's
+        for functions in self.variables.values():
+            for func in functions.values():
+                func.thread = False
+
+    def msg(self, recipient, text, target=None):
+        self.replies.append(text)
+
+    def error(self, report, max_path=10):
+        self.replies.append('error')
+
+
+def measure(phenny, command):
+    origin = irc.Origin(phenny, 'user!~user@example.org', ('PRIVMSG', '#apertium'))
+    del phenny.replies[:]
+
+    start = time.perf_counter()
+    phenny.dispatch(origin, ('PRIVMSG', '#apertium'), command)
+    return time.perf_counter() - start, len(phenny.replies)
+
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else default_cassette
+    latency = float(argv[2]) if len(argv) > 2 else 0.05
+    jitter = float(argv[3]) if len(argv) > 3 else 0.01
+
+    phenny = Bot(['apy', 'wiktionary'])
+
+    if not os.path.exists(path):
+        with cassettes.use(path, record=True):
+            for command in commands:
+                measure(phenny, command)
+        print('recorded %s' % path)
+
+    for label, delay, spread in (('no latency', 0, 0), ('latency', latency, jitter)):
+        print('%s:' % label)
+        with cassettes.use(path, delay, spread):
+            for command in commands:
+                # memoized translations would hide the network on later runs
+                phenny.modules['apy'].translations.results.clear()
+                elapsed, replies = measure(phenny, command)
+                print('  %-30s %8.1f ms  %d lines' % (command, elapsed * 1000, replies))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+nearest.py - Nearest Station Benchmark
+
+Looks up the nearest ICAO station for random coordinates with the old linear
+scan over icao.data in raw degrees and with the k-d tree in icao.nearest,
+and reports queries per second and how often the raw-degree scan picks a
+station that isn't actually the nearest.
+
+Usage: benchmarks/nearest.py [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import icao
+
+
+def linear(latitude, longitude):
+    sumOfSquares = (99999999999999999999999999999, 'ICAO')
+
+    for icao_code, lat, lon in icao.data:
+        latDiff = abs(latitude - lat)
+        lonDiff = abs(longitude - lon)
+        diff = (latDiff * latDiff) + (lonDiff * lonDiff)
+
+        if diff < sumOfSquares[0]:
+            sumOfSquares = (diff, icao_code)
+
+    return sumOfSquares[1]
+
+
+def indexed(latitude, longitude):
+    return icao.nearest(latitude, longitude)[0]
+
+
+def measure(fn, points):
+    start = time.perf_counter()
+    results = [fn(lat, lon) for lat, lon in points]
+    return results, len(points) / (time.perf_counter() - start)
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 3000
+
+    random.seed(0)
+    points = [(random.uniform(-90, 90), random.uniform(-180, 180)) for i in range(count)]
+
+    start = time.perf_counter()
+    icao.load()
+    print('table loaded in %.2f ms' % ((time.perf_counter() - start) * 1000))
+
+    start = time.perf_counter()
+    icao.load_index()
+    print('index built in %.1f ms' % ((time.perf_counter() - start) * 1000))
+
+    old, old_rate = measure(linear, points)
+    new, new_rate = measure(indexed, points)
+
+    print('%-8s %10.0f queries/s' % ('linear', old_rate))
+    print('%-8s %10.0f queries/s' % ('k-d tree', new_rate))
+
+    wrong = sum(a != b for a, b in zip(old, new))
+    print('raw-degree scan disagreed with great-circle nearest on %d of %d queries' % (wrong, count))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
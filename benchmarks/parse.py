@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+parse.py - Line Framing And Parsing Benchmark
+
+Feeds a recorded channel log and a synthetic 100k-line stream, in 4096-byte
+reads, through the old asynchat-style framing and parsing and through
+irc.Bot.handle_read, and reports lines per second for each.
+
+Usage: benchmarks/parse.py [logfile]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+import irc
+
+default_log = os.path.join(root, 'benchmarks', 'data', 'channel.log')
+r_source = re.compile(r'([^!]*)!?([^@]*)@?(.*)')
+
+
+class Origin(object):
+    def __init__(self, bot, source, args):
+        if not source:
+            source = ""
+        match = r_source.match(source)
+        self.nick, self.user, self.host = match.groups()
+
+        if len(args) > 1:
+            target = args[1]
+        else: target = None
+
+        mappings = {bot.nick: self.nick, None: None}
+        self.sender = mappings.get(target, target)
+
+
+class LegacyBot(object):
+    nick = 'begiak'
+
+    def __init__(self):
+        self.buffer = b''
+        self.count = 0
+
+    def handle_read(self, data):
+        while data:
+            line, terminator, data = data.partition(b'\n')
+            self.buffer += line
+
+            if terminator:
+                self.found_terminator()
+
+    def found_terminator(self):
+        line = self.buffer
+        if line.endswith(b'\r'):
+            line = line[:-1]
+        self.buffer = b''
+
+        try:
+            line = line.decode('utf-8')
+        except UnicodeDecodeError:
+            line = line.decode('iso-8859-1')
+
+        if line.startswith(':'):
+            source, line = line[1:].split(' ', 1)
+        else:
+            source = None
+
+        if ' :' in line:
+            middle, trailing = line.split(' :', 1)
+            middle = middle.split()
+            args = tuple(middle + [trailing])
+            text = trailing
+        else:
+            middle, trailing = line.split(), None
+            args = tuple(middle)
+            text = ''
+
+        origin = Origin(self, source, args)
+        self.dispatch(origin, args, text)
+
+        if args[0] == 'PING':
+            pass
+
+    def dispatch(self, origin, args, text):
+        self.count += 1
+
+
+class Bot(irc.Bot):
+    def __init__(self):
+        irc.Bot.__init__(self, 'begiak', 'begiak', [])
+        self.count = 0
+
+    def dispatch(self, origin, args, text):
+        self.count += 1
+
+
+def synthetic(count):
+    random.seed(0)
+    nicks = ['user%d' % i for i in range(200)]
+    words = 'the quick brown fox jumps over the lazy dog apertium begiak'.split()
+    lines = []
+
+    for i in range(count):
+        nick = random.choice(nicks)
+        text = ' '.join(random.choice(words) for j in range(random.randint(1, 30)))
+        if i % 10 == 0:
+            prefix = '@time=2020-01-01T00:00:%02d.000Z;account=%s ' % (i % 60, nick)
+        else:
+            prefix = ''
+        lines.append('%s:%s!~%s@%s.example.org PRIVMSG #apertium :%s'
+                     % (prefix, nick, nick, nick, text))
+
+    return ('\r\n'.join(lines) + '\r\n').encode('utf-8')
+
+
+def chunks(data, size=4096):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def measure(cls, reads, rounds=1):
+    start = time.perf_counter()
+    for i in range(rounds):
+        bot = cls()
+        for data in reads:
+            bot.handle_read(data)
+    elapsed = time.perf_counter() - start
+    return bot.count, bot.count * rounds / elapsed
+
+
+def main(argv):
+    path = argv[1] if len(argv) > 1 else default_log
+
+    with open(path, 'rb') as f:
+        log = f.read().replace(b'\n', b'\r\n')
+
+    streams = [
+        (os.path.basename(path), chunks(log), 50),
+        ('synthetic', chunks(synthetic(100000)), 1),
+    ]
+
+    for name, reads, rounds in streams:
+        for label, cls in (('legacy', LegacyBot), ('irc.Bot', Bot)):
+            count, rate = measure(cls, reads, rounds)
+            print('%-12s %-8s %7d lines %10.0f lines/s' % (name, label, count, rate))
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+timezones.py - Time Zone Lookup Benchmark
+
+Resolves every known zone name, every abbreviation and every two-letter
+prefix with the old scan over the tz table and with the trie in
+clock.TimeZones, checks that they agree, and reports lookups per second.
+Uses the saved time zone snapshot if there is one, and otherwise zone names
+from the system tz database (with no abbreviations).
+
+Usage: benchmarks/timezones.py [rounds]
+"""
+
+import datetime
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root)
+
+from modules import clock
+
+
+def system_zones():
+    import zoneinfo
+
+    now = datetime.datetime.utcnow()
+    zones = {}
+    for key in sorted(zoneinfo.available_timezones()):
+        offset = zoneinfo.ZoneInfo(key).utcoffset(now).total_seconds() / 3600
+        name = key.split('/')[-1].replace('_', ' ').upper()
+        if '+' not in name and '-' not in name:
+            zones[name] = offset
+    return {}, zones
+
+
+def scan(abbreviations, zones, key):
+    offsets = []
+
+    if key in abbreviations:
+        offsets.extend(abbreviations[key])
+
+    for (name, offset) in zones.items():
+        if len(name) >= len(key) and name[:len(key)] == key:
+            offsets.append((name, offset))
+
+    return offsets
+
+
+def measure(fn, keys, rounds):
+    start = time.perf_counter()
+    for i in range(rounds):
+        results = [fn(key) for key in keys]
+    return results, len(keys) * rounds / (time.perf_counter() - start)
+
+
+def main(argv):
+    rounds = int(argv[1]) if len(argv) > 1 else 20
+
+    if clock.time_zones.load():
+        abbreviations, zones = clock.time_zones.data
+        source = 'snapshot'
+    else:
+        abbreviations, zones = system_zones()
+        source = 'system tz database'
+
+    start = time.perf_counter()
+    resolver = clock.TimeZones(abbreviations, zones)
+    print('%d zones, %d abbreviations from the %s; trie built in %.1f ms' % (
+        len(zones), len(abbreviations), source, (time.perf_counter() - start) * 1000))
+
+    keys = sorted(set(zones) | set(abbreviations) | set(name[:2] for name in zones))
+    keys = [key for key in keys if key == key.upper()]
+
+    old, old_rate = measure(lambda key: scan(abbreviations, zones, key), keys, rounds)
+    new, new_rate = measure(lambda key: resolver.find(key)[0], keys, rounds)
+    assert old == new
+
+    # what .time actually asks for
+    bounded, bounded_rate = measure(lambda key: resolver.find(key, 3), keys, rounds)
+
+    print('scan          %10.0f lookups/s' % old_rate)
+    print('trie          %10.0f lookups/s' % new_rate)
+    print('trie, first 3 %10.0f lookups/s' % bounded_rate)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
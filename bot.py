@@ -7,16 +7,26 @@ Licensed under the Eiffel Forum License 2.
 http://inamidst.com/phenny/
 """
 
+import asyncio
+import concurrent.futures
 import importlib
 import irc
 import logging
 import os
 import re
+import scheduler
 import sys
 import threading
+import time
 import traceback
 import tools
-from tools import GrumbleError, decorate, rephrase_errors
+import workers
+from tools import GrumbleError, decorate, rephrase_errors, rephrased_errors
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
 
 logger = logging.getLogger('phenny')
 
@@ -52,13 +62,135 @@ def module_control(phenny, module, func):
     logger.error("Error during %s of %s module:\n%s" % (func, name, desc))
     return False
 
+# Module setups run in parallel on this many threads. The bot waits up to
+# setup_timeout seconds (or setup.timeout, if a module sets it) for each one
+# before connecting anyway; modules whose setup sets background = True aren't
+# waited for at all. Until a setup finishes, its module's commands answer that
+# they're still loading.
+setup_threads = 8
+setup_timeout = 30
+
+# Give up on prefix extraction for rules with more alternatives than this
+max_prefixes = 64
+
+def _literal_prefixes(items):
+    """Return (prefix, exhausted) pairs for a parsed regular expression.
+
+    exhausted is true when the whole of items was consumed as literals,
+    i.e. the caller may keep appending whatever follows."""
+    results = [('', True)]
+
+    for op, av in items:
+        if op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            # zero-width, so whatever follows still has to start the line
+            continue
+        elif op is sre_parse.LITERAL:
+            branch = [(chr(av), True)]
+        elif op is sre_parse.IN and all(o is sre_parse.LITERAL for o, a in av):
+            branch = [(chr(a), True) for o, a in av]
+        elif op is sre_parse.SUBPATTERN:
+            if len(av) == 4 and av[1] & re.IGNORECASE:
+                break
+            branch = _literal_prefixes(av[-1])
+        elif op is sre_parse.BRANCH:
+            branch = [pair for alt in av[1] for pair in _literal_prefixes(alt)]
+        else:
+            break
+
+        expanded = []
+        for prefix, exhausted in results:
+            if exhausted:
+                expanded.extend((prefix + p, e) for p, e in branch)
+            else:
+                expanded.append((prefix, False))
+
+        if len(expanded) > max_prefixes:
+            break
+
+        results = expanded
+        if not any(exhausted for prefix, exhausted in results):
+            return results
+    else:
+        return results
+
+    return [(prefix, False) for prefix, exhausted in results]
+
+def literal_prefixes(regexp):
+    """Literal strings at least one of which any full match of regexp
+    starts with. A rule that can match anything yields ['']."""
+    if regexp.flags & re.IGNORECASE:
+        return ['']
+
+    try:
+        parsed = sre_parse.parse(regexp.pattern, regexp.flags)
+    except Exception:
+        return ['']
+
+    prefixes = sorted(set(p for p, e in _literal_prefixes(parsed)),
+                      key=lambda p: (len(p), p))
+
+    # '.t' already covers '.tweb'
+    minimal = []
+    for prefix in prefixes:
+        if not any(prefix.startswith(shorter) for shorter in minimal):
+            minimal.append(prefix)
+
+    return minimal
+
+class DispatchIndex(object):
+    """Bound handlers bucketed by event and by literal line prefix, so a
+    line is only tested against handlers that could possibly match it."""
+
+    def __init__(self, commands):
+        self.events = {}
+
+        order = 0
+        for priority in ('high', 'medium', 'low'):
+            for regexp, funcs in commands[priority].items():
+                prefixes = literal_prefixes(regexp)
+
+                for func in funcs:
+                    entry = (order, regexp, func)
+                    buckets = self.events.setdefault(func.event, {})
+                    for prefix in prefixes:
+                        buckets.setdefault(prefix, []).append(entry)
+                    order += 1
+
+        self.lengths = {}
+        for event, buckets in self.events.items():
+            self.lengths[event] = sorted(set(len(p) for p in buckets))
+
+    def candidates(self, event, text):
+        """Entries (order, regexp, func) worth testing, in dispatch order."""
+        found = {}
+
+        for key in (event, '*'):
+            buckets = self.events.get(key)
+            if not buckets:
+                continue
+
+            for length in self.lengths[key]:
+                if length > len(text):
+                    break
+                for entry in buckets.get(text[:length], ()):
+                    found[entry[0]] = entry
+
+        return [found[order] for order in sorted(found)]
+
 class Phenny(irc.Bot): 
     def __init__(self, config): 
         args = (config.nick, config.name, config.channels, config.password)
         irc.Bot.__init__(self, *args)
         self.config = config
+        self.sender.burst = self.sender.tokens = getattr(config, 'send_burst', 1.0)
         self.doc = {}
         self.stats = {}
+        self.executor = workers.Executor(config)
+        self.scheduler = scheduler.Scheduler(workers.WorkerPool('scheduler', threads=2))
+        self.loading = set()
+        self.setup_lock = threading.RLock()
+        self.closed = False
+        self.close_lock = threading.Lock()
         self.setup()
 
     def setup(self): 
@@ -99,27 +231,81 @@ class Phenny(irc.Bot):
                 logger.error("Error loading %s module:\n%s" % (name, trace))
                 continue
 
-            if module_control(self, module, 'setup'):
-                self.register(module)
-                modules[name] = module
+            self.register(module)
+            modules[name] = module
 
         self.modules = modules
+        self.bind_commands()
+        self.setup_modules(list(modules.values()))
 
-        if modules: 
-            logger.info('Registered modules: ' + ', '.join(sorted(modules.keys())))
+        if self.modules: 
+            logger.info('Registered modules: ' + ', '.join(sorted(self.modules.keys())))
         else:
             logger.warning("Couldn't find any modules")
 
-        self.bind_commands()
+    def setup_modules(self, modules):
+        modules = [module for module in modules if hasattr(module, 'setup')]
+        if not modules:
+            return
+
+        with self.setup_lock:
+            self.loading.update(module.__name__ for module in modules)
+
+        pool = concurrent.futures.ThreadPoolExecutor(
+            min(setup_threads, len(modules)), thread_name_prefix='setup')
+        start = time.time()
+        waiting = []
+
+        for module in modules:
+            future = pool.submit(self.setup_module, module)
+            if not getattr(module.setup, 'background', False):
+                waiting.append((module, future))
+
+        # threads still running setups carry on after this
+        pool.shutdown(wait=False)
+
+        for module, future in waiting:
+            timeout = getattr(module.setup, 'timeout', setup_timeout)
+            try:
+                future.result(max(0, start + timeout - time.time()))
+            except concurrent.futures.TimeoutError:
+                logger.warning("Setup of %s module is taking more than %ss, "
+                               "not waiting for it" % (module.__name__, timeout))
+
+    def setup_module(self, module):
+        start = time.time()
+        ready = False
+
+        try:
+            ready = module_control(self, module, 'setup')
+        finally:
+            with self.setup_lock:
+                try:
+                    if ready:
+                        logger.info("Set up %s module in %.2fs" % (module.__name__, time.time() - start))
+                        # pick up handlers the setup added to self.variables
+                        self.bind_commands()
+                    else:
+                        self.unregister(module)
+                finally:
+                    self.loading.discard(module.__name__)
+
+    def unregister(self, module):
+        with self.setup_lock:
+            if self.modules.get(module.__name__) is module:
+                del self.modules[module.__name__]
+            self.variables.pop(module.__name__, None)
+            self.bind_commands()
 
     def register(self, module):
         # This is used by reload.py, hence it being methodised
-        if module.__name__ not in self.variables:
-            self.variables[module.__name__] = {}
+        with self.setup_lock:
+            if module.__name__ not in self.variables:
+                self.variables[module.__name__] = {}
 
-        for name, obj in vars(module).items():
-            if hasattr(obj, 'commands') or hasattr(obj, 'rule'): 
-                self.variables[module.__name__][name] = obj
+            for name, obj in vars(module).items():
+                if hasattr(obj, 'commands') or hasattr(obj, 'rule'): 
+                    self.variables[module.__name__][name] = obj
 
     def bind(self, module, name, func, regexp):
         # register documentation
@@ -139,7 +325,7 @@ class Phenny(irc.Bot):
 
         if func.point:
             keys.append('(?!.*(?:->|→))' + regexp + '()')
-            keys.append(regexp + '\s(?:->|→)\s(\S*)')
+            keys.append(regexp + r'\s(?:->|→)\s(\S*)')
         else:
             keys.append(regexp)
 
@@ -205,11 +391,15 @@ class Phenny(irc.Bot):
             self.bind(module, name, func, regexp)
 
     def bind_commands(self):
-        self.commands = {'high': {}, 'medium': {}, 'low': {}}
+        # setups running in parallel change self.variables under setup_lock
+        with self.setup_lock:
+            self.commands = {'high': {}, 'medium': {}, 'low': {}}
 
-        for module, functions in self.variables.items():
-            for name, func in functions.items():
-                self.bind_command(module, name, func)
+            for module, functions in self.variables.items():
+                for name, func in functions.items():
+                    self.bind_command(module, name, func)
+
+            self.index = DispatchIndex(self.commands)
 
     def wrapped(self, origin, text, match):
         sender = origin.sender or text
@@ -231,13 +421,14 @@ class Phenny(irc.Bot):
                 s.group = match.group
                 s.groups = match.groups
                 s.args = args
+                s.tags = getattr(origin, 'tags', {})
                 s.owner = s.nick == self.config.owner
                 s.admin = (s.nick in self.config.admins) or s.owner
                 return s
 
         return CommandInput(text, origin, match, args)
 
-    def call(self, func, origin, phenny, input):
+    def reporter(self, func, input):
         def report(*lines, verbose=True):
             for admin in self.config.admins:
                 if verbose:
@@ -246,6 +437,11 @@ class Phenny(irc.Bot):
                 for line in lines:
                     self.msg(admin, line)
 
+        return report
+
+    def call(self, func, origin, phenny, input):
+        report = self.reporter(func, input)
+
         try:
             rephrase_errors(func, phenny, input)
         except GrumbleError as e:
@@ -253,6 +449,17 @@ class Phenny(irc.Bot):
         except Exception as e: 
             self.error(report)
 
+    async def call_async(self, func, origin, phenny, input):
+        report = self.reporter(func, input)
+
+        try:
+            with rephrased_errors():
+                await func(phenny, input)
+        except GrumbleError as e:
+            report(str(e), verbose=False)
+        except Exception as e: 
+            self.error(report)
+
     def limit(self, origin, func): 
         if origin.sender and origin.sender.startswith('#'): 
             if hasattr(self.config, 'limit'): 
@@ -261,39 +468,62 @@ class Phenny(irc.Bot):
                     return True
         return False
 
+    def handle_close(self):
+        # startup's ping timeout closes the connection itself, and then the
+        # read loop ending calls this again
+        with self.close_lock:
+            if self.closed:
+                return
+            self.closed = True
+
+        self.scheduler.shutdown()
+        self.executor.shutdown()
+
+        # let modules write out what they're holding (logger's line counts)
+        for module in list(getattr(self, 'modules', {}).values()):
+            module_control(self, module, 'teardown')
+
+        irc.Bot.handle_close(self)
+
     def dispatch(self, origin, args, text):
         event = args[0]
 
         if origin.nick in self.config.ignore:
              return
 
-        for priority in ('high', 'medium', 'low'): 
-            items = list(self.commands[priority].items())
-
-            for regexp, funcs in items: 
-                for func in funcs: 
-                    if event != func.event and func.event != '*': continue
-
-                    match = regexp.fullmatch(text)
-                    if not match: continue
+        for order, regexp, func in self.index.candidates(event, text):
+            match = regexp.fullmatch(text)
+            if not match: continue
 
-                    if self.limit(origin, func): continue
+            if self.limit(origin, func): continue
 
-                    phenny = self.wrapped(origin, text, match)
-                    input = self.input(origin, text, match, args)
+            phenny = self.wrapped(origin, text, match)
 
-                    if func.thread:
-                        targs = (func, origin, phenny, input)
-                        t = threading.Thread(target=self.call, args=targs, name=func.name)
-                        t.start()
-                    else:
-                        self.call(func, origin, phenny, input)
+            if func.__module__ in self.loading:
+                if hasattr(func, 'commands'):
+                    phenny.reply("Still loading, try again in a bit.")
+                continue
 
-                    for source in [decode(origin.sender), decode(origin.nick)]:
-                        try:
-                            self.stats[(func.name, source)] += 1
-                        except KeyError:
-                            self.stats[(func.name, source)] = 1
+            input = self.input(origin, text, match, args)
+
+            if asyncio.iscoroutinefunction(func):
+                # coroutine handlers run on the event loop, no thread needed
+                self.spawn(self.call_async(func, origin, phenny, input))
+            elif func.thread:
+                targs = (func, origin, phenny, input)
+                key = (func.name, input.sender)
+                busy = None
+                if hasattr(func, 'commands'):
+                    busy = lambda phenny=phenny: phenny.reply("I'm busy, try again in a bit.")
+                self.executor.submit(func, self.call, targs, key=key, busy=busy)
+            else:
+                self.call(func, origin, phenny, input)
+
+            for source in [decode(origin.sender), decode(origin.nick)]:
+                try:
+                    self.stats[(func.name, source)] += 1
+                except KeyError:
+                    self.stats[(func.name, source)] = 1
 
 if __name__ == '__main__': 
     print(__doc__)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+cassettes.py - Phenny HTTP Record And Replay
+
+A cassette is a JSON file of HTTP exchanges. While one is in use, every
+request made through web.py is either recorded into it, going out to the
+network as usual, or, once the cassette exists, answered from it by a server
+on 127.0.0.1 that waits latency seconds (give or take up to jitter) before
+each response. Tests and benchmarks then run without a network, but still
+over real connections, and take the same time on every run. A request that
+isn't in the cassette raises CassetteMiss.
+
+web.py's HTTP cache and memoized results are set aside meanwhile, so every
+request reaches the cassette.
+
+    with cassettes.use('test/cassettes/apy.json', latency=0.05, jitter=0.01):
+        ...
+"""
+
+import base64
+import contextlib
+import hashlib
+import http.server
+import json
+import os
+import random
+import threading
+import time
+
+import requests
+
+import httpcache
+import web
+
+# the replay server finds the recorded exchange by this header
+url_header = 'X-Cassette-URL'
+# and sets this one when there isn't one
+miss_header = 'X-Cassette-Miss'
+
+# these describe the recorded transfer, not the body we send back
+hop_headers = ('connection', 'content-encoding', 'content-length', 'keep-alive',
+               'transfer-encoding')
+
+
+class CassetteMiss(Exception):
+    """A request with no recorded answer. Deliberately not a requests
+    exception, so it isn't mistaken for the server being down."""
+    pass
+
+
+def request_key(method, url, body):
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    if not body:
+        return '%s %s' % (method, url)
+    return '%s %s %s' % (method, url, hashlib.sha1(body).hexdigest())
+
+
+class Cassette(object):
+    def __init__(self, path):
+        self.path = path
+        self.exchanges = {}
+        self.played = {}
+        self.lock = threading.Lock()
+
+    def load(self):
+        with open(self.path, encoding='utf-8') as f:
+            self.exchanges = json.load(f)
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(self.exchanges, f, indent=1, sort_keys=True)
+
+    def add(self, key, response):
+        exchange = {
+            'status': response.status_code,
+            'headers': [(k, v) for k, v in response.headers.items()
+                        if k.lower() not in hop_headers],
+            'body': base64.b64encode(response.content).decode('ascii'),
+        }
+
+        with self.lock:
+            self.exchanges.setdefault(key, []).append(exchange)
+
+    def find(self, key):
+        """The next recorded answer to key, in recording order; the last one
+        is repeated once they've all been played."""
+        with self.lock:
+            exchanges = self.exchanges.get(key)
+            if not exchanges:
+                return None
+
+            i = self.played.get(key, 0)
+            self.played[key] = i + 1
+            return exchanges[min(i, len(exchanges) - 1)]
+
+
+class RecordingAdapter(web.PooledAdapter):
+    def __init__(self, cassette):
+        web.PooledAdapter.__init__(self)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        response = web.PooledAdapter.send(self, request, **kwargs)
+        self.cassette.add(request_key(request.method, request.url, request.body), response)
+        return response
+
+
+class ReplayAdapter(web.PooledAdapter):
+    """Sends every request to the replay server instead, over a pooled
+    connection like any other, naming the real URL in a header."""
+
+    def __init__(self, server):
+        web.PooledAdapter.__init__(self)
+        self.server = server
+
+    def send(self, request, **kwargs):
+        url = request.url
+        request.url = self.server.url
+        request.headers[url_header] = url
+
+        try:
+            response = web.PooledAdapter.send(self, request, **kwargs)
+        finally:
+            request.url = url
+            del request.headers[url_header]
+
+        if response.headers.get(miss_header):
+            response.close()
+            raise CassetteMiss('No recording of %s in %s' % (
+                response.headers[miss_header], self.server.cassette.path))
+
+        # so redirects and response.url look like the real thing
+        response.url = url
+        return response
+
+
+class ReplayHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body go out in separate writes; don't let Nagle hold the
+    # body back for a delayed ACK
+    disable_nagle_algorithm = True
+
+    def replay(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        key = request_key(self.command, self.headers.get(url_header), body)
+
+        exchange = self.server.cassette.find(key)
+        self.server.wait()
+
+        if exchange is None:
+            status, headers, body = 404, [(miss_header, key)], b''
+        else:
+            status, headers = exchange['status'], exchange['headers']
+            body = base64.b64decode(exchange['body'])
+
+        # the recorded headers include Date and Server already
+        self.send_response_only(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = do_PUT = do_DELETE = replay
+
+    def log_message(self, *args):
+        pass
+
+
+class ReplayServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, cassette, latency=0, jitter=0, seed=0):
+        http.server.ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0), ReplayHandler)
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.url = 'http://127.0.0.1:%d/' % self.server_port
+
+    def wait(self):
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='cassette')
+        thread.daemon = True
+        thread.start()
+
+
+def forget_memos():
+    for single_flight in list(web.single_flights):
+        single_flight.forget()
+
+
+@contextlib.contextmanager
+def use(path, latency=0, jitter=0, seed=0, record=None):
+    """Record web.py's requests into the cassette at path, or replay them
+    from it if it exists already (or record is False)."""
+    if record is None:
+        record = not os.path.exists(path)
+
+    cassette = Cassette(path)
+    server = None
+
+    if record:
+        adapter = RecordingAdapter(cassette)
+    else:
+        cassette.load()
+        server = ReplayServer(cassette, latency, jitter, seed)
+        server.start()
+        adapter = ReplayAdapter(server)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    original, web.session = web.session, session
+    cache, web.http_cache = web.http_cache, httpcache.HTTPCache()
+    forget_memos()
+
+    try:
+        yield cassette
+
+        # a run that failed part way may not have made all its requests
+        if server is None:
+            cassette.save()
+    finally:
+        web.session = original
+        web.http_cache = cache
+        forget_memos()
+        session.close()
+
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == '__main__':
+    print(__doc__.strip())
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+httpcache.py - Phenny HTTP Cache
+
+Caches successful GET responses (status, headers and body, not whole
+response objects) in a small in-memory LRU in front of a SQLite store, each
+tier with its own byte budget; the least recently used entries are evicted
+first. Entries stay fresh for as long as their Cache-Control or Expires
+headers say, and are then revalidated with If-None-Match/If-Modified-Since
+when the server gave an ETag or Last-Modified. If the server can't be
+reached, a stale entry is used rather than nothing.
+"""
+
+import base64
+import binascii
+import collections
+import email.utils
+import json
+import logging
+import os
+import threading
+from time import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import tools
+
+logger = logging.getLogger('phenny')
+
+# freshness for responses that say nothing about it, and the cap on the
+# Last-Modified heuristic (a tenth of the time since the last change)
+default_ttl = 24 * 60 * 60
+
+disk_bytes = 64 * 1024 * 1024
+memory_bytes = 8 * 1024 * 1024
+
+
+def parse_cache_control(value):
+    directives = {}
+    for directive in value.split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"')
+    return directives
+
+
+def expiry(headers, now):
+    """When a response with these headers goes stale, or None if it mustn't
+    be stored at all."""
+    directives = parse_cache_control(headers.get('Cache-Control', ''))
+
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return now
+
+    if 'max-age' in directives:
+        try:
+            return now + int(directives['max-age'])
+        except ValueError:
+            return now
+
+    if 'Expires' in headers:
+        try:
+            return email.utils.parsedate_to_datetime(headers['Expires']).timestamp()
+        except (TypeError, ValueError):
+            return now
+
+    if 'Last-Modified' in headers:
+        try:
+            modified = email.utils.parsedate_to_datetime(headers['Last-Modified']).timestamp()
+            return now + min(max(0, now - modified) / 10, default_ttl)
+        except (TypeError, ValueError):
+            pass
+
+    return now + default_ttl
+
+
+# headers a 304 Not Modified can update on the stored response, lowercased
+revalidation_headers = ('cache-control', 'date', 'etag', 'expires', 'last-modified')
+
+
+class Entry(object):
+    __slots__ = ('url', 'status', 'headers', 'body', 'expires', 'size')
+
+    def __init__(self, url, status, headers, body, expires):
+        self.url = url
+        self.status = status
+        # servers differ in how they spell header names
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.expires = expires
+        self.size = len(body) + sum(len(k) + len(v) for k, v in headers.items())
+
+    @classmethod
+    def from_response(cls, url, response, expires):
+        return cls(url, response.status_code, response.headers, response.content, expires)
+
+    def validators(self):
+        headers = {}
+        if 'ETag' in self.headers:
+            headers['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def response(self):
+        response = requests.Response()
+        response.url = self.url
+        response.status_code = self.status
+        response.headers = self.headers.copy()
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.body
+        return response
+
+
+class HTTPCache(object):
+    def __init__(self, path=None, disk_bytes=disk_bytes, memory_bytes=memory_bytes):
+        # path is a callable, so the store is only created on first use
+        self.path = path
+        self.location = None
+        self.disk_bytes = disk_bytes
+        self.memory_bytes = memory_bytes
+
+        self.memory = collections.OrderedDict()
+        self.memory_size = 0
+        # url -> time of memory hits not yet written to the store's used
+        # column; they go out with the next store()
+        self.touched = {}
+        self.disk_size = None
+        self.lock = threading.RLock()
+
+        self.stats = dict.fromkeys(('hits', 'disk_hits', 'revalidated', 'misses',
+                                    'stale', 'evictions'), 0)
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+    def database(self):
+        """Path of the SQLite store, or None if there isn't one."""
+        if self.path is None or tools.debug:
+            return None
+
+        if self.disk_size is None:
+            self.location = self.path()
+            remove_legacy_cache(os.path.dirname(self.location))
+
+            with tools.DatabaseCursor(self.location) as cursor:
+                cursor.execute('''create table if not exists responses (
+                    url     text primary key,
+                    status  int,
+                    headers text,
+                    body    blob,
+                    size    int,
+                    expires real,
+                    used    real
+                );''')
+                cursor.execute('select coalesce(sum(size), 0) from responses')
+                self.disk_size = cursor.fetchone()[0]
+
+        return self.location
+
+    def remember(self, entry):
+        with self.lock:
+            old = self.memory.pop(entry.url, None)
+            if old:
+                self.memory_size -= old.size
+
+            if entry.size > self.memory_bytes:
+                return
+
+            self.memory[entry.url] = entry
+            self.memory_size += entry.size
+
+            while self.memory_size > self.memory_bytes:
+                url, old = self.memory.popitem(last=False)
+                self.memory_size -= old.size
+
+    def lookup(self, url):
+        with self.lock:
+            entry = self.memory.get(url)
+            if entry:
+                self.memory.move_to_end(url)
+                if self.location is not None:
+                    self.touched[url] = time()
+                return entry
+
+            path = self.database()
+            if path is None:
+                return None
+
+            with tools.DatabaseCursor(path) as cursor:
+                cursor.execute('select status, headers, body, expires from responses where url = ?', (url,))
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+
+                # memory hits are only written with the next store()
+                cursor.execute('update responses set used = ? where url = ?', (time(), url))
+
+            self.stats['disk_hits'] += 1
+            status, headers, body, expires = row
+            entry = Entry(url, status, json.loads(headers), body, expires)
+            self.remember(entry)
+            return entry
+
+    def store(self, entry):
+        with self.lock:
+            self.remember(entry)
+
+            path = self.database()
+            if path is None:
+                return
+
+            with tools.DatabaseCursor(path) as cursor:
+                cursor.execute('begin')
+                cursor.execute('select size from responses where url = ?', (entry.url,))
+                row = cursor.fetchone()
+                cursor.execute('insert or replace into responses values (?, ?, ?, ?, ?, ?, ?)', (
+                    entry.url, entry.status, json.dumps(dict(entry.headers)), entry.body,
+                    entry.size, entry.expires, time()))
+                self.disk_size += entry.size - (row[0] if row else 0)
+
+                cursor.executemany('update responses set used = ? where url = ?',
+                                   [(used, url) for url, used in self.touched.items()])
+                self.touched.clear()
+
+                if self.disk_size > self.disk_bytes:
+                    cursor.execute('select url, size from responses order by used')
+                    for url, size in cursor.fetchall():
+                        if self.disk_size <= self.disk_bytes:
+                            break
+                        cursor.execute('delete from responses where url = ?', (url,))
+                        self.memory_size -= self.memory[url].size if url in self.memory else 0
+                        self.memory.pop(url, None)
+                        self.disk_size -= size
+                        self.stats['evictions'] += 1
+
+                cursor.execute('commit')
+
+    def invalidate(self, url):
+        with self.lock:
+            entry = self.memory.pop(url, None)
+            if entry:
+                self.memory_size -= entry.size
+            self.touched.pop(url, None)
+
+            path = self.database()
+            if path is None:
+                return
+
+            with tools.DatabaseCursor(path) as cursor:
+                cursor.execute('select size from responses where url = ?', (url,))
+                row = cursor.fetchone()
+                if row:
+                    cursor.execute('delete from responses where url = ?', (url,))
+                    self.disk_size -= row[0]
+
+    def get(self, url, fetch):
+        """The response for url, from the cache if it's fresh. fetch(headers)
+        makes the request, with headers to send for revalidation."""
+        now = time()
+        entry = self.lookup(url)
+
+        if entry and entry.expires > now:
+            self.count('hits')
+            return entry.response()
+
+        try:
+            response = fetch(entry.validators() if entry else {})
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if entry is None:
+                raise
+            logger.warning('Using stale cached copy of %s' % url)
+            self.count('stale')
+            return entry.response()
+
+        if entry and response.status_code == 304:
+            self.count('revalidated')
+            headers = entry.headers.copy()
+            headers.update((k, v) for k, v in response.headers.items()
+                           if k.lower() in revalidation_headers)
+            entry = Entry(url, entry.status, headers, entry.body, expiry(headers, now) or now)
+            self.store(entry)
+            return entry.response()
+
+        if entry and response.status_code >= 500:
+            logger.warning('Using stale cached copy of %s' % url)
+            self.count('stale')
+            return entry.response()
+
+        response.raise_for_status()
+        self.count('misses')
+
+        expires = expiry(response.headers, now)
+        if response.status_code == 200 and expires is not None:
+            self.store(Entry.from_response(url, response, expires))
+        elif entry:
+            self.invalidate(url)
+
+        return response
+
+
+def is_legacy_cache(name):
+    # older versions named each pickle after its URL, urlsafe base64 encoded,
+    # and left name.*.tmp behind if interrupted while writing one
+    if name.endswith('.tmp'):
+        name = name.split('.')[0]
+
+    try:
+        url = base64.urlsafe_b64decode(name.encode('ascii')).decode('utf-8')
+    except (binascii.Error, UnicodeError, ValueError):
+        return False
+
+    return url.startswith(('http://', 'https://'))
+
+
+def remove_legacy_cache(directory):
+    """Delete the whole-response pickles left by older versions."""
+    if not os.path.isdir(directory):
+        return
+
+    for name in os.listdir(directory):
+        if is_legacy_cache(name):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+if __name__ == '__main__':
+    print(__doc__.strip())
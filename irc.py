@@ -7,8 +7,8 @@ Licensed under the Eiffel Forum License 2.
 http://inamidst.com/phenny/
 """
 
-import asynchat
-import asyncore
+import asyncio
+import collections
 import functools
 import logging
 import proto
@@ -24,28 +24,232 @@ from tools import break_up, decorate, max_message_length
 logger = logging.getLogger('phenny')
 
 
-class Origin(object): 
-    source = re.compile(r'([^!]*)!?([^@]*)@?(.*)')
+def decode(line):
+    try:
+        return str(line, 'utf-8')
+    except UnicodeDecodeError:
+        return str(line, 'iso-8859-1')
+
+tag_escapes = {':': ';', 's': ' ', '\\': '\\', 'r': '\r', 'n': '\n'}
+r_tag_escape = re.compile(r'\\(.?)')
+
+def unescape_tag(value):
+    if '\\' not in value:
+        return value
+    return r_tag_escape.sub(lambda m: tag_escapes.get(m.group(1), m.group(1)), value)
+
+def parse_tags(raw):
+    tags = {}
+    for tag in raw.split(';'):
+        if tag:
+            key, _, value = tag.partition('=')
+            tags[key] = unescape_tag(value)
+    return tags
+
+
+class Message(object):
+    """One line from the server, split into its IRCv3 tags, source prefix,
+    command and arguments. text is the trailing argument, or ''."""
+
+    __slots__ = ('tags', 'source', 'command', 'args', 'text')
+
+    def __init__(self, tags, source, args, text):
+        self.tags = tags
+        self.source = source
+        self.command = args[0] if args else None
+        self.args = args
+        self.text = text
+
+    @classmethod
+    def parse(cls, line):
+        """Parse one line, as bytes or str, without its LF."""
+        if not isinstance(line, str):
+            line = decode(line)
+
+        if line.endswith('\r'):
+            line = line[:-1]
+
+        tags = {}
+        if line.startswith('@'):
+            raw, line = line[1:].split(' ', 1)
+            tags = parse_tags(raw)
+
+        if line.startswith(':'):
+            source, line = line[1:].split(' ', 1)
+        else:
+            source = None
+
+        if ' :' in line:
+            middle, trailing = line.split(' :', 1)
+            args = tuple(middle.split()) + (trailing,)
+            text = trailing
+        else:
+            args = tuple(line.split())
+            text = ''
 
-    def __init__(self, bot, source, args): 
-        if not source:
-            source = ""
-        match = Origin.source.match(source)
-        self.nick, self.user, self.host = match.groups()
+        return cls(tags, source, args, text)
 
+
+class Origin(object): 
+    __slots__ = ('nick', 'user', 'host', 'sender', 'tags')
+
+    def __init__(self, bot, source, args, tags=None): 
         if len(args) > 1: 
             target = args[1]
         else: target = None
 
-        mappings = {bot.nick: self.nick, None: None}
-        self.sender = mappings.get(target, target)
+        self.fill(bot.nick, source, target, tags)
+
+    def fill(self, own_nick, source, target, tags):
+        self.nick, _, rest = (source or '').partition('!')
+        self.user, _, self.host = rest.partition('@')
+        self.tags = tags or {}
 
+        # replies to private messages go back to whoever sent them
+        if target == own_nick:
+            self.sender = self.nick
+        else:
+            self.sender = target
+
+    @classmethod
+    def of(cls, bot, source, args, tags=None):
+        """Origin(bot, source, args, tags), except that lines without tags
+        share one Origin per source, target and nick of ours, since most lines
+        come from a few sources to a few targets. Shared Origins mustn't be
+        changed."""
+        if tags:
+            return cls(bot, source, args, tags)
+
+        return shared_origin(bot.nick, source, args[1] if len(args) > 1 else None)
+
+
+@functools.lru_cache(maxsize=1024)
+def shared_origin(own_nick, source, target):
+    origin = Origin.__new__(Origin)
+    origin.fill(own_nick, source, target, None)
+    return origin
+
+
+class Sender(object):
+    """Sends queued messages in a thread of its own, so that flood control
+    never blocks whoever called msg().
+
+    Each recipient has its own queue and recipients take turns, so a long
+    .more dump to one channel doesn't hold up replies in another. Pacing is
+    a token bucket measured in seconds of airtime: a message costs 0.8s plus
+    a penalty for every character past 50, and the bucket refills at one
+    second per second. It holds one second's worth by default, so after an
+    idle spell one message goes out at once and the rest are spaced like
+    before; a bigger burst lets that many seconds' worth go out back to
+    back."""
+
+    def __init__(self, bot, rate=1.0, burst=1.0):
+        self.bot = bot
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+        self.queues = collections.OrderedDict()
+        self.pending = 0
+        self.ready = threading.Condition(threading.Lock())
+        self.thread = None
+        self.stopped = False
+
+    @staticmethod
+    def cost(text):
+        return 0.8 + float(max(0, len(text) - 50)) / 70
+
+    def start(self):
+        with self.ready:
+            if self.thread is None and not self.stopped:
+                self.thread = threading.Thread(target=self.run, name='sender')
+                self.thread.daemon = True
+                self.thread.start()
+
+    def put(self, recipient, text):
+        with self.ready:
+            if self.stopped:
+                return
 
-class Bot(asynchat.async_chat): 
+            self.queues.setdefault(recipient, collections.deque()).append(text)
+            self.pending += 1
+            self.ready.notify_all()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self, block=True):
+        """Wait until the next recipient's message can be afforded and
+        return (recipient, text), or None once stopped."""
+        with self.ready:
+            while not self.stopped:
+                if not self.queues:
+                    if not block:
+                        return None
+                    self.ready.wait()
+                    continue
+
+                recipient, queue = next(iter(self.queues.items()))
+                cost = min(self.cost(queue[0]), self.burst)
+                self.refill()
+
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    text = queue.popleft()
+
+                    # round robin: this recipient goes to the back of the line
+                    del self.queues[recipient]
+                    if queue:
+                        self.queues[recipient] = queue
+
+                    return recipient, text
+
+                if not block:
+                    return None
+                self.ready.wait((cost - self.tokens) / self.rate)
+
+    def run(self):
+        while True:
+            message = self.take()
+            if message is None:
+                return
+
+            try:
+                self.bot.send(*message)
+            except Exception:
+                logger.exception('Error sending message')
+
+            with self.ready:
+                self.pending -= 1
+                self.ready.notify_all()
+
+    def join(self, timeout=None):
+        """Wait until everything queued so far has been sent."""
+        deadline = time.monotonic() + (timeout or 0)
+        with self.ready:
+            while self.pending and not self.stopped:
+                remaining = deadline - time.monotonic()
+                if timeout is not None and remaining <= 0:
+                    return False
+                self.ready.wait(remaining if timeout is not None else None)
+        return True
+
+    def stop(self):
+        with self.ready:
+            self.stopped = True
+            self.queues.clear()
+            self.pending = 0
+            self.ready.notify_all()
+
+
+class Bot(object): 
     def __init__(self, nick, name, channels, password=None): 
-        asynchat.async_chat.__init__(self)
-        self.set_terminator(b'\n')
-        self.buffer = b''
+        self.buffer = bytearray()
+        self.loop = None
+        self.writer = None
 
         self.nick = nick
         self.user = nick
@@ -59,15 +263,26 @@ class Bot(asynchat.async_chat):
         self.stack = []
 
         self.sending = threading.RLock()
+        self.sender = Sender(self)
 
         proto_func = lambda attr: functools.partial(proto.commands[attr], self)
         proto_map = {attr: proto_func(attr) for attr in proto.commands}
         self.proto = decorate(object(), proto_map)
 
-    def initiate_send(self):
-        self.sending.acquire()
-        asynchat.async_chat.initiate_send(self)
-        self.sending.release()
+    def push(self, data):
+        # May be called from any handler thread; the writer belongs to the loop
+        if self.writer is None:
+            return
+
+        try:
+            self.loop.call_soon_threadsafe(self.writer.write, data)
+        except RuntimeError:
+            # the event loop went away along with the connection
+            pass
+
+    def spawn(self, coroutine):
+        """Schedule a coroutine on the bot's event loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
 
     def __write(self, args, text=None):
         line = b' '.join(args)
@@ -101,14 +316,18 @@ class Bot(asynchat.async_chat):
             ssl_context=None):
         if ssl_context is None:
             ssl_context = self.get_ssl_context(ca_certs)
-        self.initiate_connect(host, port, ssl, ipv6, ssl_context)
+
+        try:
+            asyncio.run(self.initiate_connect(host, port, ssl, ipv6, ssl_context))
+        except KeyboardInterrupt: 
+            sys.exit()
 
     def get_ssl_context(self, ca_certs):
         return ssl.create_default_context(
             purpose=ssl.Purpose.SERVER_AUTH,
             cafile=ca_certs)
 
-    def initiate_connect(self, host, port, use_ssl, ipv6, ssl_context):
+    async def initiate_connect(self, host, port, use_ssl, ipv6, ssl_context):
         logger.info('Connecting to %s:%s...' % (host, port))
 
         if ipv6 and socket.has_ipv6:
@@ -116,22 +335,59 @@ class Bot(asynchat.async_chat):
         else:
              af = socket.AF_INET
 
-        self.create_socket(af, socket.SOCK_STREAM, use_ssl, host, ssl_context)
-        self.connect((host, port))
+        if use_ssl:
+            kwargs = {'ssl': ssl_context, 'server_hostname': host}
+        else:
+            kwargs = {}
 
-        try: asyncore.loop()
-        except KeyboardInterrupt: 
-            sys.exit()
+        self.loop = asyncio.get_running_loop()
+        reader, self.writer = await asyncio.open_connection(
+            host, port, family=af, **kwargs)
 
-    def create_socket(self, family, type, use_ssl=False, hostname=None,
-                      ssl_context=None):
-        self.family_and_type = family, type
-        sock = socket.socket(family, type)
-        if use_ssl:
-            sock = ssl_context.wrap_socket(sock, server_hostname=hostname)
-        # FIXME: this doesn't work with SSL enabled
-        #sock.setblocking(False)
-        self.set_socket(sock)
+        self.handle_connect()
+
+        try:
+            while True:
+                data = await reader.read(4096)
+                if not data:
+                    break
+                self.handle_read(data)
+        finally:
+            self.handle_close()
+            try:
+                await self.writer.wait_closed()
+            except OSError:
+                pass
+
+    def handle_read(self, data):
+        # Every complete line in the buffer is decoded in one go and the
+        # buffer trimmed once per read, instead of copying it once per line
+        buffer = self.buffer
+        start = len(buffer)
+        buffer += data
+
+        end = buffer.rfind(b'\n', start)
+        if end == -1:
+            return
+
+        with memoryview(buffer)[:end] as view:
+            try:
+                lines = str(view, 'utf-8').split('\n')
+            except UnicodeDecodeError:
+                lines = [decode(line) for line in bytes(view).split(b'\n')]
+        del buffer[:end + 1]
+
+        for line in lines:
+            self.handle_line(line)
+
+    def close(self):
+        if self.writer is None or self.writer.is_closing():
+            return
+
+        try:
+            self.loop.call_soon_threadsafe(self.writer.close)
+        except RuntimeError:
+            pass
 
     def handle_connect(self): 
         logger.info('connected!')
@@ -151,6 +407,7 @@ class Bot(asynchat.async_chat):
         self.proto.user(self.user, '+iw', self.name)
 
     def handle_close(self): 
+        self.sender.stop()
         self.close()
         logger.info('Closed!')
 
@@ -158,36 +415,23 @@ class Bot(asynchat.async_chat):
         self.buffer += data
 
     def found_terminator(self): 
-        line = self.buffer
-        if line.endswith(b'\r'): 
-            line = line[:-1]
-        self.buffer = b''
+        line = bytes(self.buffer)
+        self.buffer = bytearray()
+        self.handle_line(line)
 
-        try:
-            line = line.decode('utf-8')
-        except UnicodeDecodeError:
-            line = line.decode('iso-8859-1')
-
-        if line.startswith(':'):
-            source, line = line[1:].split(' ', 1)
-        else:
-            source = None
+    def handle_line(self, line):
+        if not line:
+            return
 
-        if ' :' in line:
-            middle, trailing = line.split(' :', 1)
-            middle = middle.split()
-            args = tuple(middle + [trailing])
-            text = trailing
-        else:
-            middle, trailing = line.split(), None
-            args = tuple(middle)
-            text = ''
+        message = Message.parse(line)
+        if not message.args:
+            return
 
-        origin = Origin(self, source, args)
-        self.dispatch(origin, args, text)
+        origin = Origin.of(self, message.source, message.args, message.tags)
+        self.dispatch(origin, message.args, message.text)
 
-        if args[0] == 'PING':
-            self.proto.pong(args[-1])
+        if message.command == 'PING':
+            self.proto.pong(message.args[-1])
 
     def dispatch(self, origin, args, text):
         pass
@@ -196,8 +440,6 @@ class Bot(asynchat.async_chat):
         if target:
             text = target + ': ' + text
 
-        self.sending.acquire()
-
         # Cf. http://swhack.com/logs/2006-03-01#T19-43-25
         if isinstance(text, str):
             try: text = text.encode('utf-8')
@@ -214,34 +456,26 @@ class Bot(asynchat.async_chat):
         if len(text) > max_message_length:
             for message in break_up(text, max_count=3):
                 self.msg(recipient, message)
-
-            self.sending.release()
             return
 
-        # No messages within the last 3 seconds? Go ahead!
-        # Otherwise, wait so it's been at least 0.8 seconds + penalty
-        if self.stack: 
-            elapsed = time.time() - self.stack[-1][0]
-            if elapsed < 3: 
-                penalty = float(max(0, len(text) - 50)) / 70
-                wait = 0.8 + penalty
-                if elapsed < wait: 
-                    time.sleep(wait - elapsed)
+        # Flood control happens in the sender thread, don't wait for it here
+        self.sender.start()
+        self.sender.put(recipient, text)
+
+    def send(self, recipient, text):
+        """Write a PRIVMSG now; called by the sender when it's due."""
 
         # Loop detection
         messages = [m[1:3] for m in self.stack[-10:]]
         if messages.count((recipient, text)) >= 3:
             text = '...'
             if messages.count((recipient, text)) >= 3:
-                self.sending.release()
                 return
 
         self.proto.privmsg(recipient, text)
         self.stack.append((time.time(), recipient, text))
         self.stack = self.stack[-10:]
 
-        self.sending.release()
-
     def action(self, recipient, text):
         text = "\x01ACTION {0}\x01".format(text)
         return self.msg(recipient, text)
@@ -261,13 +495,16 @@ class Bot(asynchat.async_chat):
                 if line.startswith('File "/'):
                     path.append(line)
 
-                    if line.endswith("in call"):
+                    if line.endswith("in call") or line.endswith("in call_async"):
                         break
 
             if path[-1].endswith("in call"):
                 # drop 'call' and 'rephrase_errors'
                 path = path[:-2]
                 path = path[:max_path]
+            elif path[-1].endswith("in call_async"):
+                path = path[:-1]
+                path = path[:max_path]
             else:
                 path = [path[0] + " (unknown caller)"]
 
@@ -16,17 +16,33 @@ from tools import GrumbleError, read_db, write_db
 # nick\talias
 nick_aliases = [] #don't change this, use the '.alias add' command on the bot
 
+# nick -> its alias group, rebuilt whenever nick_aliases is replaced, grows
+# or shrinks, or is changed here
+alias_index = {}
+indexed = None
+indexed_length = 0
+
 # pending alias pair requests
 # reset each session
 nick_pairs = []
 
+def reindex():
+    global alias_index, indexed, indexed_length
+
+    index = {}
+    for alias_group in nick_aliases:
+        for nick in alias_group:
+            index.setdefault(nick, alias_group)
+
+    alias_index, indexed, indexed_length = index, nick_aliases, len(nick_aliases)
+
 def aliasGroupFor(nick1):
     # Returns a list containing all aliases for nick1 (including nick1)
     # If there are no recorded aliases, it returns a list only containing nick1
-    for alias_group in nick_aliases:
-        if nick1 in alias_group:
-            return alias_group
-    return [nick1]
+    if indexed is not nick_aliases or indexed_length != len(nick_aliases):
+        reindex()
+
+    return alias_index.get(nick1) or [nick1]
 
 def aliasPairMerge(phenny, nick1, nick2):
     # Merges the alias group that nick1 is in with the one nick2 is in
@@ -42,6 +58,7 @@ def aliasPairMerge(phenny, nick1, nick2):
     group1.extend(group2)
 
     nick_aliases.append(group1)
+    reindex()
 
     dumpAliases(phenny)
 
@@ -78,6 +95,7 @@ def c_alias(phenny, raw):
                 nick_aliases.remove(group)
                 group.remove(nick)
                 nick_aliases.append(group)
+                reindex()
                 dumpAliases(phenny)
             phenny.reply("You have removed %s from its alias group" % nick)
         else:
@@ -88,11 +106,15 @@ def c_alias(phenny, raw):
 c_alias.rule = r'\.alias(?:\s(\S+))?(?:\s(\S+))?'
 
 def loadAliases(self):
+    global nick_aliases
+
     try:
         nick_aliases = read_db(self, 'alias')
     except GrumbleError:
         nick_aliases = []
 
+    reindex()
+
 def dumpAliases(self):
     write_db(self, 'alias', nick_aliases)
 
@@ -5,21 +5,15 @@ apy.py - Apertium APy Module
 '''
 
 import re
-import urllib.request
-import urllib
+import urllib.parse
 import json
 import web
+from requests.exceptions import HTTPError
 from tools import GrumbleError
 from modules import more
 import operator
 from humanize import naturaldelta
 
-headers = [(
-    'User-Agent', 'Mozilla/5.0' +
-    '(X11; U; Linux i686)' +
-    'Gecko/20071127 Firefox/2.0.0.11'
-)]
-
 Apy_errorData = 'Sorry, Apertium APy did not return any data.'
 langRE = r'[a-z]{2,3}(?:_[A-Za-z]+)?'
 
@@ -39,8 +33,7 @@ def strict_check(pattern, string, function):
 
 
 def handle_error(error):
-    response = error.read()
-    err = json.loads(response.decode('utf-8'))
+    err = error.response.json()
     if 'explanation' in err:
         raise GrumbleError('Error {:d}: {:s}'.format(err['code'], err['explanation'])) from error
     raise GrumbleError('Error {:d}: {:s}'.format(err['code'], err['message'])) from error
@@ -51,25 +44,34 @@ def check_no_data(resp_data):
         raise GrumbleError(APy_errorData)
 
 
+# the same line is often translated several times at once (.t in a busy
+# channel, several people following someone), so share and memoize results
+translations = web.SingleFlight(memo=60)
+
+
 def translate(phenny, translate_me, input_lang, output_lang='en'):
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
+    return translations.do((apy_url(phenny), translate_me, input_lang, output_lang),
+                           fetch_translation, phenny, translate_me, input_lang, output_lang)
 
-    input_lang, output_lang = web.quote(input_lang), web.quote(output_lang)
-    translate_me = web.quote(translate_me)
 
+def apy_url(phenny):
     try:
-        apy_url = phenny.config.APy_url
+        return phenny.config.APy_url
     except:
-        apy_url = 'https://apertium.org/apy'
+        return 'https://apertium.org/apy'
+
+
+def fetch_translation(phenny, translate_me, input_lang, output_lang):
+    input_lang, output_lang = web.quote(input_lang), web.quote(output_lang)
+    translate_me = web.quote(translate_me)
 
     try:
-        response = opener.open('{:s}/translate?q={:s}&langpair={:s}|{:s}'.format(
-            apy_url, translate_me, input_lang, output_lang)).read()
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/translate?q={:s}&langpair={:s}|{:s}'.format(
+            apy_url(phenny), translate_me, input_lang, output_lang))
+    except HTTPError as error:
         handle_error(error)
 
-    responseArray = json.loads(response.decode('utf-8'))
+    responseArray = json.loads(response)
 
     if responseArray['responseData']['translatedText'] == []:
         raise GrumbleError(Apy_errorData)
@@ -126,15 +128,12 @@ apertium_web_translate.priority = 'high'
 
 def apertium_listlangs(phenny, input):
     '''Lists languages available for translation from/to.'''
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open(phenny.config.APy_url + '/listPairs').read()
-    except urllib.error.HTTPError as error:
+        response = web.get(phenny.config.APy_url + '/listPairs')
+    except HTTPError as error:
         handle_error(error)
 
-    langs = json.loads(response.decode('utf-8'))
+    langs = json.loads(response)
     check_no_data(langs)
 
     outlangs = []
@@ -156,15 +155,12 @@ def apertium_listpairs(phenny, input):
     '''Lists translation pairs available to apertium translation'''
     lang = input.group(1)
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open(phenny.config.APy_url + '/listPairs').read()
-    except urllib.error.HTTPError as error:
+        response = web.get(phenny.config.APy_url + '/listPairs')
+    except HTTPError as error:
         handle_error(error)
 
-    langs = json.loads(response.decode('utf-8'))
+    langs = json.loads(response)
     check_no_data(langs)
 
     if not lang:
@@ -195,16 +191,13 @@ def apertium_analyse(phenny, input):
         raise GrumbleError(cmd_error)
         return
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open('{:s}/analyse?lang={:s}&q={:s}'.format(
-            phenny.config.APy_analyseURL, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip()))).read()
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/analyse?lang={:s}&q={:s}'.format(
+            phenny.config.APy_analyseURL, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip())))
+    except HTTPError as error:
         handle_error(error)
 
-    jobj = json.loads(response.decode('utf-8'))
+    jobj = json.loads(response)
     messages = []
 
     for analysis, original in jobj:
@@ -226,16 +219,13 @@ def apertium_generate(phenny, input):
         raise GrumbleError(cmd_error)
         return
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open('{:s}/generate?lang={:s}&q={:s}'.format(
-            phenny.config.APy_analyseURL, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip()))).read()
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/generate?lang={:s}&q={:s}'.format(
+            phenny.config.APy_analyseURL, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip())))
+    except HTTPError as error:
         handle_error(error)
 
-    jobj = json.loads(response.decode('utf-8'))
+    jobj = json.loads(response)
     messages = []
 
     for generation, original in jobj:
@@ -258,14 +248,11 @@ def apertium_identlang(phenny, input):
         phenny.say(text_error)
         return
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open('{:s}/identifyLang?q={:s}'.format(
-            phenny.config.APy_url, web.quote(text.strip()))).read()
-        jsdata = json.loads(response.decode('utf-8'))
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/identifyLang?q={:s}'.format(
+            phenny.config.APy_url, web.quote(text.strip())))
+        jsdata = json.loads(response)
+    except HTTPError as error:
         handle_error(error)
 
     messages = []
@@ -283,15 +270,12 @@ apertium_identlang.priority = 'high'
 
 def apertium_stats(phenny, input):
     '''Fetch function and usage statistics from APy.'''
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open(phenny.config.APy_url + '/stats').read()
-    except urllib.error.HTTPError as error:
+        response = web.get(phenny.config.APy_url + '/stats')
+    except HTTPError as error:
         handle_error(error)
 
-    jdata = json.loads(response.decode('utf-8'))
+    jdata = json.loads(response)
     periodStats = jdata['responseData']['periodStats']
     runningPipes = jdata['responseData']['runningPipes']
     holdingPipes = jdata['responseData']['holdingPipes']
@@ -352,16 +336,13 @@ def apertium_calccoverage(phenny, input):
         raise GrumbleError(cmd_error)
         return
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open('{:s}/calcCoverage?lang={:s}&q={:s}'.format(
-            phenny.config.APy_url, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip()))).read()
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/calcCoverage?lang={:s}&q={:s}'.format(
+            phenny.config.APy_url, web.quote(cmd.group(1)), web.quote(cmd.group(2).strip())))
+    except HTTPError as error:
         handle_error(error)
 
-    jsdata = json.loads(response.decode('utf-8'))
+    jsdata = json.loads(response)
     phenny.say('Coverage is {:.1%}'.format(jsdata[0]))
 
 apertium_calccoverage.name = 'calccoverage'
@@ -384,16 +365,13 @@ def apertium_perword(phenny, input):
     if not set(funcs) <= valid_funcs:
         raise GrumbleError('The requested functions must be from the set {:s}.'.format(str(valid_funcs)))
 
-    opener = urllib.request.build_opener()
-    opener.addheaders = headers
-
     try:
-        response = opener.open('{:s}/perWord?lang={:s}&modes={:s}&q={:s}'.format(
-            phenny.config.APy_url, web.quote(cmd.group(1)), '+'.join(funcs), web.quote(cmd.group(3)))).read()
-    except urllib.error.HTTPError as error:
+        response = web.get('{:s}/perWord?lang={:s}&modes={:s}&q={:s}'.format(
+            phenny.config.APy_url, web.quote(cmd.group(1)), '+'.join(funcs), web.quote(cmd.group(3))))
+    except HTTPError as error:
         handle_error(error)
 
-    jsdata = json.loads(response.decode('utf-8'))
+    jsdata = json.loads(response)
     for word in jsdata:
         phenny.say(word['input'] + ':')
         for func in funcs:
@@ -14,12 +14,13 @@ import locale
 import socket
 import struct
 import datetime
-import web
+import snapshots
 import os
 import threading
 import logging
 import subprocess
 from decimal import Decimal as dec
+from lxml import html
 
 logger = logging.getLogger('phenny')
 
@@ -44,17 +45,48 @@ def find_index_regex(column, regex):
 
     return column.index(next(filter(current_regex.match, column)))
 
-def get_offsets(phenny, key):
-    offsets = []
-
-    if key in phenny.time_zone_abbreviations:
-        offsets.extend(phenny.time_zone_abbreviations[key])
-
-    for (name, offset) in phenny.tz_database_time_zones.items():
-        if len(name) >= len(key) and name[:len(key)] == key:
-            offsets.append((name, offset))
-
-    return offsets
+class TimeZones(object):
+    """Resolves a zone key to (name, offset) pairs: the abbreviations that
+    are exactly the key, then the tz database zones whose names start with
+    it, ignoring case. Zone names are kept in a trie whose nodes hold every
+    zone under them, so a lookup is a walk down len(key) nodes."""
+
+    def __init__(self, abbreviations, zones):
+        self.abbreviations = {}
+        for key, offsets in abbreviations.items():
+            self.abbreviations.setdefault(key.upper(), []).extend(offsets)
+
+        self.root = {}
+        for name, offset in zones.items():
+            node = self.root
+            node.setdefault(None, []).append((name, offset))
+            for c in name.upper():
+                node = node.setdefault(c, {})
+                node.setdefault(None, []).append((name, offset))
+
+    def find(self, key, limit=None):
+        """Up to limit matches for key, and how many there are in all."""
+        key = key.upper()
+        abbreviations = self.abbreviations.get(key, [])
+
+        node = self.root
+        for c in key:
+            node = node.get(c)
+            if node is None:
+                break
+        zones = node.get(None, []) if node is not None else []
+
+        total = len(abbreviations) + len(zones)
+        if limit is None:
+            limit = total
+
+        offsets = abbreviations[:limit]
+        if len(offsets) < limit:
+            offsets = offsets + zones[:limit - len(offsets)]
+        return offsets, total
+
+def get_offsets(phenny, key, limit=None):
+    return phenny.time_zones.find(key, limit)[0]
 
 def give_time(phenny, tz, input_nick, to_user=None):
     tz_complete = tz.upper()
@@ -106,12 +138,12 @@ def give_time(phenny, tz, input_nick, to_user=None):
     if len(tz) > 30: return
 
     TZ = tz.upper()
-    tz_offsets = get_offsets(phenny, TZ)
+    tz_offsets, total = phenny.time_zones.find(TZ, 3)
 
     if tz_offsets:
         msgs = []
 
-        for tz_offset in tz_offsets[:3]:
+        for tz_offset in tz_offsets:
             offset = tz_offset[1] * 3600 + math_add
             timenow = time.gmtime(time.time() + offset)
             msgs.append(tz_offset[0] + ': ' + time.strftime("%a, %d %b %Y %H:%M:%S", timenow))
@@ -119,8 +151,8 @@ def give_time(phenny, tz, input_nick, to_user=None):
         msg = '; '.join(msgs)
         phenny.reply(msg, target=to_user)
 
-        if len(tz_offsets) > 3:
-            msg = 'Found ' + str(len(tz_offsets)) + ' more matching timezones.'
+        if total > 3:
+            msg = 'Found ' + str(total) + ' more matching timezones.'
             phenny.reply(msg, target=to_user)
 
         return
@@ -182,7 +214,6 @@ def f_time3(phenny, input):
 f_time3.rule = r'(\S*)(:|,)\s\.(time)$'
 
 
-@web.with_scraped_page('https://en.wikipedia.org/wiki/List_of_time_zone_abbreviations')
 def scrape_wiki_time_zone_abbreviations(doc):
     data = {}
 
@@ -229,7 +260,6 @@ def scrape_wiki_time_zone_abbreviations(doc):
 
     return data
 
-@web.with_scraped_page('https://en.wikipedia.org/wiki/List_of_tz_database_time_zones')
 def scrape_wiki_tz_database_time_zones(doc):
     data = {}
 
@@ -267,9 +297,23 @@ def scrape_wiki_tz_database_time_zones(doc):
 
     return data
 
+def parse_wiki_zones(abbreviations, zones):
+    return (scrape_wiki_time_zone_abbreviations(html.document_fromstring(abbreviations)),
+            scrape_wiki_tz_database_time_zones(html.document_fromstring(zones)))
+
+time_zones = snapshots.Snapshot('time-zones', [
+    'https://en.wikipedia.org/wiki/List_of_time_zone_abbreviations',
+    'https://en.wikipedia.org/wiki/List_of_tz_database_time_zones',
+], parse_wiki_zones)
+
+def use_wiki_zones(phenny, data):
+    phenny.time_zone_abbreviations, phenny.tz_database_time_zones = data
+    # lookups only go through this, so swapping it is the refresh
+    phenny.time_zones = TimeZones(*data)
+
 def scrape_wiki_zones(phenny):
-    phenny.time_zone_abbreviations = scrape_wiki_time_zone_abbreviations()
-    phenny.tz_database_time_zones = scrape_wiki_tz_database_time_zones()
+    time_zones.refresh()
+    use_wiki_zones(phenny, time_zones.data)
 
 def refresh_database_tz(phenny, raw=None):
     if raw.admin or raw is None:
@@ -292,7 +336,8 @@ thread_check_tz.name = 'timezone_thread_check'
 thread_check_tz.commands = ['tzdb status']
 
 def setup(phenny):
-    scrape_wiki_zones(phenny)
+    time_zones.setup(phenny, use_wiki_zones)
+setup.background = True
 
 def npl(phenny, input):
     """Shows the time from NPL's SNTP server."""
@@ -324,8 +369,8 @@ def time_zone_convert(phenny, input_txt, to_user=None):
     if (not regex_match) or (regex_match.groups()[0] == "") or (regex_match.groups()[1] == "") or (regex_match.groups()[2] == ""):
         phenny.reply(tz.__doc__.strip())
     else:
-        from_tz_match = get_offsets(phenny, regex_match.groups()[1].upper())
-        to_tz_match = get_offsets(phenny, regex_match.groups()[2].upper())
+        from_tz_match = get_offsets(phenny, regex_match.groups()[1], 1)
+        to_tz_match = get_offsets(phenny, regex_match.groups()[2], 1)
 
         from_tz_match = from_tz_match[0][1] if from_tz_match else ""
         to_tz_match = to_tz_match[0][1] if to_tz_match else ""
@@ -7,8 +7,10 @@ Licensed under the Eiffel Forum License 2.
 http://inamidst.com/phenny/
 """
 
-import re, unicodedata
+import bisect, heapq, re, threading, unicodedata
+from array import array
 from itertools import islice
+from tools import GrumbleError, dot_path, read_obj, write_obj
 
 def about(u, cp=None, name=None): 
     if cp is None: 
@@ -23,25 +25,138 @@ def about(u, cp=None, name=None):
     else: template = 'U+%04X %s (\xe2\x97\x8c%s)'
     return template % (cp, name, u)
 
+r_word = re.compile('[A-Z0-9]+')
+
+class NameIndex(object):
+    """Every named codepoint's name in one newline-separated string, for
+    regexps, and the words in those names with the codepoints whose names
+    contain each one, for word lookups. Arrays and strings rather than
+    dicts and lists, so the whole thing is a few megabytes."""
+
+    def __init__(self):
+        codepoints, names, postings = array('I'), [], {}
+
+        for cp in range(1, 0x10FFFF):
+            name = unicodedata.name(chr(cp), None)
+            if name is None:
+                continue
+
+            codepoints.append(cp)
+            names.append(name)
+            for word in set(r_word.findall(name)):
+                postings.setdefault(word, []).append(cp)
+
+        self.codepoints = codepoints
+        self.names, self.name_starts = self.pack(names)
+
+        words = sorted(postings)
+        self.words, self.word_starts = self.pack(words)
+        self.postings, self.posting_starts = array('I'), array('I', [0])
+        for word in words:
+            self.postings.extend(postings[word])
+            self.posting_starts.append(len(self.postings))
+
+    @staticmethod
+    def pack(strings):
+        starts, offset = array('I', [0]), 0
+        for string in strings:
+            offset += len(string) + 1
+            starts.append(offset)
+        return '\n'.join(strings) + '\n', starts
+
+    def word(self, i):
+        return self.words[self.word_starts[i]:self.word_starts[i + 1] - 1]
+
+    def first_word(self, key):
+        lo, hi = 0, len(self.word_starts) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word(mid) < key:
+                lo = mid + 1
+            else: hi = mid
+        return lo
+
+    def starting_with(self, prefix):
+        """Codepoints with a word in their name that starts with prefix."""
+        first = self.first_word(prefix)
+        last = self.first_word(prefix + '\x7f')
+        return self.postings[self.posting_starts[first]:self.posting_starts[last]]
+
+    def candidates(self, arg):
+        """Codepoints whose names could match codepoint_simple's regexp for
+        arg: each of its words has to start a word in the name."""
+        found = None
+        for word in arg.split(' '):
+            if not word:
+                continue
+            if not r_word.fullmatch(word):
+                # regexp syntax can make any word optional (X?, A|B)
+                return self.codepoints
+
+            matches = self.starting_with(word)
+            if found is None:
+                found = set(matches)
+            else: found.intersection_update(matches)
+
+        if found is None:
+            return self.codepoints
+        return sorted(found)
+
+    def search(self, r_search):
+        """(codepoint, name) for every name r_search matches, in order."""
+        r_lines = re.compile(r_search.pattern, r_search.flags | re.MULTILINE)
+        pos = 0
+
+        while True:
+            match = r_lines.search(self.names, pos)
+            if match is None:
+                return
+
+            i = bisect.bisect_right(self.name_starts, match.start()) - 1
+            name = self.names[self.name_starts[i]:self.name_starts[i + 1] - 1]
+
+            # a match can run across lines; check it against the name alone
+            if r_search.search(name):
+                yield self.codepoints[i], name
+            pos = self.name_starts[i + 1]
+
+index = None
+index_lock = threading.Lock()
+
+def load_index():
+    global index
+
+    with index_lock:
+        if index is None:
+            # a few ms to load, against half a second to build
+            path = dot_path('codepoints-%s.index' % unicodedata.unidata_version)
+            try:
+                index = NameIndex.__new__(NameIndex)
+                index.__dict__.update(read_obj(path))
+            except (GrumbleError, TypeError, ValueError):
+                index = NameIndex()
+                write_obj(path, vars(index))
+
+    return index
+
 def codepoint_simple(arg): 
     arg = arg.upper()
+    candidates = [cp for cp in load_index().candidates(arg) if cp < 0xFFFF]
 
     r_label = re.compile('\\b' + arg.replace(' ', '.*\\b') + '\\b')
 
     results = []
-    for cp in range(0xFFFF): 
+    for cp in candidates: 
         u = chr(cp)
-        try: name = unicodedata.name(u)
-        except ValueError: continue
+        name = unicodedata.name(u)
 
         if r_label.search(name): 
             results.append((len(name), u, cp, name))
     if not results: 
         r_label = re.compile('\\b' + arg.replace(' ', '.*\\b'))
-        for cp in range(0xFFFF): 
+        for cp in candidates: 
             u = chr(cp)
-            try: name = unicodedata.name(u)
-            except ValueError: continue
+            name = unicodedata.name(u)
 
             if r_label.search(name): 
                 results.append((len(name), u, cp, name))
@@ -52,17 +167,35 @@ def codepoint_simple(arg):
     length, u, cp, name = sorted(results)[0]
     return about(u, cp, name)
 
+# patterns that can't be run over all the names at once: anchors and
+# lookarounds can see past the end of a name into the next
+r_anchored = re.compile(r'\\[AZ]|\(\?<|\(\?[=!]|\$')
+
+def unnamed(start=1):
+    named = load_index().codepoints
+    i = bisect.bisect_left(named, start)
+    for cp in range(start, 0x10FFFF):
+        if i < len(named) and named[i] == cp:
+            i += 1
+        else: yield cp, '-'
+
 def codepoint_extended(arg): 
     arg = arg.upper()
     try: r_search = re.compile(arg)
     except: raise ValueError('Broken regexp: %r' % arg)
 
-    for cp in range(1, 0x10FFFF): 
-        u = chr(cp)
-        name = unicodedata.name(u, '-')
+    if r_anchored.search(arg):
+        # these mean something else in one big string
+        named = ((cp, unicodedata.name(chr(cp))) for cp in load_index().codepoints
+                 if r_search.search(unicodedata.name(chr(cp))))
+    else: named = load_index().search(r_search)
+
+    # codepoints without names are matched as '-'
+    if r_search.search('-'): 
+        named = heapq.merge(named, unnamed())
 
-        if r_search.search(name): 
-            yield about(u, cp, name)
+    for cp, name in named: 
+        yield about(chr(cp), cp, name)
 
 def u(phenny, input): 
     """Look up unicode information."""
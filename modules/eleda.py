@@ -131,12 +131,11 @@ def checkMessages(phenny, input):
         # this user is being followed, translate them
 
         try:
-            translation = translations[(i.nick, i.dir)]
-        except:
-            direction = '-'.join(i.dir)
+            translation = translations[i.dir]
+        except KeyError:
             translation = apy.translate(phenny, text, i.dir[0], i.dir[1])
             translation = translation.replace('*', '')
-            translations[(i.nick, i.dir)] = translation
+            translations[i.dir] = translation
 
         # don't send translation if the input is the same as the output
         if translation == text:
@@ -6,6 +6,7 @@ author: mattr555
 
 from lxml import html
 from string import ascii_lowercase
+import snapshots
 import web
 import logging
 
@@ -19,27 +20,29 @@ def shorten_num(n):
     elif n < 1000000000:
         return '{}M'.format(str(round(n/1000000, 1)).rstrip('0').rstrip('.'))
 
-def scrape_ethnologue_codes(phenny):
+def scrape_ethnologue_code(page):
     data = {}
+    for e in html.document_fromstring(page).find_class('views-field-field-iso-639-3'):
+        code = e.find('div/a').text
+        name = e.find('div/a').attrib['title']
+        data[code] = name
+    return data
 
-    def scrape_ethnologue_code(doc):
-        for e in doc.find_class('views-field-field-iso-639-3'):
-            code = e.find('div/a').text
-            name = e.find('div/a').attrib['title']
-            data[code] = name
+def scrape_ethnologue_codes(phenny):
+    data = {}
 
     base_url = 'https://www.ethnologue.com/browse/codes/'
-    for letter in ascii_lowercase:
-        web.with_scraped_page(base_url + letter)(scrape_ethnologue_code)()
+    urls = [base_url + letter for letter in ascii_lowercase]
+    for url, codes in web.fetch_all(urls, scrape_ethnologue_code, cache=True):
+        data.update(codes)
     phenny.ethno_data = data
 
-def scrape_iso_codes(phenny):
+def parse_iso_codes(codes):
     # see https://iso639-3.sil.org/code_tables/download_tables
     # for more information
     iso = {}
     ethno = {}
     convert = {}
-    codes = web.get('https://iso639-3.sil.org/sites/iso639-3/files/downloads/iso-639-3.tab')
     for entry in codes.splitlines()[1:]:
         values = entry.split('\t')
         code3 = values[0]
@@ -58,9 +61,67 @@ def scrape_iso_codes(phenny):
             convert[code3] = code1
         iso[code3] = name
         ethno[code3] = name
-    phenny.ethno_data = ethno
-    phenny.iso_data = iso
-    phenny.iso_conversion_data = convert
+    return iso, ethno, convert
+
+iso_codes = snapshots.Snapshot('iso-639-3',
+    ['https://iso639-3.sil.org/sites/iso639-3/files/downloads/iso-639-3.tab'],
+    parse_iso_codes)
+
+# match against accented characters
+flatten_table = str.maketrans({c: k for k, v in {
+    'a': 'áäâ',
+    'e': 'éè',
+    'i': 'íî',
+    'o': 'óö',
+    'u': 'ùüú',
+    'n': 'ñ',
+    "'": '’'
+}.items() for c in v})
+
+def flatten(s):
+    return str(s).translate(flatten_table)
+
+class LanguageIndex(object):
+    """Language names by code, searchable by substring of the lowercased
+    (and, with fold, flattened) name. Every name is indexed by the three
+    letter sequences in it, so a search only checks the names that have
+    all of the query's."""
+
+    def __init__(self, names, fold=None):
+        self.entries = []
+        self.grams = {}
+
+        for code, name in names.items():
+            key = name.lower()
+            if fold is not None:
+                key = fold(key)
+
+            i = len(self.entries)
+            self.entries.append((code, name, key))
+            for j in range(len(key) - 2):
+                self.grams.setdefault(key[j:j + 3], set()).add(i)
+
+    def search(self, query):
+        """(code, name) for every name containing query, in data order."""
+        grams = set(query[j:j + 3] for j in range(len(query) - 2))
+
+        if grams:
+            postings = sorted((self.grams.get(gram, ()) for gram in grams), key=len)
+            found = set(postings[0]).intersection(*postings[1:])
+            candidates = (self.entries[i] for i in sorted(found))
+        else:
+            candidates = self.entries
+
+        return [(code, name) for code, name, key in candidates if query in key]
+
+def use_iso_codes(phenny, data):
+    phenny.iso_data, phenny.ethno_data, phenny.iso_conversion_data = data
+    phenny.iso_index = LanguageIndex(phenny.iso_data, fold=flatten)
+    phenny.ethno_index = LanguageIndex(phenny.ethno_data)
+
+def scrape_iso_codes(phenny):
+    iso_codes.refresh()
+    use_iso_codes(phenny, iso_codes.data)
 
 def write_ethnologue_codes(phenny, raw=None):
     if raw is None or raw.admin:
@@ -98,9 +159,7 @@ def ethnologue(phenny, input):
     elif len(raw) == 2 and raw in phenny.iso_conversion_data:
         iso.append(phenny.iso_conversion_data[raw])
     elif len(raw) > 3:
-        for code, lang in phenny.ethno_data.items():
-            if raw in lang.lower():
-                iso.append(code)
+        iso = [code for code, lang in phenny.ethno_index.search(raw)]
 
     if len(iso) == 1:
         url = "http://www.ethnologue.com/language/" + iso[0]
@@ -151,4 +210,5 @@ ethnologue.example = '.ethnologue khk'
 ethnologue.priority = 'low'
 
 def setup(phenny):
-    scrape_iso_codes(phenny)
+    iso_codes.setup(phenny, use_iso_codes)
+setup.background = True
@@ -2,7 +2,6 @@
 import math
 import os
 import sqlite3
-import time
 from threading import Lock, Thread
 from tools import DatabaseCursor, db_path
 
@@ -47,8 +46,15 @@ def greeting(phenny, input):
     if input.sender.casefold() not in phenny.config.greetings.keys():
         return
 
-    time.sleep(phenny.config.greet_delay)
+    # wait on the scheduler rather than holding a worker through the delay
+    phenny.scheduler.call_later(phenny.config.greet_delay, greet, (phenny, input),
+                                name='greeting', blocking=True)
 
+greeting.event = "JOIN"
+greeting.priority = 'low'
+greeting.rule = r'(.*)'
+
+def greet(phenny, input):
     if input.nick not in users:
         return
 
@@ -67,26 +73,19 @@ def greeting(phenny, input):
         except TypeError:
             pass
 
-    with DatabaseCursor(phenny.logger_db) as cursor:
-        cursor.execute("SELECT * FROM lines_by_nick WHERE nick = ?", (nick,))
-
-        if cursor.fetchone() is None:
-            if nick != phenny.config.nick.casefold():
-                if nick not in phenny.greeting_count:
-                    phenny.greeting_count[nick] = 0
+    if not phenny.logger_buffer.lookup(nick):
+        if nick != phenny.config.nick.casefold():
+            if nick not in phenny.greeting_count:
+                phenny.greeting_count[nick] = 0
 
-                    help_text = "You will need to register your nick with NickServ. Type /msg NickServ HELP for information on getting started with this."
-                    phenny.msg(input.nick, help_text)
-                    phenny.proto.notice(input.nick, help_text)
+                help_text = "You will need to register your nick with NickServ. Type /msg NickServ HELP for information on getting started with this."
+                phenny.msg(input.nick, help_text)
+                phenny.proto.notice(input.nick, help_text)
 
-                phenny.greeting_count[nick] += 1
+            phenny.greeting_count[nick] += 1
 
-                if math.log2(phenny.greeting_count[nick]) % 1 == 0:
-                    phenny.msg(input.nick, greetingmessage)
-
-greeting.event = "JOIN"
-greeting.priority = 'low'
-greeting.rule = r'(.*)'
+            if math.log2(phenny.greeting_count[nick]) % 1 == 0:
+                phenny.msg(input.nick, greetingmessage)
 
 def quitting(phenny, input):
     with lock: users.discard(input.nick)
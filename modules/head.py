@@ -8,12 +8,9 @@ http://inamidst.com/phenny/
 """
 
 import re
-import urllib.parse
 import time
-import requests
 from html.entities import name2codepoint
 import web
-from web import REQUEST_TIMEOUT
 
 from modules import apertium_wiki
 from modules import wikipedia
@@ -23,6 +20,9 @@ from modules import wiktionary
 # seconds until a URL title will be repeated if said multiple times
 TITLE_MAX_REPEAT_TIME = 300
 
+# bytes of a page read looking for its title
+TITLE_MAX_BYTES = 65536
+
 
 def setup(self):
     self.recent_titles = {}
@@ -166,52 +166,14 @@ def gettitle(phenny, input, uri):
             return
 
     try:
-        redirects = 0
-        while True:
-            try:
-                info = web.head(uri)
-
-                if not isinstance(info, list):
-                    status = '200'
-                else:
-                    status = str(info[1])
-                    info = info[0]
-            except web.HTTPError:
-                try:
-                    info = requests.get(uri, headers=web.default_headers, verify=True, timeout=REQUEST_TIMEOUT)
-                    status = str(info.status_code)
-                    info = info.headers
-                except web.HTTPError:
-                    return None
-
-            if status.startswith('3'):
-                uri = urllib.parse.urljoin(uri, info['Location'])
-            else:
-                break
-
-            redirects += 1
-            if redirects >= 25:
-                return None
-
-        try:
-            mtype = info['content-type']
-        except:
-            return None
-
-        if not mtype or not (('/html' in mtype) or ('/xhtml' in mtype)):
-            return None
-
-        try:
-            bytes = web.get(uri)
-        except:
-            return None
-        #bytes = u.read(262144)
-        #u.close()
-
+        info, text = web.peek(uri, TITLE_MAX_BYTES, until=b'</title', types=('/html', '/xhtml'))
     except:
         return
 
-    m = r_title.search(bytes)
+    if text is None:
+        return None
+
+    m = r_title.search(text)
     if m:
         title = m.group(1)
         title = title.strip()
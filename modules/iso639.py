@@ -17,28 +17,16 @@ logger = logging.getLogger('phenny')
 
 template = "{} = {}"
 
-def flatten(s):
-    #match against accented characters
-    my_copy = str(s)
-    flatten_mapping = {
-        'a': 'áäâ',
-        'e': 'éè',
-        'i': 'íî',
-        'o': 'óö',
-        'u': 'ùüú',
-        'n': 'ñ',
-        "'": '’'
-    }
-    for i in my_copy:
-        for k, v in flatten_mapping.items():
-            if i in v:
-                my_copy = my_copy.replace(i, k)
-
-    return my_copy
+flatten = ethnologue.flatten
 
 
 def iso639(phenny, input):
     """.iso639 <lg> | .iso639 <Language> - Search ISO 639-1, -2 and -3 for a language code."""
+    if not hasattr(phenny, 'iso_data'):
+        # ethnologue's setup hasn't loaded the codes yet
+        phenny.reply("Still loading, try again in a bit.")
+        return
+
     response = ""
     thisCode = str(input.group(1)).lower()
     if thisCode == "None":
@@ -47,22 +35,18 @@ def iso639(phenny, input):
         #random.choice(ISOcodes)
     else:
         if len(thisCode) > 3:      # so that we don't get e.g. 'a'
-            for oneCode, oneLang in phenny.iso_data.items():
-                if thisCode in flatten(oneLang.lower()):
-                    if response != "":
-                        response += ", " + template.format(oneCode, oneLang)
-                    else:
-                        response = template.format(oneCode, oneLang)
-                    #phenny.say("%s %s %s" % (oneCode, oneLang.lower(), thisCode.lower()))
+            for oneCode, oneLang in phenny.iso_index.search(thisCode):
+                if response != "":
+                    response += ", " + template.format(oneCode, oneLang)
+                else:
+                    response = template.format(oneCode, oneLang)
         elif thisCode in phenny.iso_data:
             altCode = None
             if len(thisCode) == 2 and thisCode in phenny.iso_conversion_data:
                 altCode = phenny.iso_conversion_data[thisCode]
             elif len(thisCode) == 3:
-                for iso1, iso3 in phenny.iso_conversion_data.items():
-                    if thisCode == iso3:
-                        altCode = iso1
-                        break
+                # the conversion map goes both ways
+                altCode = phenny.iso_conversion_data.get(thisCode)
             response = template.format(thisCode + (", " + altCode if altCode else ""), phenny.iso_data[thisCode])
 
     if response == "":
@@ -74,12 +58,15 @@ def scrape_wiki_codes():
     data = {}
 
     base_url = 'https://en.wikipedia.org/wiki/List_of_ISO_639'
-    scrape_wiki_codes_1(data)
-    scrape_wiki_codes_2(data)
+    scrapers = {
+        base_url + '-1_codes': scrape_wiki_codes_1,
+        base_url + '-2_codes': scrape_wiki_codes_2,
+    }
+    for url, doc in web.fetch_all(scrapers, html.document_fromstring, cache=True):
+        scrapers[url](doc, data)
 
     return data
 
-@web.with_scraped_page('https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes')
 def scrape_wiki_codes_1(doc, data):
     table = doc.find_class('wikitable')[0]
     for row in table.find('tbody').findall('tr')[1:]:
@@ -91,7 +78,6 @@ def scrape_wiki_codes_1(doc, data):
 
         data[code] = name
 
-@web.with_scraped_page('https://en.wikipedia.org/wiki/List_of_ISO_639-2_codes')
 def scrape_wiki_codes_2(doc, data):
     table = doc.find_class('wikitable')[0]
     for row in table.find('tbody').findall('tr')[1:]:
@@ -158,14 +144,17 @@ def thread_check(phenny, raw):
         phenny.say('No ISO code updating thread running')
 
 def setup(phenny):
-    # populate ethnologue codes
-    ethnologue.setup(phenny)
+    # populate ethnologue codes, unless the bot has the ethnologue module and
+    # its own setup does that (a second setup would refresh them twice)
+    if 'ethnologue' not in phenny.modules:
+        ethnologue.setup(phenny)
 
     # phenny.iso_data = scrape_wiki_codes()
     # phenny.iso_data.update(phenny.ethno_data)
 
     # Conversion hash
     # phenny.iso_conversion_data = scrape_wiki_codes_convert()
+setup.background = True
 
 
 iso639.name = 'iso639'
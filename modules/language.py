@@ -25,9 +25,7 @@ def lang(phenny, input):
     elif len(raw) == 2 and raw in phenny.iso_conversion_data:
         iso.append(phenny.iso_conversion_data[raw])
     elif len(raw) > 3:
-        for code, lang in phenny.ethno_data.items():
-            if raw in lang.lower():
-                iso.append(code)
+        iso = [code for code, lang in phenny.ethno_index.search(raw)]
 
     if len(iso) == 1:
         pop_query = '''
@@ -4,9 +4,11 @@ logger.py - logger for privacy-protecting IRC stats
 author: mutantmonkey <mutantmonkey@mutantmonkey.in>
 """
 
+import datetime
 import os
 import random
 import sqlite3
+import threading
 from tools import DatabaseCursor, db_path
 
 def setup(self):
@@ -28,30 +30,144 @@ def setup(self):
     cursor.close()
     connection.close()
 
+    self.logger_buffer = LineBuffer(self.logger_db, self.scheduler)
+
+def teardown(self):
+    self.logger_buffer.close()
+
+class LineBuffer(object):
+    """Per-(channel, nick) line counts waiting to be written to lines_by_nick.
+
+    Lines are counted in memory and written in one transaction every
+    flush_interval seconds or every flush_lines lines, whichever is first.
+    lookup() merges in the counts that haven't been written yet."""
+
+    upsert = '''insert into lines_by_nick
+        (channel, nick, lines, characters, last_time, quote)
+        values (:channel, :nick, :lines, :characters, :last_time, :quote)
+        on conflict (channel, nick) do update set
+            lines = lines + excluded.lines,
+            characters = characters + excluded.characters,
+            last_time = excluded.last_time,
+            quote = excluded.quote;'''
+
+    def __init__(self, path, scheduler, flush_lines=100, flush_interval=10):
+        self.path = path
+        self.scheduler = scheduler
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+
+        self.pending = {}
+        self.count = 0
+        # the scheduled flush, if there is one
+        self.job = None
+        self.lock = threading.Lock()
+        # held while writing, so readers never see lines in neither place
+        self.flushing = threading.Lock()
+
+    def add(self, channel, nick, characters, quote):
+        now = datetime.datetime.utcnow().replace(microsecond=0)
+
+        with self.lock:
+            row = self.pending.get((channel, nick))
+            if row is None:
+                row = {'channel': channel, 'nick': nick, 'lines': 0, 'characters': 0}
+                self.pending[(channel, nick)] = row
+
+            row['lines'] += 1
+            row['characters'] += characters
+            row['last_time'] = now
+            row['quote'] = quote
+            self.count += 1
+
+            full = self.count >= self.flush_lines
+            if not full:
+                self.schedule()
+
+        if full:
+            self.flush()
+
+    def schedule(self):
+        # called with self.lock held
+        if self.job is None:
+            self.job = self.scheduler.call_later(self.flush_interval, self.flush,
+                                                 name='logger', blocking=True)
+
+    def flush(self):
+        with self.flushing:
+            with self.lock:
+                rows = list(self.pending.values())
+                self.pending = {}
+                self.count = 0
+                if self.job is not None:
+                    self.job.cancel()
+                    self.job = None
+
+            if not rows:
+                return
+
+            params = [dict(row, last_time=row['last_time'].strftime('%Y-%m-%d %H:%M:%S'))
+                      for row in rows]
+
+            try:
+                with DatabaseCursor(self.path) as cursor:
+                    cursor.execute('begin')
+                    cursor.executemany(self.upsert, params)
+                    cursor.execute('commit')
+            except Exception:
+                self.restore(rows)
+                raise
+
+    def restore(self, rows):
+        """Put back rows that couldn't be written, under any lines counted
+        since, and try again later."""
+        with self.lock:
+            for row in rows:
+                newer = self.pending.get((row['channel'], row['nick']))
+                if newer is None:
+                    self.pending[(row['channel'], row['nick'])] = row
+                else:
+                    newer['lines'] += row['lines']
+                    newer['characters'] += row['characters']
+
+                self.count += row['lines']
+
+            self.schedule()
+
+    def lookup(self, nick):
+        """Rows (channel, nick, lines, characters, last_time, quote) for nick."""
+        with self.flushing:
+            with DatabaseCursor(self.path) as cursor:
+                cursor.execute('select channel, nick, lines, characters, last_time, quote '
+                               'from lines_by_nick where nick = ?', (nick,))
+                rows = {row[0]: list(row) for row in cursor.fetchall()}
+
+            with self.lock:
+                for (channel, pending_nick), pending in self.pending.items():
+                    if pending_nick != nick:
+                        continue
+
+                    row = rows.setdefault(channel, [channel, nick, 0, 0, None, None])
+                    row[2] += pending['lines']
+                    row[3] += pending['characters']
+                    row[4] = pending['last_time']
+                    row[5] = pending['quote']
+
+        return [tuple(row) for row in rows.values()]
+
+    def close(self):
+        self.flush()
+
 def logger(phenny, input):
-    sqlite_data = {
-        'channel': input.sender,
-        'nick': input.nick.casefold(),
-        'msg': input.group(1),
-        'chars': len(input.group(1)),
-    }
+    nick = input.nick.casefold()
+    msg = input.group(1)
+    chars = len(msg)
 
     # format action messages
-    if sqlite_data['msg'][:8] == '\x01ACTION ':
-        sqlite_data['msg'] = '* {0} {1}'.format(sqlite_data['nick'], sqlite_data['msg'][8:-1])
-
-    with DatabaseCursor(phenny.logger_db) as cursor:
-        cursor.execute('''insert or replace into lines_by_nick
-                    (channel, nick, lines, characters, last_time, quote)
-                    values(:channel, :nick,
-                        coalesce((select lines from lines_by_nick where
-                            channel=:channel and nick=:nick) + 1, 1),
-                        coalesce((select characters from lines_by_nick where
-                            channel=:channel and nick=:nick) + :chars, :chars),
-                        CURRENT_TIMESTAMP, :msg
-                    );''', sqlite_data)
-
-        cursor.execute('update lines_by_nick set quote=:msg where channel=:channel and nick=:nick', sqlite_data)
+    if msg[:8] == '\x01ACTION ':
+        msg = '* {0} {1}'.format(nick, msg[8:-1])
+
+    phenny.logger_buffer.add(input.sender, nick, chars, msg)
 logger.priority = 'low'
 logger.rule = r'(.*)'
 
@@ -4,7 +4,6 @@ mailing_list.py - mailing list reporter
 author: mattr555 <mattramina@gmail.com>
 """
 
-import threading
 import imaplib
 import email
 from email.header import decode_header, make_header
@@ -25,8 +24,8 @@ def setup(phenny):
         logger.info("Mailing list configuration not fully defined, aborting.")
         return
 
-    phenny.mailing_list_timer = threading.Timer(60*5, check_mail, (phenny,))
-    phenny.mailing_list_timer.start()
+    phenny.mailing_list_timer = phenny.scheduler.call_later(60*5, check_mail, (phenny,),
+                                                            name='mailing_list', blocking=True)
 
 def recipients(e):
     s = e.get('From', '') + e.get('To', '') + e.get('CC', '')
@@ -112,8 +111,8 @@ def check_mail(phenny):
         more.add_messages(phenny, channel, messages[channel])
 
     mail.logout()
-    phenny.mailing_list_timer = threading.Timer(60*5, check_mail, (phenny,))
-    phenny.mailing_list_timer.start()
+    phenny.mailing_list_timer = phenny.scheduler.call_later(60*5, check_mail, (phenny,),
+                                                            name='mailing_list', blocking=True)
     return found
 
 def last_message(phenny, ml):
@@ -4,24 +4,26 @@ more.py - Message Buffer Interface
 Author - mandarj
 """
 
-import sqlite3
+import threading
 from tools import break_up, calling_module, DatabaseCursor, db_path, max_message_length
 
 def setup(self):
     self.more_db = db_path(self, 'more')
-
-    connection = sqlite3.connect(self.more_db)
-    cursor = connection.cursor()
-
-    cursor.execute('''CREATE TABLE IF NOT EXISTS more (
-        id         INTEGER PRIMARY KEY AUTOINCREMENT,
-        target     VARCHAR(255),
-        message    VARCHAR({max_msg_len}),
-        tag        VARCHAR(255)
-    );'''.format(max_msg_len=max_message_length))
-
-    cursor.close()
-    connection.close()
+    # serialises writes, so more_pending always matches the table
+    self.more_lock = threading.Lock()
+
+    with DatabaseCursor(self.more_db) as cursor:
+        cursor.execute('''CREATE TABLE IF NOT EXISTS more (
+            id         INTEGER PRIMARY KEY AUTOINCREMENT,
+            target     VARCHAR(255),
+            message    VARCHAR({max_msg_len}),
+            tag        VARCHAR(255)
+        );'''.format(max_msg_len=max_message_length))
+        cursor.execute("CREATE INDEX IF NOT EXISTS more_target ON more (target, tag, id)")
+
+        # target -> number of queued messages, so most lookups skip the database
+        cursor.execute("SELECT target, COUNT(*) FROM more GROUP BY target")
+        self.more_pending = dict(cursor.fetchall())
 
 def add_messages(phenny, target, messages, tag=None):
     if not type(messages) is list:
@@ -46,9 +48,10 @@ def add_messages(phenny, target, messages, tag=None):
 
     target = target.casefold()
 
-    with DatabaseCursor(phenny.more_db) as cursor:
+    with phenny.more_lock, DatabaseCursor(phenny.more_db) as cursor:
         values = [(target, message, tag) for message in messages]
         cursor.executemany("INSERT INTO more (target, message, tag) VALUES (?, ?, ?)", values)
+        phenny.more_pending[target] = phenny.more_pending.get(target, 0) + len(messages)
 
 def joinAlert(phenny, input):
     if count_more(phenny, input.nick):
@@ -79,35 +82,54 @@ more.rule = r'[.]more(?: ([1-9][0-9]*))?(?: (\S+))?'
 
 def count_more(phenny, target, tag=None):
     target = target.casefold()
+    pending = phenny.more_pending.get(target, 0)
 
-    with DatabaseCursor(phenny.more_db) as cursor:
-        if tag:
-            cursor.execute("SELECT COUNT(*) FROM more WHERE target=? AND tag=?", (target, tag))
-        else:
-            cursor.execute("SELECT COUNT(*) FROM more WHERE target=?", (target,))
+    if not (pending and tag):
+        return pending
 
+    with DatabaseCursor(phenny.more_db) as cursor:
+        cursor.execute("SELECT COUNT(*) FROM more WHERE target=? AND tag=?", (target, tag))
         return cursor.fetchone()[0]
 
-def get_more(phenny, target, count, tag=None):
+def take_more(phenny, target, count, tag=None):
+    """Remove the first count messages for target and return them, with the
+    number left, all in one transaction."""
     target = target.casefold()
 
-    with DatabaseCursor(phenny.more_db) as cursor:
+    if tag:
+        where, args = "target=? AND tag=?", (target, tag)
+    else:
+        where, args = "target=?", (target,)
+
+    with phenny.more_lock, DatabaseCursor(phenny.more_db) as cursor:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("SELECT id, message FROM more WHERE " + where + " ORDER BY id ASC LIMIT ?",
+                       args + (count,))
+        rows = cursor.fetchall()
+
+        if rows:
+            # the rows taken are the ones up to the last id, so delete by range
+            cursor.execute("DELETE FROM more WHERE " + where + " AND id<=?", args + (rows[-1][0],))
+
+        pending = phenny.more_pending.get(target, 0) - len(rows)
+
         if tag:
-            cursor.execute("SELECT id, message, tag FROM more WHERE target=? AND tag=? ORDER BY id ASC LIMIT ?", (target, tag, count))
+            cursor.execute("SELECT COUNT(*) FROM more WHERE " + where, args)
+            remaining = cursor.fetchone()[0]
         else:
-            cursor.execute("SELECT id, message, tag FROM more WHERE target=? ORDER BY id ASC LIMIT ?", (target, count))
+            remaining = pending
 
-        rows = cursor.fetchall()
+        cursor.execute("COMMIT")
 
-        cursor.executemany("DELETE FROM more WHERE id=?", [(row[0],) for row in rows])
+        if pending > 0:
+            phenny.more_pending[target] = pending
+        else:
+            phenny.more_pending.pop(target, None)
 
-    return [row[1:3] for row in rows]
+    return [row[1] for row in rows], remaining
 
 def show_more(phenny, target, count, tag=None):
-    rows = get_more(phenny, target, count, tag)
-    remaining = count_more(phenny, target, tag)
-
-    messages = [row[0] for row in rows]
+    messages, remaining = take_more(phenny, target, count, tag)
 
     if len(messages) > 1:
         for message in messages:
@@ -129,9 +151,11 @@ def show_more(phenny, target, count, tag=None):
 
 def delete_all(phenny, target=None):
 
-    with DatabaseCursor(phenny.more_db) as cursor:
+    with phenny.more_lock, DatabaseCursor(phenny.more_db) as cursor:
         if target:
             target = target.casefold()
             cursor.execute("DELETE FROM more WHERE target=?", (target,))
+            phenny.more_pending.pop(target, None)
         else:
             cursor.execute("DELETE FROM more")
+            phenny.more_pending.clear()
@@ -8,7 +8,7 @@ import logging
 
 from modules import caseless_equal
 from modules import more
-from tools import GrumbleError, read_db, write_db
+from tools import Database, open_db
 
 logger = logging.getLogger('phenny')
 
@@ -27,12 +27,72 @@ commands = [
     '.queue <name> rename <new_name>'
 ]
 
+class Queues(Database):
+    """The queue database, keyed by 'owner:name'.
+
+    Queues are indexed by casefolded key, by casefolded owner and name, and
+    by casefolded name alone (in creation order), so finding one never
+    means looking through the rest."""
+
+    def __init__(self, path=None):
+        # casefolded key -> key
+        self.keys_folded = {}
+        # casefolded owner -> casefolded name -> key
+        self.owners = {}
+        # casefolded name -> keys, as an ordered dict
+        self.names = {}
+        Database.__init__(self, path)
+
+    @staticmethod
+    def split(key):
+        owner, _, name = key.partition(':')
+        return owner.casefold(), name.casefold()
+
+    def on_set(self, key):
+        owner, name = self.split(key)
+        self.keys_folded[key.casefold()] = key
+        self.owners.setdefault(owner, {})[name] = key
+        self.names.setdefault(name, {})[key] = None
+
+    def on_delete(self, key):
+        owner, name = self.split(key)
+
+        if self.keys_folded.get(key.casefold()) == key:
+            del self.keys_folded[key.casefold()]
+
+        owned = self.owners[owner]
+        if owned.get(name) == key:
+            del owned[name]
+        if not owned:
+            del self.owners[owner]
+
+        named = self.names[name]
+        named.pop(key, None)
+        if not named:
+            del self.names[name]
+
+    def resolve(self, queue_name, nick):
+        """The key queue_name refers to when nick uses it: a full key, one of
+        nick's own queues, or else the first queue with that name."""
+        key = self.keys_folded.get(queue_name.casefold())
+        if key is not None:
+            return key
+
+        key = self.owners.get(nick.casefold(), {}).get(queue_name.casefold())
+        if key is not None:
+            return key
+
+        for key in self.names.get(queue_name.casefold(), ()):
+            return key
+
+        return None
+
+    def named(self, queue_name):
+        """Keys of the queues called queue_name, whoever owns them."""
+        return list(self.names.get(queue_name.casefold(), ()))
+
 def setup(phenny):
-    try:
-        phenny.queue_data = read_db(phenny, 'queue')
-    except GrumbleError:
-        logger.debug('queue database read failed, initializing data')
-        phenny.queue_data = {}
+    phenny.queue_data = open_db(phenny, 'queue', Queues)
 
 def search_queue(queue, query):
     for i in range(len(queue)):
@@ -42,33 +102,30 @@ def search_queue(queue, query):
     return None
 
 def get_queue(queue_data, queue_name, nick):
-    lower_names = {k.casefold(): k for k in queue_data.keys()}
+    n = queue_data.resolve(queue_name, nick)
 
-    if queue_name.casefold() in lower_names:
-        n = lower_names[queue_name.casefold()]
-        return n, queue_data[n]
-    elif nick.casefold()  + ':' + queue_name.casefold() in lower_names:
-        n = lower_names[nick.casefold() + ':' + queue_name.casefold()]
-        return n, queue_data[n]
+    if n is None:
+        return None, None
 
-    for i in lower_names:
-        if caseless_equal(queue_name, i.split(':')[1]):
-            n = lower_names[i.casefold()]
-            return n, queue_data[n]
+    return n, queue_data[n]
 
-    return None, None
+def disambiguate_name(queue_data, queue_name, nick):
+    """Keys queue_name might mean: the one queue it names, the queues
+    called that, or failing those the keys containing it."""
+    key = queue_data.keys_folded.get(queue_name.casefold())
 
-def disambiguate_name(queue_data, queue_name):
-    matches = []
+    if key is not None:
+        return [key]
 
-    for i in queue_data:
-        if queue_name == i:
-            return i
+    named = queue_data.named(queue_name)
+    owned = [q for q in named if caseless_equal(q.split(':')[0], nick)]
 
-        if queue_name.casefold() in i.casefold():
-            matches.append(i)
+    if owned:
+        return owned
+    elif named:
+        return named
 
-    return matches
+    return [i for i in queue_data if queue_name.casefold() in i.casefold()]
 
 def print_queue(queue_name, queue):
     return '[{}] - {}'.format(queue_name,
@@ -99,6 +156,7 @@ def queue(phenny, input):
         return
 
     command = input.group(1).lower()
+    queue_name, queue = get_queue(phenny.queue_data, input.group(1), input.nick)
 
     if command == 'display':
         search = input.group(2)
@@ -111,7 +169,7 @@ def queue(phenny, input):
                 phenny.reply('There are no queues to display.')
             return
 
-        queue_names = disambiguate_name(phenny.queue_data, search)
+        queue_names = disambiguate_name(phenny.queue_data, search, input.nick)
 
         if not queue_names:
             phenny.reply('No queues found.')
@@ -122,22 +180,6 @@ def queue(phenny, input):
             queue_name = queue_names[0]
             queue = phenny.queue_data[queue_name]
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
-            return
-
-        for q in queue_names:
-            if caseless_equal(q.split(':')[0], input.nick) and caseless_equal(q[len(input.nick)+1:], search):
-                # current user owns queue with exact name
-                more.add_messages(phenny, input.sender, print_queue(q, phenny.queue_data[q]))
-                return
-            elif q[q.find(':')+1:] != search:
-                # filter queues with exact name
-                queue_names.remove(q)
-
-        if len(queue_names) == 1:
-            # only one user owns queue with exact name
-            queue_name = queue_names[0]
-            queue = phenny.queue_data[queue_name]
-            more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         else:
             # the name was ambiguous, show a list of queues
             phenny.reply('Did you mean: ' + ', '.join(queue_names) + '?')
@@ -150,7 +192,7 @@ def queue(phenny, input):
         queue_name = input.nick + ':' + input.group(2)
         owner = input.nick
 
-        if queue_name in phenny.queue_data:
+        if queue_name.casefold() in phenny.queue_data.keys_folded:
             phenny.reply('You already have a queue with that name! Pick a new name or delete the old one.')
             return
 
@@ -158,12 +200,12 @@ def queue(phenny, input):
             queue = input.group(3).split(',')
             queue = list(map(lambda x: x.strip(), queue))
             phenny.queue_data[queue_name] = {'owner': owner, 'queue': queue}
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             phenny.reply('Queue {} with items {} created.'.format(
                 queue_name, ', '.join(queue)))
         else:
             phenny.queue_data[queue_name] = {'owner': owner, 'queue': []}
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             phenny.reply('Empty queue {} created.'.format(queue_name))
 
     elif command in ['delete', 'remove', 'del', 'rm']:
@@ -182,13 +224,12 @@ def queue(phenny, input):
             return
 
         phenny.queue_data.pop(queue_name)
-        write_db(phenny, 'queue', phenny.queue_data)
+        phenny.queue_data.commit(queue_name)
         phenny.reply('Queue {} deleted.'.format(queue_name))
 
-    elif get_queue(phenny.queue_data, input.group(1), input.nick)[0]:
+    elif queue_name:
         # queue-specific commands
         command = input.group(2).lower()
-        queue_name, queue = get_queue(phenny.queue_data, input.group(1), input.nick)
 
         if not command:
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
@@ -210,7 +251,7 @@ def queue(phenny, input):
             new_queue = input.group(3).split(',')
             new_queue = list(map(lambda x: x.strip(), new_queue))
             queue['queue'] += new_queue
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         elif command == 'swap':
             if not input.group(3):
@@ -223,7 +264,7 @@ def queue(phenny, input):
                 return
 
             queue['queue'][id1], queue['queue'][id2] = queue['queue'][id2], queue['queue'][id1]
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         elif command in ['move', 'mv']:
             if not (input.group(3) and ',' in input.group(3)):
@@ -236,7 +277,7 @@ def queue(phenny, input):
                 return
 
             queue['queue'].insert(id2, queue['queue'].pop(id1))
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         elif command == 'replace':
             if not (input.group(3) and ',' in input.group(3)):
@@ -255,7 +296,7 @@ def queue(phenny, input):
                     return
 
             queue['queue'][old_id] = new.strip()
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         elif command in ['remove', 'delete', 'del', 'rm']:
             if not input.group(3):
@@ -266,18 +307,18 @@ def queue(phenny, input):
 
             if item in queue['queue']:
                 queue['queue'].remove(item)
-                write_db(phenny, 'queue', phenny.queue_data)
+                phenny.queue_data.commit(queue_name)
                 more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
             elif search_queue(queue['queue'], item):
                 queue['queue'].pop(search_queue(queue['queue'], item))
-                write_db(phenny, 'queue', phenny.queue_data)
+                phenny.queue_data.commit(queue_name)
                 more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
             else:
                 phenny.reply('{} not found in {}'.format(item, queue_name))
         elif command == 'pop':
             try:
                 queue['queue'].pop(0)
-                write_db(phenny, 'queue', phenny.queue_data)
+                phenny.queue_data.commit(queue_name)
                 more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
             except IndexError:
                 phenny.reply('That queue is already empty.')
@@ -286,21 +327,23 @@ def queue(phenny, input):
                 phenny.reply('Syntax: .queue <name> reassign <nick>')
                 return
 
+            old_name = queue_name
             phenny.queue_data.pop(queue_name)
             new_owner = input.group(3)
             queue_name = new_owner + queue_name[queue_name.index(':'):]
             phenny.queue_data[queue_name] = {'owner': new_owner, 'queue': queue['queue']}
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(old_name, queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
         elif command in ['rename', 'ren']:
             if not input.group(3):
                 phenny.reply('Syntax: .queue <name> rename <new_name>')
                 return
 
+            old_name = queue_name
             phenny.queue_data.pop(queue_name)
             queue_name = queue['owner'] + ':' + input.group(3)
             phenny.queue_data[queue_name] = queue
-            write_db(phenny, 'queue', phenny.queue_data)
+            phenny.queue_data.commit(old_name, queue_name)
             more.add_messages(phenny, input.sender, print_queue(queue_name, queue))
     else:
         if input.group(3):
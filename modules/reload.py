@@ -14,7 +14,7 @@ import time
 from bot import module_control
 
 def restart(phenny):
-    for module in phenny.modules:
+    for module in phenny.modules.values():
         module_control(phenny, module, 'teardown')
 
     os.execv('phenny', sys.argv)
@@ -8,43 +8,35 @@ http://inamidst.com/phenny/
 """
 
 import re
-import threading
 import time
 from modules import clock
-from tools import GrumbleError, read_db, write_db
+from tools import open_db
 
 def load_database(phenny):
-    try:
-        return read_db(phenny, 'reminders')
-    except GrumbleError:
-        return {}
+    return open_db(phenny, 'reminders')
 
-def dump_database(phenny):
-    write_db(phenny, 'reminders', phenny.remind_data)
+def dump_database(phenny, *keys):
+    phenny.remind_data.commit(*keys)
+
+def deliver(phenny, key):
+    for (channel, nick, message) in phenny.remind_data.pop(key, []):
+        if message: 
+            phenny.msg(channel, nick + ': ' + message)
+        else: phenny.msg(channel, nick + '!')
+
+    dump_database(phenny, key)
+
+def schedule(phenny, key, delay=0):
+    # keys are unix times; very old databases stored them as strings
+    when = max(int(key), time.time() + delay)
+    phenny.scheduler.schedule(when, deliver, (phenny, key), name='remind')
 
 def setup(phenny): 
     phenny.remind_data = load_database(phenny)
 
-    def monitor(phenny): 
-        time.sleep(5)
-        while True: 
-            now = int(time.time())
-            unixtimes = [int(key) for key in phenny.remind_data]
-            oldtimes = [t for t in unixtimes if t <= now]
-            if oldtimes: 
-                for oldtime in oldtimes: 
-                    for (channel, nick, message) in phenny.remind_data[oldtime]:
-                        if message: 
-                            phenny.msg(channel, nick + ': ' + message)
-                        else: phenny.msg(channel, nick + '!')
-                    del phenny.remind_data[oldtime]
-                dump_database(phenny)
-            time.sleep(2.5)
-
-    targs = (phenny,)
-    t = threading.Thread(target=monitor, args=targs)
-    t.daemon = True
-    t.start()
+    # give the bot a few seconds to connect before delivering overdue ones
+    for key in phenny.remind_data:
+        schedule(phenny, key, delay=5)
 
 scaling = {
     'years': 365.25 * 24 * 3600, 
@@ -108,9 +100,11 @@ def remind(phenny, input):
     reminder = (input.sender, input.nick, message)
 
     try: phenny.remind_data[t].append(reminder)
-    except KeyError: phenny.remind_data[t] = [reminder]
+    except KeyError:
+        phenny.remind_data[t] = [reminder]
+        schedule(phenny, t)
 
-    dump_database(phenny)
+    dump_database(phenny, t)
 
     if duration >= 60: 
         w = ''
@@ -146,7 +140,7 @@ def at(phenny, input):
     if z.startswith('+') or z.startswith('-'):
         tz = int(z)
 
-    tz = clock.get_offsets(phenny, z)
+    tz = clock.get_offsets(phenny, z, 1)
     if not tz:
         return phenny.reply("Sorry, didn't understand the time zone.")
     tz = tz[0][1]
@@ -165,10 +159,12 @@ def at(phenny, input):
     reminder = (input.sender, input.nick, message)
     # phenny.say(str((d, reminder)))
     try: phenny.remind_data[d].append(reminder)
-    except KeyError: phenny.remind_data[d] = [reminder]
+    except KeyError:
+        phenny.remind_data[d] = [reminder]
+        schedule(phenny, d)
 
     phenny.sending.acquire()
-    dump_database(phenny)
+    dump_database(phenny, d)
     phenny.sending.release()
 
     phenny.reply("Reminding at %s %s - in %s minute(s)" % (t, z, duration))
@@ -9,10 +9,9 @@ http://inamidst.com/phenny/
 
 import re
 import web
-import requests
 from tools import truncate
 from modules import more
-from web import catch_timeout, is_up, REQUEST_TIMEOUT
+from web import catch_timeout, is_up
 
 ddg_uri = 'https://api.duckduckgo.com/?format=json&pretty=1&q='
 suggest_uri = 'http://suggestqueries.google.com/complete/search?client=firefox&hl=en&q='
@@ -29,7 +28,7 @@ def topics(phenny, input):
         return phenny.reply('.topics about what?')
     query = input.group(1)
 
-    r = requests.get(ddg_uri + query, timeout=REQUEST_TIMEOUT).json()
+    r = web.request('GET', ddg_uri + query).json()
     topics = r['RelatedTopics']
     if len(topics) == 0:
         return phenny.say('Sorry, no topics found.')
@@ -53,7 +52,7 @@ def search(phenny, input):
     if not is_up('https://api.duckduckgo.com'):
         return phenny.say('Sorry, DuckDuckGo API is down.')
 
-    r = requests.get(ddg_uri + query, timeout=REQUEST_TIMEOUT).json()
+    r = web.request('GET', ddg_uri + query).json()
     try:
         answer = r['AbstractText']
         answer_url = r['AbstractURL']
@@ -74,7 +73,7 @@ def suggest(phenny, input):
     if not input.group(1):
         return phenny.reply("No query term.")
     query = input.group(1)
-    answer = requests.get(suggest_uri + query)
+    answer = web.request('GET', suggest_uri + query)
     suggestions = answer.json()[1][:10]
     phenny.reply(suggestions[0])
     phenny.reply('Check PM for more.')
@@ -9,7 +9,6 @@ http://inamidst.com/phenny/
 import datetime
 import logging
 import os
-import sqlite3
 import time
 
 logger = logging.getLogger('phenny')
@@ -43,20 +42,11 @@ class NotSeenError(BaseException):
 
 def seen(nick, phenny):
     '''seen(nick, phenny) returns dict of last seen for nick; 'ago' is a string describing how long ago; 'at' is datetime object in UTC; 'nick' is the nick; 'channel' is the last channel; raises NotSeenError when not seen.'''
-    logger_conn = sqlite3.connect(phenny.logger_db, detect_types=sqlite3.PARSE_DECLTYPES)
-
-    cNick = ""
-    cChannel = ""
-    c = logger_conn.cursor()
-    c.execute("select * from lines_by_nick where nick = ? order by datetime(last_time) desc limit 1", (nick,))
-    cl = c.fetchone()
-    try:
-        cNick = cl[1]
-        cChannel = cl[0]
-        cLastTime = cl[4]
-    except TypeError:
+    rows = phenny.logger_buffer.lookup(nick)
+    if not rows:
         raise NotSeenError()
-    c.close()
+
+    cChannel, cNick, lines, characters, cLastTime, quote = max(rows, key=lambda row: row[4])
 
     if cNick != "":
         dt = timesince(cLastTime)
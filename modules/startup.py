@@ -8,8 +8,6 @@ http://inamidst.com/phenny/
 """
 
 import logging
-import threading
-import time
 
 logger = logging.getLogger('phenny')
 
@@ -28,23 +26,22 @@ def setup(phenny):
             phenny.handle_close()
 
         def pingloop():
-            timer = threading.Timer(refresh_delay, close, ())
+            timer = phenny.scheduler.call_later(refresh_delay, close, name='startup')
             phenny.data['startup.setup.timer'] = timer
-            phenny.data['startup.setup.timer'].start()
             phenny.proto.ping(phenny.config.host)
         phenny.data['startup.setup.pingloop'] = pingloop
 
         def pong(phenny, input):
             try:
                 phenny.data['startup.setup.timer'].cancel()
-                time.sleep(refresh_delay + 60.0)
-                pingloop()
+                phenny.scheduler.call_later(refresh_delay + 60.0, pingloop, name='startup')
             except: pass
         pong.event = 'PONG'
-        pong.thread = True
+        pong.thread = False
         pong.rule = r'.*'
 
-        phenny.variables.setdefault('startup', {})['pong'] = pong
+        with phenny.setup_lock:
+            phenny.variables.setdefault('startup', {})['pong'] = pong
 
 def startup(phenny, input):
     import time
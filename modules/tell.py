@@ -10,20 +10,76 @@ http://inamidst.com/phenny/
 import datetime
 import random
 from collections import Counter
-from modules import caseless_list
-from tools import GrumbleError, read_db, write_db
+from tools import Database, open_db
 from modules import alias
 
 maximum = 4
 
+class Reminders(Database):
+    """The tell database, indexed by casefolded nick.
+
+    Keys ending in * are wildcards for every nick starting with the rest of
+    the key, and are kept in a trie of casefolded characters; any other key
+    is found with a single lookup in exact."""
+
+    def __init__(self, path=None):
+        # casefolded key -> keys
+        self.exact = {}
+        # char -> node, None -> keys ending at this node
+        self.wildcards = {}
+        Database.__init__(self, path)
+
+    @staticmethod
+    def is_wildcard(key):
+        return key.endswith('*')
+
+    def on_set(self, key):
+        if self.is_wildcard(key):
+            node = self.wildcards
+            for char in key.casefold().rstrip('*:'):
+                node = node.setdefault(char, {})
+            node.setdefault(None, set()).add(key)
+        else:
+            self.exact.setdefault(key.casefold(), set()).add(key)
+
+    def on_delete(self, key):
+        if self.is_wildcard(key):
+            node = self.wildcards
+            for char in key.casefold().rstrip('*:'):
+                node = node[char]
+            keys = node[None]
+        else:
+            keys = self.exact[key.casefold()]
+
+        keys.discard(key)
+
+    def exactly(self, nicks):
+        """Keys naming one of nicks, ignoring case."""
+        keys = set()
+        for nick in nicks:
+            keys.update(self.exact.get(nick.casefold(), ()))
+        return keys
+
+    def pending(self, nick, aliases):
+        """Keys with tells for nick: the keys naming it or one of its aliases,
+        and the wildcards matching it, in the order they're read out."""
+        keys = self.exactly(aliases)
+
+        node = self.wildcards
+        keys.update(node.get(None, ()))
+        for char in nick.casefold():
+            node = node.get(char)
+            if node is None:
+                break
+            keys.update(node.get(None, ()))
+
+        return sorted(keys, reverse=True)
+
 def loadReminders(self):
-    try:
-        self.reminders = read_db(self, 'tell')
-    except GrumbleError:
-        self.reminders = {}
+    self.reminders = open_db(self, 'tell', Reminders)
 
-def dumpReminders(self):
-    write_db(self, 'tell', self.reminders)
+def dumpReminders(self, *keys):
+    self.reminders.commit(*keys)
 
 def setup(self):
     loadReminders(self)
@@ -68,7 +124,7 @@ def f_remind(phenny, input, verb):
         phenny.reply(response)
     else: phenny.say("Hey, I'm not as stupid as Monty you know!")
 
-    dumpReminders(phenny)
+    dumpReminders(phenny, tellee_original)
 
 def f_tell(phenny, input):
     f_remind(phenny, input, 'tell')
@@ -106,17 +162,15 @@ def message(phenny, input):
     if not input.sender.startswith('#'): return
 
     tellee = input.nick
-    aliases = caseless_list(alias.aliasGroupFor(tellee))
     channel = input.sender
 
+    delivered = phenny.reminders.pending(tellee, alias.aliasGroupFor(tellee))
+    if not delivered:
+        return
+
     reminders = []
-    remkeys = list(reversed(sorted(phenny.reminders.keys())))
-    for remkey in remkeys:
-        if not remkey.endswith('*') or remkey.endswith(':'): 
-            if remkey.casefold() in aliases:
-                reminders.extend(getReminders(phenny, channel, remkey, tellee))
-        elif tellee.casefold().startswith(remkey.casefold().rstrip('*:')): 
-            reminders.extend(getReminders(phenny, channel, remkey, tellee))
+    for remkey in delivered:
+        reminders.extend(getReminders(phenny, channel, remkey, tellee))
 
     for line in reminders[:maximum]: 
         if "**pm**" in line:
@@ -130,16 +184,13 @@ def message(phenny, input):
         for line in reminders[maximum:]: 
             phenny.msg(tellee, line)
 
-    if len(list(phenny.reminders.keys())) != remkeys: 
-        dumpReminders(phenny)
+    dumpReminders(phenny, *delivered)
 message.rule = r'(.*)'
 message.priority = 'low'
 message.thread = False
 
 def messageAlert(phenny, input):
-    aliases = alias.aliasGroupFor(input.nick)
-    remkeys = set(map(str.lower, phenny.reminders.keys()))
-    if any((alias.lower() in remkeys) for alias in aliases):
+    if phenny.reminders.exactly(alias.aliasGroupFor(input.nick)):
         phenny.say(input.nick + ': You have messages. Say something, and I\'ll read them out.')
 messageAlert.event = 'JOIN'
 messageAlert.rule = r'.*'
@@ -175,6 +226,7 @@ Usage: ".tells" for a summary of queued reminders; ".tells [show ]<nick/num>" fo
                     phenny.reminders[tellee].remove(msg)
                     if not phenny.reminders[tellee]:
                         del phenny.reminders[tellee]
+                    dumpReminders(phenny, tellee)
                     phenny.reply('Removed reminder {} that would have sent to {}. (reminder numbers have changed, use ".tells show" again)'.format(input.group(2), tellee))
                 else:
                     phenny.reply("That isn't a valid reminder.")
@@ -4,7 +4,7 @@ Tests for phenny's alias.py
 
 import unittest
 import datetime
-from mock import MagicMock
+from mock import MagicMock, patch
 from modules import alias
 
 class TestAlias(unittest.TestCase):
@@ -152,3 +152,9 @@ class TestAlias(unittest.TestCase):
 
         alias.c_alias(self.phenny, self.input)
         self.phenny.reply.assert_called_once_with('Usage: .alias add <nick>, .alias list <nick>?, .alias remove')
+
+    def test_loadAliases(self):
+        with patch('modules.alias.read_db', return_value=[['Testsworth', 'tests']]):
+            alias.loadAliases(self.phenny)
+
+        self.assertEqual(alias.aliasGroupFor('tests'), ['Testsworth', 'tests'])
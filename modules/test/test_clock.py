@@ -68,3 +68,27 @@ class TestClock(unittest.TestCase):
         clock.time_zone_convert(self.phenny, "invalid")
         out = self.phenny.reply.call_args[0][0]
         self.assertTrue("Usage: .tz" in out)
+
+
+class TestTimeZones(unittest.TestCase):
+    def setUp(self):
+        abbreviations = {
+            'EDT': [('Eastern Daylight Time', -4)],
+            'ChST': [('Chamorro Standard Time', 10)],
+            'IST': [('Indian Standard Time', 5.5), ('Irish Standard Time', 1)],
+        }
+        zones = {'NEW YORK': -5.0, 'ISTANBUL': 3.0, 'NEW SALEM': -6.0, 'OSLO': 1.0}
+        self.zones = clock.TimeZones(abbreviations, zones)
+
+    def test_find(self):
+        self.assertEqual(self.zones.find('oslo'), ([('OSLO', 1.0)], 1))
+        self.assertEqual(self.zones.find('chst'), ([('Chamorro Standard Time', 10)], 1))
+        self.assertEqual(self.zones.find('NEW'), ([('NEW YORK', -5.0), ('NEW SALEM', -6.0)], 2))
+        self.assertEqual(self.zones.find('NEWS'), ([], 0))
+
+    def test_find_limit(self):
+        offsets, total = self.zones.find('IST', 2)
+        self.assertEqual(offsets, [('Indian Standard Time', 5.5), ('Irish Standard Time', 1)])
+        self.assertEqual(total, 3)
+        self.assertEqual(self.zones.find('IST')[0][2], ('ISTANBUL', 3.0))
+        self.assertEqual(self.zones.find('', 1), ([('NEW YORK', -5.0)], 4))
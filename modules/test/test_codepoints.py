@@ -6,6 +6,7 @@ import unittest
 from mock import MagicMock
 from modules import codepoints
 import platform
+from itertools import islice
 
 
 class TestCodepoints(unittest.TestCase):
@@ -55,3 +56,25 @@ class TestCodepoints(unittest.TestCase):
         else:
             status = True
         self.assertTrue(status)
+
+    def test_codepoint_simple(self):
+        self.assertEqual(codepoints.codepoint_simple('snowman'), 'U+2603 SNOWMAN (☃)')
+        self.assertEqual(codepoints.codepoint_simple('greek small alpha'),
+                         'U+03B1 GREEK SMALL LETTER ALPHA (α)')
+        self.assertIsNone(codepoints.codepoint_simple('zzzz'))
+
+        # words that are regexps can't narrow the search
+        self.assertEqual(codepoints.codepoint_simple('X?SNOWMAN'), 'U+2603 SNOWMAN (☃)')
+        self.assertEqual(codepoints.codepoint_simple('SNOWMAN|COMET'), 'U+2604 COMET (☄)')
+
+    def test_codepoint_extended_lines(self):
+        # [^A-Z] could match the newline between two names in the index
+        for result in islice(codepoints.codepoint_extended('N[^A-Z]S'), 20):
+            self.assertRegex(result, 'N[ -]S')
+
+        self.assertEqual(list(islice(codepoints.codepoint_extended('^-$'), 2)),
+                         ['U+0001 - (\x01)', 'U+0002 - (\x02)'])
+
+        # a lookahead could see the newline after the name
+        self.assertEqual(list(codepoints.codepoint_extended('^SNOWMAN(?![^A])')),
+                         ['U+2603 SNOWMAN (☃)'])
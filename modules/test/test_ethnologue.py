@@ -37,3 +37,20 @@ class TestEthnologue(unittest.TestCase):
         out = self.phenny.say.call_args[0][0]
         self.assertTrue("macrolanguage" in out)
 
+
+    def test_flatten(self):
+        self.assertEqual(ethno.flatten("español n’ko fráñçais"), "espanol n'ko français")
+
+    def test_language_index(self):
+        names = {'nld': 'Dutch', 'deu': 'German', 'gsw': 'Swiss German',
+                 'pdc': 'Pennsylvania German', 'spa': 'Español', 'nqo': 'N’Ko'}
+        index = ethno.LanguageIndex(names, fold=ethno.flatten)
+
+        for query in ['german', 'germ', 'an', 'espanol', 'español', "n'ko", 'xyz', '']:
+            expected = [(code, name) for code, name in names.items()
+                        if query in ethno.flatten(name.lower())]
+            self.assertEqual(index.search(query), expected)
+
+        plain = ethno.LanguageIndex(names)
+        self.assertEqual(plain.search('español'), [('spa', 'Español')])
+        self.assertEqual(plain.search('espanol'), [])
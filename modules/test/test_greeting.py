@@ -23,6 +23,10 @@ class TestGreeting(unittest.TestCase):
         self.phenny.config.greetings = {}
         self.phenny.config.greet_delay = 0
 
+        # run greetings straight away instead of on the scheduler
+        self.phenny.scheduler.call_later.side_effect = \
+            lambda delay, fn, args=(), **kwargs: fn(*args)
+
     def test_greeting_binary(self):
         self.input.nick = 'Testsworth'
 
@@ -53,3 +57,15 @@ class TestGreeting(unittest.TestCase):
 
         hint = "Please consider removing [m] from your IRC nick. See http://wiki.apertium.org/wiki/IRC/Matrix#Remove_.5Bm.5D_from_your_IRC_nick for details. Reply .dismiss to prevent this message from appearing again."
         self.phenny.msg.assert_called_once_with(self.input.nick, self.input.nick + ": " + hint)
+
+    def test_greeting_delay(self):
+        self.input.nick = 'Testsworth'
+        self.phenny.config.greetings[self.input.sender] = 'Hi'
+        self.phenny.config.greet_delay = 30
+        self.phenny.scheduler.call_later.side_effect = None
+
+        greeting.greeting(self.phenny, self.input)
+
+        self.phenny.msg.assert_not_called()
+        delay, fn, args = self.phenny.scheduler.call_later.call_args[0]
+        self.assertEqual((delay, fn), (30, greeting.greet))
@@ -57,27 +57,28 @@ class TestHead(unittest.TestCase):
         self.phenny.say.assert_called_once_with('There was no truncatedcone '
             'header in the response.')
 
-    @patch('modules.head.web.get')
-    def test_snarfuri(self, mock_wget, mock_head):
-        mock_head.return_value = {
-            'status': '200',
-            'content-type': 'text/html; charset=utf-8'
-        }
-        mock_wget.return_value = '<html><title>Some Page</title></html>'
+    @patch('modules.head.web.peek')
+    def test_snarfuri(self, mock_peek, mock_head):
+        mock_peek.return_value = ({'content-type': 'text/html; charset=utf-8'},
+                                  '<html><title>Some Page</title>')
         self.input.group.return_value = 'https://www.somepage.com'
         self.assertFalse('https://www.somepage.com' in self.phenny.recent_titles)
         head.snarfuri(self.phenny, self.input)
         self.assertTrue('https://www.somepage.com' in self.phenny.recent_titles)
-        mock_head.assert_called_once_with('https://www.somepage.com')
-        mock_wget.assert_called_once_with('https://www.somepage.com')
+        self.assertEqual(mock_peek.call_args[0][0], 'https://www.somepage.com')
         self.phenny.msg.assert_called_once_with(self.input.sender, '[ Some Page ]')
 
-    @patch('modules.head.requests.get')
-    def test_snarfuri_405(self, mock_get, mock_head):
-        mock_head.side_effect = HTTPError(response=MagicMock(status_code='405'))
-        mock_get.side_effect = HTTPError(response=MagicMock(status_code='405'))
+    @patch('modules.head.web.peek')
+    def test_snarfuri_binary(self, mock_peek, mock_head):
+        mock_peek.return_value = ({'content-type': 'application/zip'}, None)
+        self.input.group.return_value = 'https://www.somepage.com/big.zip'
+        head.snarfuri(self.phenny, self.input)
+        self.assertFalse(self.phenny.msg.called)
+
+    @patch('modules.head.web.peek')
+    def test_snarfuri_405(self, mock_peek, mock_head):
+        mock_peek.side_effect = HTTPError(response=MagicMock(status_code='405'))
         self.input.group.return_value = 'http://405notallowed.com'
         head.snarfuri(self.phenny, self.input)
-        mock_head.assert_called_once_with('http://405notallowed.com')
-        self.assertEqual(mock_get.call_args[0][0], 'http://405notallowed.com')
+        self.assertEqual(mock_peek.call_args[0][0], 'http://405notallowed.com')
         self.assertFalse(self.phenny.msg.called)
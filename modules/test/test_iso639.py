@@ -93,3 +93,14 @@ class TestISO639(unittest.TestCase):
             for k, v in self.phenny.iso_data.items():
                 if lang in v:
                     self.assertIn(k + ' = ' + v, phenny_say_return_value)
+
+    @mock.patch('modules.iso639.ethnologue.setup')
+    def test_setup(self, mock_setup):
+        phenny = mock.MagicMock()
+        phenny.modules = {'ethnologue': mock.MagicMock()}
+        iso639.setup(phenny)
+        mock_setup.assert_not_called()
+
+        phenny.modules = {}
+        iso639.setup(phenny)
+        mock_setup.assert_called_once_with(phenny)
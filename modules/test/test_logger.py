@@ -0,0 +1,102 @@
+"""
+Tests for phenny's logger.py
+"""
+
+import sqlite3
+import unittest
+from mock import MagicMock, patch
+from modules import logger
+from tools import DatabaseCursor
+
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.phenny = MagicMock()
+        self.phenny.nick = 'phenny'
+        self.phenny.config.host = 'irc.freenode.net'
+
+        logger.setup(self.phenny)
+        self.clear()
+
+        self.input = MagicMock()
+        self.input.sender = '#test'
+        self.input.nick = 'Loggerworth'
+
+    def tearDown(self):
+        logger.teardown(self.phenny)
+        self.clear()
+
+    def clear(self):
+        with DatabaseCursor(self.phenny.logger_db) as cursor:
+            cursor.execute("delete from lines_by_nick where nick = 'loggerworth'")
+
+    def log(self, *messages):
+        for message in messages:
+            self.input.group = lambda x: message
+            logger.logger(self.phenny, self.input)
+
+    def stored(self):
+        with DatabaseCursor(self.phenny.logger_db) as cursor:
+            cursor.execute("select channel, lines, characters, quote from lines_by_nick where nick = 'loggerworth'")
+            return cursor.fetchall()
+
+    def test_buffered(self):
+        self.log('hello', 'there')
+
+        self.assertEqual(self.stored(), [])
+        rows = self.phenny.logger_buffer.lookup('loggerworth')
+        self.assertEqual([row[:4] for row in rows], [('#test', 'loggerworth', 2, 10)])
+        self.assertEqual(rows[0][5], 'there')
+
+    def test_flush(self):
+        self.log('hello')
+        self.phenny.logger_buffer.flush()
+        self.log('\x01ACTION waves\x01')
+        self.phenny.logger_buffer.flush()
+
+        self.assertEqual(self.stored(), [('#test', 2, 19, '* loggerworth waves')])
+
+    def test_flush_lines(self):
+        self.phenny.logger_buffer.flush_lines = 3
+        self.log('a', 'b', 'c')
+
+        self.assertEqual(self.stored(), [('#test', 3, 3, 'c')])
+
+    def test_lookup_merges(self):
+        self.log('hello')
+        self.phenny.logger_buffer.flush()
+        self.log('again')
+
+        rows = self.phenny.logger_buffer.lookup('loggerworth')
+        self.assertEqual([row[:4] for row in rows], [('#test', 'loggerworth', 2, 10)])
+
+    def test_flush_failure(self):
+        self.log('hello')
+
+        with patch('modules.logger.DatabaseCursor', side_effect=sqlite3.OperationalError('locked')):
+            with self.assertRaises(sqlite3.OperationalError):
+                self.phenny.logger_buffer.flush()
+
+        self.log('again')
+        self.phenny.logger_buffer.flush()
+
+        self.assertEqual(self.stored(), [('#test', 2, 10, 'again')])
+
+    def test_scheduled_flush(self):
+        call_later = self.phenny.scheduler.call_later
+
+        self.log('hello', 'there')
+        self.assertEqual(call_later.call_count, 1)
+        delay, flush = call_later.call_args[0]
+        self.assertEqual(delay, self.phenny.logger_buffer.flush_interval)
+
+        flush()
+        self.assertEqual(self.stored(), [('#test', 2, 10, 'there')])
+
+        self.log('again')
+        call_later.return_value.cancel.reset_mock()
+        logger.teardown(self.phenny)
+
+        call_later.return_value.cancel.assert_called_once_with()
+        self.assertEqual(self.stored(), [('#test', 3, 15, 'again')])
@@ -3,7 +3,7 @@ Tests for phenny's more.py
 """
 
 import unittest
-from mock import MagicMock, call
+from mock import MagicMock, call, patch
 from modules import more
 
 def assert_call(mock, *args):
@@ -191,3 +191,29 @@ class TestMore(unittest.TestCase):
     def test_more_admin_both_none(self):
         self.fetch(False, False, None, None)
         assert_call(self.phenny.reply, "No more queued messages")
+
+    def test_more_tag(self):
+        self.create_messages(self.input.nick, 4, tag='one')
+        self.create_messages(self.input.nick, 4, tag='two')
+
+        self.fetch(False, False, 3, 'two')
+        self.assert_msgs(self.input.nick, 1, 4, 0)
+        self.assertEqual(more.count_more(self.phenny, self.input.nick), 3)
+
+        self.fetch(False, False, 1, 'two')
+        assert_call(self.phenny.reply, "No more queued messages")
+
+    def test_join_alert_pending(self):
+        self.input.group = lambda x: [None][x]
+
+        with patch('modules.more.DatabaseCursor') as cursor:
+            more.joinAlert(self.phenny, self.input)
+            cursor.assert_not_called()
+        self.phenny.reply.assert_not_called()
+
+        self.create_messages(self.input.nick.upper(), 3)
+        more.joinAlert(self.phenny, self.input)
+        assert_call(self.phenny.reply, 'You have queued messages. Type ".more", and I\'ll read them out.')
+
+        more.setup(self.phenny)
+        self.assertEqual(more.count_more(self.phenny, self.input.nick), 2)
@@ -178,3 +178,47 @@ class TestQueue(unittest.TestCase):
         self.set_input('display', 'todo', None)
         queue.queue(self.phenny, self.input)
         self.expect_reply('No queues found.')
+
+    def test_display_ambiguous(self):
+        self.phenny.queue_data['devil:todo'] = {'owner': 'devil', 'queue': []}
+        self.phenny.queue_data['angel:todo'] = {'owner': 'angel', 'queue': []}
+
+        self.set_input('display', 'todo', None)
+        queue.queue(self.phenny, self.input)
+        self.expect_reply('Did you mean: devil:todo, angel:todo?')
+
+        self.set_input('new', 'todo', 'lorem')
+        queue.queue(self.phenny, self.input)
+        self.phenny.msg.reset_mock()
+
+        self.set_input('display', 'TODO', None)
+        queue.queue(self.phenny, self.input)
+        self.expect_msg('[tester:todo] - lorem')
+
+class TestQueues(unittest.TestCase):
+    def setUp(self):
+        self.queues = queue.Queues()
+        self.queues['Devil:todo'] = {'owner': 'Devil', 'queue': []}
+        self.queues['angel:todo'] = {'owner': 'angel', 'queue': []}
+        self.queues['angel:Chores'] = {'owner': 'angel', 'queue': []}
+
+    def test_resolve(self):
+        self.assertEqual(self.queues.resolve('devil:TODO', 'tester'), 'Devil:todo')
+        self.assertEqual(self.queues.resolve('todo', 'ANGEL'), 'angel:todo')
+        self.assertEqual(self.queues.resolve('todo', 'tester'), 'Devil:todo')
+        self.assertEqual(self.queues.resolve('chores', 'tester'), 'angel:Chores')
+        self.assertIsNone(self.queues.resolve('nope', 'tester'))
+
+    def test_reindex(self):
+        self.queues['devil:todo'] = self.queues.pop('Devil:todo')
+        del self.queues['angel:todo']
+
+        self.assertEqual(self.queues.named('TODO'), ['devil:todo'])
+        self.assertEqual(self.queues.resolve('todo', 'angel'), 'devil:todo')
+        self.assertEqual(self.queues.owners, {
+            'devil': {'todo': 'devil:todo'},
+            'angel': {'chores': 'angel:Chores'},
+        })
+
+        self.queues.clear()
+        self.assertEqual(self.queues.names, {})
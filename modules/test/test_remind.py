@@ -7,6 +7,7 @@ import unittest
 import time
 from mock import MagicMock, patch
 from modules import remind
+import scheduler
 
 
 class TestRemind(unittest.TestCase):
@@ -16,11 +17,15 @@ class TestRemind(unittest.TestCase):
         self.input = MagicMock()
         self.phenny.nick = 'phenny'
         self.phenny.config.host = 'test-phenny.example.com'
+        self.phenny.scheduler = scheduler.Scheduler()
 
         remind.load_database = lambda phenny: {}
-        remind.dump_database = lambda phenny: None
+        remind.dump_database = lambda phenny, *keys: None
         remind.setup(self.phenny)
 
+    def tearDown(self):
+        self.phenny.scheduler.shutdown()
+
     def test_remind(self):
         secs = 5
         self.input.sender = '#testsworth'
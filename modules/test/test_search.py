@@ -18,7 +18,7 @@ class TestSearch(unittest.TestCase):
         self.phenny = MagicMock()
         self.input = MagicMock()
 
-    @patch('modules.search.requests.get')
+    @patch('modules.search.web.request')
     @catch_timeout
     def test_requests(self, mock_get):
         mock_response = MagicMock()
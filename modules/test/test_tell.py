@@ -63,3 +63,28 @@ class TestTell(unittest.TestCase):
         dt = dt[len(datetime.datetime.utcnow().strftime('%d %b')) + 1:]
         dt = dt.replace(datetime.datetime.utcnow().strftime('%Y '), '')
         self.assertTrue(ret == 'Testsworth: %s <tests> ask Testsworth to eat cake' % dt)
+
+    def test_pending(self):
+        reminders = tell.Reminders()
+        reminders['Tests'] = []
+        reminders['tests'] = []
+        reminders['tes*'] = []
+        reminders['other*'] = []
+        reminders['alias'] = []
+
+        self.assertEqual(reminders.pending('TESTS', ['TESTS']), ['tests', 'tes*', 'Tests'])
+        self.assertEqual(reminders.pending('tested', ['tested', 'Alias']), ['tes*', 'alias'])
+        self.assertEqual(reminders.pending('nobody', ['nobody']), [])
+
+        del reminders['tes*']
+        reminders.pop('Tests')
+        self.assertEqual(reminders.pending('tests', ['tests']), ['tests'])
+
+    def test_message(self):
+        self.input.sender = '#testsworth'
+        self.input.nick = 'Testsworth'
+        self.phenny.reminders['testsw*'] = [('tests', 'tell', '01 Jan 2014 00:00Z', 'hi')]
+
+        tell.message(self.phenny, self.input)
+        self.phenny.say.assert_called_once_with('Testsworth: 01 Jan 2014 00:00Z <tests> tell testsw* hi')
+        self.assertEqual(self.phenny.reminders.pending('Testsworth', ['Testsworth']), [])
@@ -50,9 +50,9 @@ def local(icao, hour, minute):
 
 
 def code(phenny, search):
-    from icao import data
+    import icao
 
-    if search.upper() in [loc[0] for loc in data]:
+    if icao.station(search):
         return search.upper()
     else:
         latitude, longitude = location(search)
@@ -60,17 +60,7 @@ def code(phenny, search):
         if not latitude or not longitude:
             return False
 
-        sumOfSquares = (99999999999999999999999999999, 'ICAO')
-
-        for icao_code, lat, lon in data:
-            latDiff = abs(latitude - lat)
-            lonDiff = abs(longitude - lon)
-            diff = (latDiff * latDiff) + (lonDiff * lonDiff)
-
-            if diff < sumOfSquares[0]:
-                sumOfSquares = (diff, icao_code)
-
-        return sumOfSquares[1]
+        return icao.nearest(latitude, longitude)[0]
 
 
 def f_weather(phenny, input):
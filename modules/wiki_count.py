@@ -4,12 +4,15 @@ author: mattr555
 """
 
 from lxml import html
+import snapshots
 import web
 
-def scrape_wiki_list():
+wiki_list_url = 'https://meta.wikimedia.org/wiki/List_of_Wikipedias'
+incubator_list_url = 'https://incubator.wikimedia.org/wiki/Template:Tests/wp'
+iso_list_url = 'https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes'
+
+def scrape_wiki_list(resp):
 	data = {}
-	url = 'https://meta.wikimedia.org/wiki/List_of_Wikipedias'
-	resp = web.get(url)
 	h = html.document_fromstring(resp)
 	for e in h.find_class('sortable'):
 		for row in e.findall('tr')[1:]:
@@ -19,10 +22,8 @@ def scrape_wiki_list():
 			data[code] = (name, count)
 	return data
 
-def scrape_incubator_list():
+def scrape_incubator_list(resp):
 	data = {}
-	url = 'https://incubator.wikimedia.org/wiki/Template:Tests/wp'
-	resp = web.get(url)
 	h = html.document_fromstring(resp)
 	for row in h.find_class('wikitable')[0].findall('tr')[2:]:
 		#raw_name = row.findall('td')[0].find('a/b')
@@ -39,9 +40,8 @@ def scrape_incubator_list():
 		data[code] = (name, None)
 	return data
 
-def scrape_iso_3to1(d):
+def scrape_iso_3to1(resp, d):
 	mapping = {}
-	resp = web.get('https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes')
 	h = html.document_fromstring(resp)
 	table = h.find_class('wikitable')[0]
 	for row in table.findall('tr')[1:]:
@@ -104,10 +104,32 @@ wikicount.commands = ['wikicount']
 wikicount.example = '.wikicount en'
 wikicount.priority = 'low'
 
+def parse_wikis(incubator_list, wiki_list, iso_list):
+	wiki_data = scrape_incubator_list(incubator_list)
+	wiki_data.update(scrape_wiki_list(wiki_list))
+
+	wiki_iso_3_map = scrape_iso_3to1(iso_list, wiki_data)
+	wiki_iso_3_map.update({
+		'sgs': 'bat-smg',
+		'roa': 'nrm',
+		'vro': 'fiu-vro',
+		'yue': 'zh-yue',
+		'nan': 'zh-min-nan',
+		'lzh': 'zh-classical',
+		'be-tarask': 'be-x-old'
+	})
+	return wiki_data, wiki_iso_3_map
+
+wikis = snapshots.Snapshot('wikipedias',
+	[incubator_list_url, wiki_list_url, iso_list_url], parse_wikis)
+
+def use_wikis(phenny, data):
+	phenny.wiki_data, phenny.wiki_iso_3_map = data
+
 def update_article_count(phenny, raw=None):
 	if raw is None or raw.admin:
-		phenny.wiki_data = scrape_incubator_list()
-		phenny.wiki_data.update(scrape_wiki_list())
+		wikis.refresh()
+		use_wikis(phenny, wikis.data)
 		if raw:
 			phenny.say('Wikipedia article counts successfully updated.')
 	else:
@@ -117,14 +139,5 @@ update_article_count.name = 'wikicount_update'
 update_article_count.commands = ['wikicount update']
 
 def setup(phenny):
-	update_article_count(phenny)
-	phenny.wiki_iso_3_map = scrape_iso_3to1(phenny.wiki_data)
-	phenny.wiki_iso_3_map.update({
-		'sgs': 'bat-smg',
-		'roa': 'nrm',
-		'vro': 'fiu-vro',
-		'yue': 'zh-yue',
-		'nan': 'zh-min-nan',
-		'lzh': 'zh-classical',
-		'be-tarask': 'be-x-old'
-	})
+	wikis.setup(phenny, use_wikis)
+setup.background = True
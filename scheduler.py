@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+scheduler.py - Phenny Scheduler
+
+Runs jobs at given times. Jobs are kept in a heap ordered by due time, and a
+single thread sleeps until the earliest one is due (or a new, earlier one is
+scheduled), so nothing wakes up while there's nothing to do. Short jobs run
+on that thread; jobs scheduled with blocking=True are handed to a worker pool
+so they can't hold up the others.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger('phenny')
+
+
+class Job(object):
+    __slots__ = ('when', 'fn', 'args', 'name', 'blocking', 'cancelled')
+
+    def __init__(self, when, fn, args, name, blocking):
+        self.when = when
+        self.fn = fn
+        self.args = args
+        self.name = name
+        self.blocking = blocking
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class Scheduler(object):
+    def __init__(self, pool=None):
+        self.pool = pool
+        self.jobs = []
+        self.counter = itertools.count()
+        self.changed = threading.Condition()
+        self.thread = None
+        self.stopped = False
+
+    def start(self):
+        with self.changed:
+            if self.thread is None and not self.stopped:
+                self.thread = threading.Thread(target=self.run, name='scheduler')
+                self.thread.daemon = True
+                self.thread.start()
+
+    def schedule(self, when, fn, args=(), name=None, blocking=False):
+        """Run fn(*args) at unix time when. Returns a Job that can be cancelled."""
+        job = Job(when, fn, args, name, blocking)
+
+        with self.changed:
+            heapq.heappush(self.jobs, (when, next(self.counter), job))
+            # only worth waking the thread if this is now the first job
+            if self.jobs[0][2] is job:
+                self.changed.notify()
+
+        self.start()
+        return job
+
+    def call_later(self, delay, fn, args=(), name=None, blocking=False):
+        return self.schedule(time.time() + delay, fn, args, name, blocking)
+
+    def due(self):
+        """Wait for and pop the jobs that are due, or return None once stopped."""
+        with self.changed:
+            while not self.stopped:
+                while self.jobs and self.jobs[0][2].cancelled:
+                    heapq.heappop(self.jobs)
+
+                if not self.jobs:
+                    self.changed.wait()
+                    continue
+
+                delay = self.jobs[0][0] - time.time()
+                if delay > 0:
+                    self.changed.wait(delay)
+                    continue
+
+                now = time.time()
+                jobs = []
+                while self.jobs and self.jobs[0][0] <= now:
+                    job = heapq.heappop(self.jobs)[2]
+                    if not job.cancelled:
+                        jobs.append(job)
+                return jobs
+
+    def run(self):
+        while True:
+            jobs = self.due()
+            if jobs is None:
+                return
+
+            for job in jobs:
+                if job.blocking and self.pool is not None:
+                    self.pool.submit(job.fn, job.args, name=job.name)
+                    continue
+
+                try:
+                    job.fn(*job.args)
+                except Exception:
+                    logger.exception("Error in scheduled job %s" % (job.name or job.fn))
+
+    def pending(self):
+        with self.changed:
+            return sum(not job.cancelled for when, i, job in self.jobs)
+
+    def shutdown(self):
+        with self.changed:
+            self.stopped = True
+            self.jobs.clear()
+            self.changed.notify_all()
+
+        if self.pool is not None:
+            self.pool.shutdown()
+
+
+if __name__ == '__main__':
+    print(__doc__.strip())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+snapshots.py - Phenny Dataset Snapshots
+
+Reference data scraped from the web (language codes, wiki article counts,
+time zones) is saved in ~/.phenny/snapshots as a pickle of the parsed result,
+along with when it was fetched and a hash of the pages it came from. Startup
+loads the snapshot instead of scraping, and the data is refreshed in the
+background once it's older than max_age. Pages are fetched together through
+the HTTP cache, so an unchanged page usually costs a revalidation, and they're
+only parsed again if their hash has changed.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+
+import tools
+import web
+
+logger = logging.getLogger('phenny')
+
+max_age = 24 * 60 * 60
+retry_delay = 60 * 60
+
+
+class Snapshot(object):
+    def __init__(self, name, urls, parse, version=1, max_age=max_age):
+        # parse(*pages) turns the text of urls into the data; bump version
+        # whenever it changes what it returns, so old snapshots are ignored
+        self.name = name
+        self.urls = urls
+        self.parse = parse
+        self.version = version
+        self.max_age = max_age
+
+        self.data = None
+        self.time = 0
+        self.digest = None
+        self.users = {}
+        # the refresh job, and the scheduler it's on; a reconnect brings a
+        # new scheduler, and the job has to move to it
+        self.job = None
+        self.scheduler = None
+        self.lock = threading.Lock()
+        self.scheduling = threading.RLock()
+
+    def path(self):
+        return tools.dot_path(os.path.join('snapshots', self.name + '.pickle'))
+
+    def load(self):
+        try:
+            saved = tools.read_obj(self.path())
+        except tools.GrumbleError:
+            return False
+
+        if not isinstance(saved, dict) or saved.get('version') != self.version:
+            return False
+
+        self.data, self.time, self.digest = saved['data'], saved['time'], saved['hash']
+        return True
+
+    def save(self):
+        tools.write_obj(self.path(), {
+            'version': self.version,
+            'time': self.time,
+            'hash': self.digest,
+            'data': self.data,
+        })
+
+    def refresh(self):
+        """Fetch the pages and parse them if they've changed. Returns whether
+        the data changed; if it did, it's handed to everyone using it."""
+        with self.lock:
+            pages = dict(web.fetch_all(self.urls, cache=True))
+            pages = [pages[url] for url in self.urls]
+
+            digest = hashlib.sha256()
+            for page in pages:
+                digest.update(page.encode('utf-8') + b'\0')
+            digest = digest.hexdigest()
+
+            changed = self.data is None or digest != self.digest
+            if changed:
+                # swapped in whole, so readers never see a half-built dataset
+                self.data = self.parse(*pages)
+                self.digest = digest
+
+            self.time = time.time()
+            self.save()
+            data = self.data
+
+        logger.info("Refreshed %s snapshot (%s)" % (self.name, 'changed' if changed else 'unchanged'))
+
+        if changed:
+            for use, phenny in list(self.users.items()):
+                use(phenny, data)
+
+        return changed
+
+    def setup(self, phenny, use):
+        """Call use(phenny, data) with the saved data, fetching it if there's
+        no snapshot yet, and again whenever a refresh changes it."""
+        if self.data is None and not self.load():
+            self.refresh()
+
+        self.users[use] = phenny
+        use(phenny, self.data)
+
+        with self.scheduling:
+            if self.scheduler is not phenny.scheduler:
+                self.schedule(phenny.scheduler, self.time + self.max_age)
+
+    def schedule(self, scheduler, when):
+        with self.scheduling:
+            if self.job is not None:
+                self.job.cancel()
+
+            self.scheduler = scheduler
+            self.job = scheduler.schedule(when, self.update, (scheduler,),
+                                          name='%s snapshot' % self.name, blocking=True)
+
+    def update(self, scheduler):
+        try:
+            self.refresh()
+            when = self.time + self.max_age
+        except Exception:
+            logger.exception("Error refreshing %s snapshot" % self.name)
+            when = time.time() + retry_delay
+
+        with self.scheduling:
+            # unless the job has moved to a newer scheduler meanwhile
+            if self.scheduler in (None, scheduler):
+                self.schedule(scheduler, when)
+
+
+if __name__ == '__main__':
+    print(__doc__.strip())
@@ -2,6 +2,10 @@
 Tests for phenny's bot.py
 """
 
+import asyncio
+import re
+import threading
+import types
 import unittest
 from mock import call, patch, Mock
 import bot
@@ -25,6 +29,16 @@ class BotTest(unittest.TestCase):
 
         self.bot = bot.Phenny(MockConfig)
 
+    @patch('bot.Phenny.setup')
+    def test_send_burst(self, mock_setup):
+        self.assertEqual(self.bot.sender.burst, 1.0)
+
+        config = types.SimpleNamespace(nick='phenny', name='Phenny',
+                channels=[], password=None, send_burst=3.0)
+        phenny = bot.Phenny(config)
+        self.assertEqual(phenny.sender.burst, 3.0)
+        self.assertEqual(phenny.sender.tokens, 3.0)
+
     def test_input(self):
         class MockOrigin(object):
             nick = 'sock_puppet'
@@ -72,3 +86,187 @@ class BotTest(unittest.TestCase):
         cmdinput = self.bot.input(origin, text, match, args)
 
         self.assertEqual(cmdinput.admin, True)
+
+    def bind(self, *funcs):
+        self.bot.config.prefix = r'\.'
+        self.bot.variables = {'test': {func.__name__: func for func in funcs}}
+        self.bot.bind_commands()
+
+    def test_literal_prefixes(self):
+        prefixes = lambda pattern: bot.literal_prefixes(re.compile(pattern))
+
+        self.assertEqual(prefixes(r'\.(?:t|tweb)(?: +(.+))?'), ['.t'])
+        self.assertEqual(prefixes(r'phenny[,:] +(?:reload)'), ['phenny,', 'phenny:'])
+        self.assertEqual(prefixes(r'(?!.*(?:->|→))\.(?:tz)()'), ['.tz'])
+        self.assertEqual(prefixes(r'(.*)'), [''])
+        self.assertEqual(prefixes(r'(?i)\.t'), [''])
+
+    def test_dispatch_candidates(self):
+        def translate(phenny, input): pass
+        translate.commands = ['t']
+        translate.priority = 'high'
+
+        def time(phenny, input): pass
+        time.commands = ['time']
+
+        def logger(phenny, input): pass
+        logger.rule = r'(.*)'
+        logger.priority = 'low'
+
+        def greeting(phenny, input): pass
+        greeting.rule = r'(.*)'
+        greeting.event = 'JOIN'
+
+        self.bind(logger, time, greeting, translate)
+
+        funcs = lambda event, text: [func for order, regexp, func in
+                                     self.bot.index.candidates(event, text)]
+
+        self.assertEqual(funcs('PRIVMSG', '.t en-es hi'), [translate, logger])
+        self.assertEqual(funcs('PRIVMSG', '.time Oslo'), [translate, time, logger])
+        self.assertEqual(funcs('PRIVMSG', 'hello'), [logger])
+        self.assertEqual(funcs('JOIN', ''), [greeting])
+        self.assertEqual(funcs('PING', 'example.org'), [])
+
+    @patch('bot.Phenny.call')
+    def test_dispatch(self, mock_call):
+        def translate(phenny, input): pass
+        translate.commands = ['t']
+        translate.thread = False
+
+        def time(phenny, input): pass
+        time.commands = ['time']
+        time.thread = False
+
+        self.bind(translate, time)
+
+        origin = Mock(nick='sock_puppet', sender='#phenny')
+        self.bot.config.ignore = []
+        self.bot.dispatch(origin, ('PRIVMSG', '#phenny'), '.time Europe/Oslo')
+
+        self.assertEqual(mock_call.call_count, 1)
+        self.assertEqual(mock_call.call_args[0][0], time)
+
+    def test_dispatch_coroutine(self):
+        calls = []
+
+        async def translate(phenny, input):
+            calls.append(input.group(1))
+        translate.commands = ['t']
+
+        self.bind(translate)
+        self.bot.config.ignore = []
+        origin = Mock(nick='sock_puppet', sender='#phenny')
+
+        async def session():
+            self.bot.loop = asyncio.get_running_loop()
+            self.bot.dispatch(origin, ('PRIVMSG', '#phenny'), '.t en-es hi')
+            await asyncio.sleep(0.1)
+
+        asyncio.run(session())
+        self.assertEqual(calls, ['en-es hi'])
+
+    def module(self, name, setup, background=False):
+        def command(phenny, input): pass
+        command.commands = [name]
+        command.thread = False
+        command.__module__ = name
+
+        module = types.ModuleType(name)
+        module.__file__ = name + '.py'
+        module.command = command
+        module.setup = setup
+        setup.background = background
+        return module
+
+    @patch('bot.Phenny.call')
+    def test_setup_modules(self, mock_call):
+        done = threading.Event()
+
+        def quick(phenny): pass
+        def broken(phenny): raise ValueError('no data')
+        def slow(phenny): done.wait(5)
+
+        modules = [self.module('quick', quick), self.module('broken', broken),
+                   self.module('slow', slow, background=True)]
+
+        self.bot.config.prefix = r'\.'
+        self.bot.config.ignore = []
+        self.bot.modules = {module.__name__: module for module in modules}
+        self.bot.variables = {}
+        for module in modules:
+            self.bot.register(module)
+        self.bot.bind_commands()
+
+        with patch('bot.logger'):
+            self.bot.setup_modules(modules)
+
+            self.assertEqual(self.bot.loading, {'slow'})
+            self.assertEqual(sorted(self.bot.modules), ['quick', 'slow'])
+
+            origin = Mock(nick='sock_puppet', sender='#phenny')
+            with patch('bot.Phenny.msg') as mock_msg:
+                self.bot.dispatch(origin, ('PRIVMSG', '#phenny'), '.slow')
+                self.bot.dispatch(origin, ('PRIVMSG', '#phenny'), '.broken')
+                self.bot.dispatch(origin, ('PRIVMSG', '#phenny'), '.quick')
+
+            self.assertEqual(mock_msg.call_args[0][1], 'Still loading, try again in a bit.')
+            self.assertEqual([c[0][0] for c in mock_call.call_args_list], [modules[0].command])
+
+            done.set()
+            for i in range(50):
+                if not self.bot.loading:
+                    break
+                threading.Event().wait(0.1)
+
+            self.assertEqual(self.bot.loading, set())
+
+    @patch('bot.Phenny.call')
+    def test_setup_registers_handler(self, mock_call):
+        def pong(phenny, input): pass
+        pong.event = 'PONG'
+        pong.rule = r'.*'
+        pong.thread = False
+
+        def setup(phenny):
+            phenny.variables.setdefault('pinger', {})['pong'] = pong
+
+        module = self.module('pinger', setup)
+
+        self.bot.config.prefix = r'\.'
+        self.bot.config.ignore = []
+        self.bot.modules = {'pinger': module}
+        self.bot.variables = {}
+        self.bot.register(module)
+        self.bot.bind_commands()
+
+        with patch('bot.logger'):
+            self.bot.setup_modules([module])
+
+        origin = Mock(nick='irc.example.com', sender='irc.example.com')
+        self.bot.dispatch(origin, ('PONG', 'irc.example.com'), 'irc.example.com')
+        self.assertIn(pong, [c[0][0] for c in mock_call.call_args_list])
+
+    @patch('irc.Bot.handle_close')
+    def test_handle_close_teardown(self, mock_close):
+        module = self.module('buffered', lambda phenny: None)
+        module.teardown = Mock()
+        self.bot.modules = {'buffered': module}
+
+        self.bot.handle_close()
+        self.bot.handle_close()
+
+        module.teardown.assert_called_once_with(self.bot)
+        mock_close.assert_called_once_with(self.bot)
+
+    def test_setup_module_bind_error(self):
+        module = self.module('flaky', lambda phenny: None)
+        self.bot.modules = {'flaky': module}
+        self.bot.variables = {}
+        self.bot.loading = {'flaky'}
+
+        with patch('bot.logger'), patch('bot.Phenny.bind_commands', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.bot.setup_module(module)
+
+        self.assertEqual(self.bot.loading, set())
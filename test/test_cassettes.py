@@ -0,0 +1,129 @@
+"""
+Tests for phenny's cassettes.py
+"""
+
+import http.server
+import os
+import tempfile
+import threading
+import time
+import unittest
+import cassettes
+import web
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    requests = 0
+
+    def do_GET(self):
+        Handler.requests += 1
+
+        if self.path == '/moved':
+            self.send_response(301)
+            self.send_header('Location', '/page')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.reply(self.path.encode('utf-8'))
+
+    def do_POST(self):
+        Handler.requests += 1
+        self.reply(self.rfile.read(int(self.headers['Content-Length'])).upper())
+
+    def reply(self, body):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class CassetteTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%d' % self.server.server_port
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.json')
+        Handler.requests = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def session(self):
+        return [
+            web.get(self.url + '/a'),
+            web.get(self.url + '/moved'),
+            web.post(self.url + '/echo', {'q': 'hi'}),
+        ]
+
+    def test_record_replay(self):
+        session = web.session
+
+        with cassettes.use(self.path):
+            recorded = self.session()
+
+        self.assertIs(web.session, session)
+        self.assertEqual(recorded, ['/a', '/page', 'Q=HI'])
+        self.assertEqual(Handler.requests, 4)
+
+        with cassettes.use(self.path, latency=0.05):
+            start = time.perf_counter()
+            replayed = self.session()
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(Handler.requests, 4)
+        self.assertGreaterEqual(elapsed, 4 * 0.05)
+
+    def test_missing(self):
+        with cassettes.use(self.path):
+            web.get(self.url + '/a')
+
+        @web.catch_timeout
+        def replay():
+            web.get(self.url + '/b')
+
+        # not skipped, as if the server were down
+        with cassettes.use(self.path):
+            with self.assertRaises(cassettes.CassetteMiss):
+                replay()
+
+    def test_failed_recording(self):
+        with self.assertRaises(ValueError):
+            with cassettes.use(self.path):
+                web.get(self.url + '/a')
+                raise ValueError
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_memos(self):
+        memo = web.SingleFlight(memo=60)
+        fetch = lambda: web.get(self.url + '/a')
+        cache = web.http_cache
+        memo.do('a', fetch)
+
+        with cassettes.use(self.path) as cassette:
+            self.assertIsNot(web.http_cache, cache)
+            memo.do('a', fetch)
+
+        self.assertIs(web.http_cache, cache)
+        self.assertEqual(Handler.requests, 2)
+        self.assertEqual(list(cassette.exchanges), ['GET %s/a' % self.url])
+
+    def test_repeat(self):
+        with cassettes.use(self.path):
+            web.get(self.url + '/a')
+
+        with cassettes.use(self.path):
+            self.assertEqual([web.get(self.url + '/a') for i in range(3)], ['/a'] * 3)
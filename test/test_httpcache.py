@@ -0,0 +1,146 @@
+"""
+Tests for phenny's httpcache.py
+"""
+
+import os
+import tempfile
+import unittest
+import requests
+import httpcache
+import tools
+
+
+def response(status=200, body=b'body', **headers):
+    r = requests.Response()
+    r.status_code = status
+    r.headers.update({k.replace('_', '-'): v for k, v in headers.items()})
+    r._content = body
+    return r
+
+
+class HTTPCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'http.db')
+        self.debug, tools.debug = tools.debug, False
+        self.cache = self.new_cache()
+        self.requests = []
+
+    def tearDown(self):
+        tools.debug = self.debug
+        tools.database_pool.close()
+        self.directory.cleanup()
+
+    def new_cache(self, **kwargs):
+        return httpcache.HTTPCache(lambda: self.path, **kwargs)
+
+    def fetcher(self, *responses):
+        responses = list(responses)
+
+        def fetch(headers={}):
+            self.requests.append(headers)
+            result = responses.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return fetch
+
+    def test_fresh(self):
+        fetch = self.fetcher(response(Cache_Control='max-age=60'))
+
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.cache.stats['hits'], 1)
+
+        # a new process finds it on disk
+        cache = self.new_cache()
+        self.assertEqual(cache.get('http://a/', fetch).text, 'body')
+        self.assertEqual(cache.stats['disk_hits'], 1)
+
+    def test_revalidate(self):
+        fetch = self.fetcher(response(Cache_Control='no-cache', ETag='"v1"'),
+                             response(304, b'', ETag='"v1"', Cache_Control='max-age=60'))
+
+        self.cache.get('http://a/', fetch)
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(self.requests[1], {'If-None-Match': '"v1"'})
+        self.assertEqual(self.cache.stats['revalidated'], 1)
+
+        # now fresh for a minute
+        self.cache.get('http://a/', fetch)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_revalidate_lowercase(self):
+        fetch = self.fetcher(response(cache_control='no-cache', etag='"v1"'),
+                             response(304, b'', etag='"v1"', cache_control='max-age=60'))
+
+        self.cache.get('http://a/', fetch)
+
+        # the headers come back from disk as they were sent
+        cache = self.new_cache()
+        self.assertEqual(cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(self.requests[1], {'If-None-Match': '"v1"'})
+        self.assertEqual(cache.stats['revalidated'], 1)
+
+        cache.get('http://a/', fetch)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_no_store(self):
+        fetch = self.fetcher(response(Cache_Control='no-store'), response(body=b'again'))
+
+        self.cache.get('http://a/', fetch)
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'again')
+
+    def test_stale_on_error(self):
+        fetch = self.fetcher(response(Cache_Control='max-age=0'),
+                             requests.exceptions.ConnectionError(),
+                             response(503))
+
+        self.cache.get('http://a/', fetch)
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(self.cache.get('http://a/', fetch).content, b'body')
+        self.assertEqual(self.cache.stats['stale'], 2)
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.cache.get('http://b/', self.fetcher(requests.exceptions.ConnectionError()))
+
+    def test_eviction(self):
+        self.cache = self.new_cache(disk_bytes=250, memory_bytes=150)
+        for url in 'abc':
+            self.cache.get(url, self.fetcher(response(body=b'x' * 100)))
+
+        self.assertEqual(list(self.cache.memory), ['c'])
+        self.assertLessEqual(self.cache.disk_size, 250)
+        self.assertEqual(self.cache.stats['evictions'], 1)
+        self.assertIsNone(self.cache.lookup('a'))
+        self.assertIsNotNone(self.cache.lookup('b'))
+
+    def test_eviction_memory_hits(self):
+        self.cache = self.new_cache(disk_bytes=250, memory_bytes=1000)
+        for url in 'ab':
+            self.cache.get(url, self.fetcher(response(body=b'x' * 100)))
+
+        # a is read from memory, so b is now the least recently used
+        self.cache.get('a', self.fetcher())
+        self.cache.get('c', self.fetcher(response(body=b'x' * 100)))
+
+        cache = self.new_cache()
+        self.assertIsNotNone(cache.lookup('a'))
+        self.assertIsNone(cache.lookup('b'))
+
+    def test_remove_legacy_cache(self):
+        legacy = tools.urlsafe_encode('https://example.org/')
+        names = [legacy, legacy + '.x1y2.tmp', 'http.db', 'http.db-wal', 'notes.txt']
+        for name in names:
+            open(os.path.join(self.directory.name, name), 'w').close()
+
+        httpcache.remove_legacy_cache(self.directory.name)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), sorted(names[2:]))
+
+    def test_expiry(self):
+        self.assertEqual(httpcache.expiry({'Cache-Control': 'public, max-age=10'}, 100), 110)
+        self.assertEqual(httpcache.expiry({'Expires': 'Thu, 01 Jan 1970 00:01:40 GMT'}, 0), 100)
+        self.assertEqual(httpcache.expiry({'Last-Modified': 'Thu, 01 Jan 1970 00:00:00 GMT'}, 1000), 1100)
+        self.assertEqual(httpcache.expiry({}, 0), httpcache.default_ttl)
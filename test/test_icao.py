@@ -0,0 +1,56 @@
+"""
+Tests for phenny's icao.py
+"""
+
+import math
+import os
+import random
+import tempfile
+import unittest
+import icao
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2 +
+         math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * icao.radius * math.asin(math.sqrt(a))
+
+
+class ICAOTest(unittest.TestCase):
+    def test_station(self):
+        self.assertEqual(icao.station('ksfo'), ('KSFO', 37.6188888889, -122.374722222))
+        self.assertIsNone(icao.station('ZZZZ'))
+
+    def test_nearest(self):
+        random.seed(0)
+        for i in range(200):
+            lat, lon = random.uniform(-90, 90), random.uniform(-180, 180)
+            code, distance = icao.nearest(lat, lon)
+            best = min(haversine(lat, lon, slat, slon) for scode, slat, slon in icao.data)
+
+            self.assertAlmostEqual(distance, best, places=6)
+            self.assertAlmostEqual(haversine(lat, lon, *icao.station(code)[1:]), best, places=6)
+
+    def test_antimeridian(self):
+        # just east of the antimeridian by Fiji: a scan in raw degrees picks
+        # Wallis and Futuna, hundreds of km further away
+        code, distance = icao.nearest(-17.76, -179.99)
+        self.assertEqual(code, 'NFNA')
+        self.assertLess(distance, 200)
+
+    def test_table(self):
+        # icao.dat is in step with icao.txt, and reads back the same
+        source = icao.read_source()
+        self.assertEqual(list(icao.read_table()), list(source))
+        self.assertEqual(len(icao.data), len(source))
+        self.assertEqual(icao.data[-1], source[len(source) - 1])
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'icao.dat')
+            icao.write_table(source, path)
+            self.assertEqual(list(icao.read_table(path)), list(source))
+
+            with open(path, 'r+b') as f:
+                f.write(b'XXXX')
+            self.assertRaises(ValueError, icao.read_table, path)
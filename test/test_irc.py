@@ -2,9 +2,8 @@
 Tests for phenny's irc.py
 """
 
-import asyncore
+import asyncio
 import unittest
-import sys
 from mock import call, patch, Mock
 import irc
 
@@ -28,22 +27,51 @@ class OriginTest(unittest.TestCase):
         self.assertEqual(origin.host, 'bar.example.com')
         self.assertEqual(origin.sender, '#phenny')
 
+    def test_shared(self):
+        self.bot.nick = 'phenny'
+        source = "Foobar!foo@bar.example.com"
+
+        origin = irc.Origin.of(self.bot, source, ('PRIVMSG', 'phenny', 'hi'))
+        self.assertEqual(origin.sender, 'Foobar')
+        self.assertIs(irc.Origin.of(self.bot, source, ('PRIVMSG', 'phenny', 'again')), origin)
+
+        # tags differ from line to line
+        tagged = irc.Origin.of(self.bot, source, ('PRIVMSG', 'phenny'), {'account': 'foo'})
+        self.assertIsNot(tagged, origin)
+        self.assertEqual(tagged.tags, {'account': 'foo'})
+
+
+class MessageTest(unittest.TestCase):
+    def test_parse(self):
+        message = irc.Message.parse(b':nick!user@host PRIVMSG #phenny :hello :)\r')
+
+        self.assertEqual(message.tags, {})
+        self.assertEqual(message.source, 'nick!user@host')
+        self.assertEqual(message.command, 'PRIVMSG')
+        self.assertEqual(message.args, ('PRIVMSG', '#phenny', 'hello :)'))
+        self.assertEqual(message.text, 'hello :)')
+
+    def test_parse_no_trailing(self):
+        message = irc.Message.parse(memoryview(b'PING example.org'))
+
+        self.assertIsNone(message.source)
+        self.assertEqual(message.args, ('PING', 'example.org'))
+        self.assertEqual(message.text, '')
 
-if sys.version_info < (3, 5):
-    # https://bugs.python.org/issue13103
-    def async_getattr_hotfix(self, attr):
-        if attr == 'socket':
-            raise AttributeError
+    def test_parse_tags(self):
+        message = irc.Message.parse(b'@id=123;+draft/reply=a\\sb\\:c;flag :n!u@h TAGMSG #phenny')
 
-        return async_getattr_backup(self, attr)
+        self.assertEqual(message.tags, {'id': '123', '+draft/reply': 'a b;c', 'flag': ''})
+        self.assertEqual(message.args, ('TAGMSG', '#phenny'))
+
+    def test_parse_latin1(self):
+        message = irc.Message.parse(b'PRIVMSG #phenny :caf\xe9')
+        self.assertEqual(message.text, 'caf\xe9')
 
-    async_getattr_backup = asyncore.dispatcher.__getattr__
-    asyncore.dispatcher.__getattr__ = async_getattr_hotfix
 
 class BotTest(unittest.TestCase):
     @patch('threading.RLock')
-    @patch('asynchat.async_chat')
-    def setUp(self, mock_async, mock_thread):
+    def setUp(self, mock_thread):
         self.nick = 'foo'
         self.name = 'Phenny'
         self.bot = irc.Bot(self.nick, self.name, '#phenny')
@@ -68,21 +96,32 @@ class BotTest(unittest.TestCase):
     @patch('irc.Bot.push')
     def test_msg(self, mock_push):
         self.bot.msg('#phenny', 'hi')
+        self.assertTrue(self.bot.sender.join(5))
 
         mock_push.assert_called_once_with(b'PRIVMSG #phenny :hi\r\n')
 
-    @patch('time.sleep') # patch sleep so test runs faster
     @patch('irc.Bot.push')
-    def test_msgflood(self, mock_push, mock_sleep):
+    def test_msgflood(self, mock_push):
+        self.bot.sender.rate = 1000 # so test runs faster
         self.bot.msg('#phenny', 'flood')
         self.bot.msg('#phenny', 'flood')
         self.bot.msg('#phenny', 'flood')
         self.bot.msg('#phenny', 'flood')
         self.bot.msg('#phenny', 'flood')
         self.bot.msg('#phenny', 'flood')
+        self.assertTrue(self.bot.sender.join(5))
 
         mock_push.assert_called_with(b'PRIVMSG #phenny :...\r\n')
-        self.assertEqual(mock_sleep.call_count, 5)
+        self.assertEqual(mock_push.call_count, 6)
+
+    @patch('irc.Bot.push')
+    def test_msg_does_not_wait(self, mock_push):
+        for i in range(10):
+            self.bot.msg('#phenny', 'message %d' % i)
+
+        # the bucket only holds a few messages' worth
+        self.assertLess(mock_push.call_count, 10)
+        self.bot.sender.stop()
 
     @patch('irc.Bot.msg')
     def test_action(self, mock_msg):
@@ -96,3 +135,106 @@ class BotTest(unittest.TestCase):
         self.bot.proto.notice('jqh', notice)
 
         mock_write.assert_called_once_with(('NOTICE', 'jqh'), notice)
+
+    @patch('irc.Bot.handle_line')
+    def test_handle_read(self, mock_line):
+        lines = []
+        mock_line.side_effect = lines.append
+
+        self.bot.handle_read(b'PING a\r\nPING b\r\nPI')
+        self.bot.handle_read(b'NG c\r\n')
+
+        self.assertEqual(lines, ['PING a\r', 'PING b\r', 'PING c\r'])
+        self.assertEqual(self.bot.buffer, b'')
+
+    @patch('irc.Bot.handle_line')
+    def test_handle_read_mixed_encoding(self, mock_line):
+        lines = []
+        mock_line.side_effect = lines.append
+
+        self.bot.handle_read(b'PRIVMSG #a :caf\xc3\xa9\r\nPRIVMSG #a :caf\xe9\r\n')
+
+        self.assertEqual(lines, ['PRIVMSG #a :caf\xe9\r', 'PRIVMSG #a :caf\xe9\r'])
+
+    @patch('irc.Bot.dispatch')
+    def test_handle_line(self, mock_dispatch):
+        self.bot.handle_line(b'@time=2020-01-01T00:00:00Z :Foobar!foo@bar PRIVMSG #phenny :hi there\r')
+
+        origin, args, text = mock_dispatch.call_args[0]
+        self.assertEqual(args, ('PRIVMSG', '#phenny', 'hi there'))
+        self.assertEqual(text, 'hi there')
+        self.assertEqual(origin.nick, 'Foobar')
+        self.assertEqual(origin.sender, '#phenny')
+        self.assertEqual(origin.tags, {'time': '2020-01-01T00:00:00Z'})
+
+    def test_push_disconnected(self):
+        self.bot.push(b'PRIVMSG #phenny :hi\r\n')
+
+    def test_connection(self):
+        received = []
+
+        async def serve(reader, writer):
+            writer.write(b':server 001 foo :Welcome\r\nPING :example.org\r\n')
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                received.append(line)
+                if line.startswith(b'PONG'):
+                    writer.close()
+
+        async def session():
+            server = await asyncio.start_server(serve, '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                await asyncio.wait_for(self.bot.initiate_connect(
+                    '127.0.0.1', port, False, False, None), 5)
+
+        asyncio.run(session())
+
+        self.assertEqual(received, [
+            b'NICK foo\r\n',
+            b'USER foo +iw _ :Phenny\r\n',
+            b'PONG example.org\r\n',
+        ])
+
+
+class SenderTest(unittest.TestCase):
+    def setUp(self):
+        self.sender = irc.Sender(Mock())
+
+    def test_cost(self):
+        self.assertEqual(self.sender.cost(b'x' * 50), 0.8)
+        self.assertEqual(self.sender.cost(b'x' * 120), 1.8)
+
+    def test_round_robin(self):
+        for i in range(3):
+            self.sender.put(b'#busy', b'more %d' % i)
+        self.sender.put(b'#quiet', b'hi')
+        self.sender.tokens = self.sender.burst = 100
+
+        order = [self.sender.take(block=False) for i in range(4)]
+        self.assertEqual(order, [
+            (b'#busy', b'more 0'),
+            (b'#quiet', b'hi'),
+            (b'#busy', b'more 1'),
+            (b'#busy', b'more 2'),
+        ])
+
+    def test_bucket(self):
+        self.sender.put(b'#phenny', b'one')
+        self.sender.put(b'#phenny', b'two')
+        self.sender.tokens = 1.0
+        self.sender.rate = 0.001
+
+        self.assertEqual(self.sender.take(block=False), (b'#phenny', b'one'))
+        self.assertIsNone(self.sender.take(block=False))
+
+    def test_idle(self):
+        for i in range(3):
+            self.sender.put(b'#phenny', b'line %d' % i)
+        self.sender.updated -= 60
+        self.sender.rate = 0.001
+
+        self.assertEqual(self.sender.take(block=False), (b'#phenny', b'line 0'))
+        self.assertIsNone(self.sender.take(block=False))
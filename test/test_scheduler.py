@@ -0,0 +1,71 @@
+"""
+Tests for phenny's scheduler.py
+"""
+
+import threading
+import time
+import unittest
+import scheduler
+import workers
+
+
+class SchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = scheduler.Scheduler()
+        self.ran = []
+        self.done = threading.Event()
+
+    def tearDown(self):
+        self.scheduler.shutdown()
+
+    def record(self, value, last=False):
+        self.ran.append((value, time.time()))
+        if last:
+            self.done.set()
+
+    def test_order(self):
+        now = time.time()
+        self.scheduler.schedule(now + 0.2, self.record, ('c', True))
+        self.scheduler.schedule(now + 0.1, self.record, ('b',))
+        self.scheduler.schedule(now - 1, self.record, ('a',))
+
+        self.assertTrue(self.done.wait(2))
+        self.assertEqual([value for value, when in self.ran], ['a', 'b', 'c'])
+        self.assertLess(self.ran[-1][1] - (now + 0.2), 0.1)
+
+    def test_earlier_job_wakes_thread(self):
+        self.scheduler.call_later(60, self.record, ('late',))
+        time.sleep(0.05)
+        self.scheduler.call_later(0.05, self.record, ('early', True))
+
+        self.assertTrue(self.done.wait(2))
+        self.assertEqual([value for value, when in self.ran], ['early'])
+        self.assertEqual(self.scheduler.pending(), 1)
+
+    def test_cancel(self):
+        job = self.scheduler.call_later(0.05, self.record, ('cancelled',))
+        self.scheduler.call_later(0.1, self.record, ('kept', True))
+        job.cancel()
+
+        self.assertTrue(self.done.wait(2))
+        self.assertEqual([value for value, when in self.ran], ['kept'])
+
+    def test_errors(self):
+        self.scheduler.call_later(0, lambda: 1 / 0)
+        self.scheduler.call_later(0.05, self.record, ('after', True))
+
+        self.assertTrue(self.done.wait(2))
+
+    def test_blocking(self):
+        pool = workers.WorkerPool('scheduler', threads=1)
+        self.scheduler = scheduler.Scheduler(pool)
+        names = []
+
+        def blocking():
+            names.append(threading.current_thread().name)
+            self.done.set()
+
+        self.scheduler.call_later(0, blocking, name='mail', blocking=True)
+
+        self.assertTrue(self.done.wait(2))
+        self.assertEqual(names, ['mail'])
@@ -0,0 +1,102 @@
+"""
+Tests for phenny's snapshots.py
+"""
+
+import tempfile
+import unittest
+from mock import MagicMock, patch
+import snapshots
+import tools
+
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.dotdir, tools.dotdir = tools.dotdir, self.directory.name
+        self.debug, tools.debug = tools.debug, False
+
+        self.pages = {'https://example.org/a': 'a', 'https://example.org/b': 'b'}
+        patcher = patch('snapshots.web.get', side_effect=lambda url, cache: self.pages[url])
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.parse = MagicMock(side_effect=lambda a, b: a + b)
+        self.phenny = MagicMock()
+
+    def tearDown(self):
+        tools.dotdir = self.dotdir
+        tools.debug = self.debug
+        self.directory.cleanup()
+
+    def snapshot(self, version=1):
+        return snapshots.Snapshot('test', sorted(self.pages), self.parse, version=version)
+
+    def test_setup(self):
+        use = MagicMock()
+        snapshot = self.snapshot()
+        snapshot.setup(self.phenny, use)
+
+        use.assert_called_once_with(self.phenny, 'ab')
+        self.assertEqual(self.get.call_count, 2)
+        when = self.phenny.scheduler.schedule.call_args[0][0]
+        self.assertAlmostEqual(when, snapshot.time + snapshots.max_age)
+
+        # a restart loads the saved copy without fetching anything
+        self.get.reset_mock()
+        use.reset_mock()
+        self.snapshot().setup(self.phenny, use)
+
+        use.assert_called_once_with(self.phenny, 'ab')
+        self.get.assert_not_called()
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_version(self):
+        self.snapshot().refresh()
+        self.assertFalse(self.snapshot(version=2).load())
+        self.assertTrue(self.snapshot().load())
+
+    def test_refresh(self):
+        use = MagicMock()
+        snapshot = self.snapshot()
+        snapshot.setup(self.phenny, use)
+        use.reset_mock()
+
+        self.assertFalse(snapshot.refresh())
+        use.assert_not_called()
+        self.assertEqual(self.parse.call_count, 1)
+
+        self.pages['https://example.org/b'] = 'c'
+        self.assertTrue(snapshot.refresh())
+        use.assert_called_once_with(self.phenny, 'ac')
+        loaded = self.snapshot()
+        loaded.load()
+        self.assertEqual(loaded.data, 'ac')
+
+    def test_update_failure(self):
+        snapshot = self.snapshot()
+        self.get.side_effect = OSError('unreachable')
+        scheduler = MagicMock()
+
+        with patch('snapshots.logger'):
+            snapshot.update(scheduler)
+
+        when = scheduler.schedule.call_args[0][0]
+        self.assertGreater(when, snapshots.time.time() + snapshots.retry_delay - 5)
+        self.assertIsNone(snapshot.data)
+
+    def test_new_scheduler(self):
+        snapshot = self.snapshot()
+        snapshot.setup(self.phenny, MagicMock())
+        snapshot.setup(self.phenny, MagicMock())
+        old = self.phenny.scheduler
+        self.assertEqual(old.schedule.call_count, 1)
+
+        # after a reconnect, the job moves to the new bot's scheduler
+        phenny = MagicMock()
+        snapshot.setup(phenny, MagicMock())
+        old.schedule.return_value.cancel.assert_called_once_with()
+        self.assertEqual(phenny.scheduler.schedule.call_count, 1)
+
+        # and a run left on the old one doesn't schedule itself again
+        snapshot.update(old)
+        self.assertEqual(old.schedule.call_count, 1)
@@ -2,6 +2,9 @@
 Tests for phenny's tools.py
 """
 
+import os
+import tempfile
+import mock
 import unittest
 import tools
 
@@ -35,3 +38,144 @@ class ToolsTest(unittest.TestCase):
         "labore et dolore magna aliquyam erat, sed diam voluptua."
         truncated = "Lorem ipsum dolor sit amet, consetetur sadipscing elitr, sed diam nonumy eirmod tempor invidunt..."
         self.assertEqual(tools.truncate(text, max_length=100), truncated)
+
+
+class DatabaseCursorTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.db')
+
+    def tearDown(self):
+        tools.database_pool.close()
+        self.directory.cleanup()
+
+    def test_reuse(self):
+        with tools.DatabaseCursor(self.path) as cursor:
+            cursor.execute('create table t (x int)')
+            first = cursor.connection
+
+        with tools.DatabaseCursor(self.path) as cursor:
+            cursor.execute('insert into t values (1)')
+            self.assertIs(cursor.connection, first)
+            cursor.execute('pragma journal_mode')
+            self.assertEqual(cursor.fetchone()[0], 'wal')
+
+        stats = tools.database_stats[self.path]
+        self.assertEqual(stats['uses'], 2)
+        self.assertEqual(stats['connects'], 1)
+
+    def test_replaced_file(self):
+        with tools.DatabaseCursor(self.path) as cursor:
+            cursor.execute('create table t (x int)')
+
+        tools.database_pool.connections[self.path][0].close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
+
+        with tools.DatabaseCursor(self.path) as cursor:
+            cursor.execute('create table t (x int)')
+
+
+class DatabaseTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.store.db')
+        self.debug, tools.debug = tools.debug, False
+
+    def tearDown(self):
+        tools.debug = self.debug
+        tools.database_pool.close()
+        self.directory.cleanup()
+
+    def rows(self):
+        with tools.DatabaseCursor(self.path) as cursor:
+            cursor.execute('select count(*) from items')
+            return cursor.fetchone()[0]
+
+    def test_round_trip(self):
+        db = tools.Database(self.path)
+        db['a'] = [1, 2]
+        db[3] = {'owner': 'x'}
+        db.commit()
+
+        self.assertEqual(tools.Database(self.path), {'a': [1, 2], 3: {'owner': 'x'}})
+
+    def test_commit_keys(self):
+        db = tools.Database(self.path)
+        db['a'] = 1
+        db['b'] = 2
+        db.commit('a')
+
+        self.assertEqual(tools.Database(self.path), {'a': 1})
+
+        del db['a']
+        db.commit('a', 'b')
+
+        self.assertEqual(tools.Database(self.path), {'b': 2})
+        self.assertEqual(self.rows(), 1)
+
+    def test_commit_all(self):
+        db = tools.Database(self.path)
+        db.update({'a': 1, 'b': 2})
+        db.commit()
+
+        db.pop('a')
+        db['b'] = 3
+        db.commit()
+
+        self.assertEqual(tools.Database(self.path), {'b': 3})
+
+    def test_hooks(self):
+        class Keys(tools.Database):
+            def __init__(self, path=None):
+                self.keys_seen = set()
+                tools.Database.__init__(self, path)
+
+            def on_set(self, key):
+                self.keys_seen.add(key)
+
+            def on_delete(self, key):
+                self.keys_seen.discard(key)
+
+        db = Keys(self.path)
+        db.update(a=1, b=2)
+        db.setdefault('c', 3)
+        db['d'] = 4
+        db.commit()
+
+        self.assertEqual(Keys(self.path).keys_seen, {'a', 'b', 'c', 'd'})
+
+        del db['a']
+        db.pop('b')
+        db.popitem()
+        self.assertEqual(db.keys_seen, set(db))
+
+        db.clear()
+        self.assertEqual(db.keys_seen, set())
+
+    def test_write_obj(self):
+        path = os.path.join(self.directory.name, 'test.db')
+        tools.write_obj(path, {'a': 1})
+        tools.write_obj(path, ['b'])
+
+        self.assertEqual(tools.read_obj(path), ['b'])
+        self.assertEqual(os.listdir(self.directory.name), ['test.db'])
+
+    def test_migrate(self):
+        phenny = mock.MagicMock()
+        phenny.nick = 'phenny'
+        phenny.config.host = 'example.net'
+
+        dotdir, tools.dotdir = tools.dotdir, self.directory.name
+        try:
+            tools.write_obj(tools.db_path(phenny, 'tell'), {'nick': [('a', 'tell', 'now', 'hi')]})
+
+            db = tools.open_db(phenny, 'tell')
+            self.assertEqual(db, {'nick': [('a', 'tell', 'now', 'hi')]})
+            self.assertTrue(os.path.exists(tools.db_path(phenny, 'tell') + '.migrated'))
+            self.assertFalse(os.path.exists(tools.db_path(phenny, 'tell')))
+
+            self.assertEqual(tools.read_db(phenny, 'tell'), db)
+        finally:
+            tools.dotdir = dotdir
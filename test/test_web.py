@@ -0,0 +1,211 @@
+"""
+Tests for phenny's web.py
+"""
+
+import http.server
+import threading
+import time
+import unittest
+import web
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    failures = 0
+    busy = 0
+    most_busy = 0
+    lock = threading.Lock()
+
+    pages = {
+        '/page': ('text/html', b'<html><head><meta charset="iso-8859-1">'
+                               b'<TITLE>caf\xe9</TITLE></head>' + b'x' * 1000000),
+        '/zip': ('application/zip', b'PK' * 1000000),
+    }
+
+    def do_GET(self):
+        content_type = 'text/plain; charset=utf-8'
+
+        if self.path == '/flaky' and Handler.failures:
+            Handler.failures -= 1
+            status, body = 503, b'busy'
+        elif self.path == '/moved':
+            self.send_response(301)
+            self.send_header('Location', '/page')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        elif self.path.startswith('/slow/'):
+            with Handler.lock:
+                Handler.busy += 1
+                Handler.most_busy = max(Handler.most_busy, Handler.busy)
+            time.sleep(0.2)
+            with Handler.lock:
+                Handler.busy -= 1
+            status, body = 200, self.path.encode('utf-8')
+        elif self.path in self.pages:
+            status = 200
+            content_type, body = self.pages[self.path]
+        else:
+            status, body = 200, self.path.encode('utf-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            # the client stopped reading
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+class WebTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+        self.url = 'http://127.0.0.1:%d' % self.server.server_port
+        self.session, web.session = web.session, web.new_session()
+        web.host_stats.clear()
+
+    def tearDown(self):
+        web.session.close()
+        web.session = self.session
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keep_alive(self):
+        self.assertEqual(web.get(self.url + '/a'), '/a')
+        self.assertEqual(web.get(self.url + '/b'), '/b')
+
+        stats = web.stats()['127.0.0.1']
+        self.assertEqual(stats['requests'], 2)
+        self.assertEqual(stats['handshakes'], 1)
+        self.assertEqual(stats['pool_hits'], 1)
+        self.assertGreater(stats['time'], 0)
+
+    def test_retry(self):
+        Handler.failures = 1
+        self.assertEqual(web.get(self.url + '/flaky'), '/flaky')
+
+        Handler.failures = 5
+        with self.assertRaises(web.HTTPError):
+            web.get(self.url + '/flaky')
+
+        Handler.failures = 0
+
+    def test_peek(self):
+        headers, text = web.peek(self.url + '/moved', 65536, until=b'</title')
+
+        self.assertEqual(headers['Content-Type'], 'text/html')
+        self.assertIn('<TITLE>caf\xe9</TITLE>', text)
+        # stopped after the first chunk
+        self.assertLessEqual(len(text), 4096)
+
+        headers, text = web.peek(self.url + '/page', 100)
+        self.assertEqual(len(text), 100)
+
+    def test_peek_types(self):
+        headers, text = web.peek(self.url + '/zip', 65536, types=('/html',))
+        self.assertIsNone(text)
+
+    def test_sniff_encoding(self):
+        self.assertEqual(web.sniff_encoding('text/html; charset="Shift_JIS"', b''), 'shift_jis')
+        self.assertEqual(web.sniff_encoding('text/html', b'<meta http-equiv="Content-Type" '
+                                            b'content="text/html; charset=koi8-r">'), 'koi8-r')
+        self.assertEqual(web.sniff_encoding('text/html; charset=bogus', b''), 'utf-8')
+
+    def test_fetch_all(self):
+        urls = [self.url + '/slow/%d' % i for i in range(6)]
+        Handler.most_busy = 0
+
+        start = time.perf_counter()
+        results = dict(web.fetch_all(urls, parse=str.upper, per_host=3))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, {url: '/SLOW/%d' % i for i, url in enumerate(urls)})
+        self.assertEqual(Handler.most_busy, 3)
+        self.assertLess(elapsed, 1.0)
+
+    def test_fetch_all_error(self):
+        def parse(text):
+            raise ValueError(text)
+
+        with self.assertRaises(ValueError):
+            list(web.fetch_all([self.url + '/a'], parse=parse))
+
+    def test_headers_unchanged(self):
+        headers = {'Accept': 'text/plain'}
+        web.get(self.url + '/', headers=headers)
+        self.assertEqual(headers, {'Accept': 'text/plain'})
+
+
+class SingleFlightTest(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.calls = []
+
+    def slow(self, value):
+        self.calls.append(value)
+        self.release.wait(5)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    def run_concurrently(self, flight, key, value, count=5):
+        results = []
+
+        def call():
+            try:
+                results.append(flight.do(key, self.slow, value))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=call) for i in range(count)]
+        for thread in threads:
+            thread.start()
+
+        while flight.stats['calls'] + flight.stats['shared'] < count:
+            time.sleep(0.01)
+        self.release.set()
+
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_shared(self):
+        flight = web.SingleFlight()
+        results = self.run_concurrently(flight, 'key', 'value')
+
+        self.assertEqual(results, ['value'] * 5)
+        self.assertEqual(self.calls, ['value'])
+        self.assertEqual(flight.stats['shared'], 4)
+
+        # nothing is kept afterwards without memo
+        self.assertEqual(flight.do('key', self.slow, 'again'), 'again')
+
+    def test_shared_error(self):
+        error = ValueError('down')
+        results = self.run_concurrently(web.SingleFlight(), 'key', error)
+
+        self.assertEqual(results, [error] * 5)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_memo(self):
+        self.release.set()
+        flight = web.SingleFlight(memo=60, memo_size=1)
+
+        self.assertEqual(flight.do('a', self.slow, 1), 1)
+        self.assertEqual(flight.do('a', self.slow, 2), 1)
+        self.assertEqual(flight.do('b', self.slow, 3), 3)
+        self.assertEqual(flight.do('a', self.slow, 4), 4)
+        self.assertEqual(flight.stats['memo_hits'], 1)
+
+    def test_normalize_url(self):
+        self.assertEqual(web.normalize_url('HTTPS://Example.ORG#top'), 'https://example.org/')
+        self.assertEqual(web.normalize_url('https://example.org/a?b=c'), 'https://example.org/a?b=c')
@@ -0,0 +1,96 @@
+"""
+Tests for phenny's workers.py
+"""
+
+import threading
+import unittest
+from mock import Mock
+import workers
+
+
+class WorkerPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.pools = []
+
+    def tearDown(self):
+        self.release.set()
+        for pool in self.pools:
+            pool.shutdown()
+
+    def blocked_pool(self, **kwargs):
+        # one worker, stuck on a job until release is set
+        pool = workers.WorkerPool('test', threads=1, queue=2, **kwargs)
+        self.pools.append(pool)
+        started = threading.Event()
+
+        def block():
+            started.set()
+            self.release.wait(5)
+
+        pool.submit(block)
+        started.wait(5)
+        return pool
+
+    def test_runs_jobs(self):
+        pool = workers.WorkerPool('test', threads=2)
+        self.pools.append(pool)
+        done = threading.Event()
+        names = []
+
+        def job(arg):
+            names.append(threading.current_thread().name)
+            done.set()
+
+        self.assertTrue(pool.submit(job, ('x',), name='handler'))
+        self.assertTrue(done.wait(5))
+        self.assertEqual(names, ['handler'])
+
+    def test_drop(self):
+        pool = self.blocked_pool()
+        self.assertTrue(pool.submit(Mock()))
+        self.assertTrue(pool.submit(Mock()))
+        self.assertFalse(pool.submit(Mock()))
+        self.assertEqual(pool.dropped, 1)
+        self.assertEqual(len(pool.threads), 1)
+
+    def test_coalesce(self):
+        pool = self.blocked_pool(overflow='coalesce')
+        first, second = Mock(), Mock()
+        pool.submit(first, key=('snarfuri', '#a'))
+        pool.submit(Mock(), key=('snarfuri', '#b'))
+
+        self.assertTrue(pool.submit(second, key=('snarfuri', '#a')))
+        self.assertFalse(pool.submit(Mock(), key=('snarfuri', '#c')))
+        self.assertEqual(pool.jobs[0][2], second)
+        self.assertEqual(pool.coalesced, 1)
+
+    def test_busy(self):
+        pool = self.blocked_pool(overflow='busy')
+        busy = Mock()
+        pool.submit(Mock(), busy=busy)
+        pool.submit(Mock(), busy=busy)
+        pool.submit(Mock(), busy=busy)
+
+        busy.assert_called_once_with()
+
+    def test_bad_policy(self):
+        self.assertRaises(ValueError, workers.WorkerPool, 'test', overflow='panic')
+
+
+class ExecutorTest(unittest.TestCase):
+    def test_pools(self):
+        class MockConfig(object):
+            workers = 2
+            worker_pools = {'head': {'threads': 1, 'overflow': 'coalesce'}}
+
+        executor = workers.Executor(MockConfig)
+        snarfuri = Mock(__module__='head', priority='low')
+        seen = Mock(__module__='seen', priority='low')
+
+        self.assertEqual(executor.pool(snarfuri).name, 'head')
+        self.assertEqual(executor.pool(snarfuri).size, 1)
+        self.assertEqual(executor.pool(snarfuri).overflow, 'coalesce')
+        self.assertEqual(executor.pool(seen).name, 'low')
+        self.assertEqual(executor.pool(seen).size, 2)
+        self.assertIs(executor.pool(seen), executor.pool(seen))
@@ -10,6 +10,7 @@ http://inamidst.com/phenny/
 import os
 import re
 import base64
+import contextlib
 import sqlite3
 import logging
 from requests.exceptions import ConnectionError, HTTPError, Timeout
@@ -17,7 +18,9 @@ import socket
 import socketserver
 import pickle
 import inspect
-from time import time
+import tempfile
+import threading
+from time import perf_counter, time
 
 logger = logging.getLogger('phenny')
 
@@ -50,8 +53,20 @@ def write_obj(path, data):
     if debug:
         return
 
-    with open(path, 'wb') as f:
-        pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+    # write a new file and rename it over the old one, so a crash mid-write
+    # leaves the old data intact
+    directory, filename = os.path.split(path)
+    with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=filename + '.',
+                                     suffix='.tmp', delete=False) as f:
+        try:
+            pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            os.remove(f.name)
+            raise
+
+    os.replace(f.name, path)
 
 def read_obj(path, warn_after=None):
     if debug:
@@ -75,43 +90,270 @@ def read_obj(path, warn_after=None):
 def db_path(self, name):
     return dot_path('%s-%s.%s.db' % (self.nick, self.config.host, name))
 
+def store_path(self, name):
+    return dot_path('%s-%s.%s.store.db' % (self.nick, self.config.host, name))
+
+def open_db(self, name, cls=None):
+    """The Database (or subclass cls) called name, empty if there isn't one yet.
+
+    The first time, the contents of an old whole-pickle database of the same
+    name are moved over, and the pickle is renamed to *.migrated."""
+    cls = cls or Database
+
+    if debug:
+        return cls()
+
+    path = store_path(self, name)
+    if os.path.exists(path):
+        return cls(path)
+
+    old_path = db_path(self, name)
+    try:
+        data = read_obj(old_path)
+    except GrumbleError:
+        data = None
+
+    database = cls(path)
+    if isinstance(data, dict):
+        logger.info('Migrating %s to %s' % (old_path, path))
+        database.update(data)
+        database.commit()
+        os.replace(old_path, old_path + '.migrated')
+
+    return database
+
 def write_db(self, name, data, **kwargs):
-    write_obj(db_path(self, name), data, **kwargs)
+    if isinstance(data, Database):
+        data.commit()
+    elif isinstance(data, dict):
+        database = open_db(self, name)
+        database.clear()
+        database.update(data)
+        database.commit()
+    else:
+        write_obj(db_path(self, name), data, **kwargs)
 
 def read_db(self, name, **kwargs):
-    return read_obj(db_path(self, name), **kwargs)
+    if debug:
+        raise GrumbleError()
 
-def cache_path(name):
-    return dot_path('cache/' + urlsafe_encode(name))
+    if os.path.exists(store_path(self, name)):
+        return open_db(self, name)
 
-def write_cache(name, data):
-    write_obj(cache_path(name), data)
+    data = read_obj(db_path(self, name), **kwargs)
+    if isinstance(data, dict):
+        return open_db(self, name)
+    return data
 
-def read_cache(name):
-    path = cache_path(name)
-    thirty_days = 30*24*60*60
+# seconds a connection waits on a locked database before giving up
+database_timeout = 10
 
-    try:
-        return read_obj(path, warn_after=thirty_days)
-    except (GrumbleError, ResourceWarning):
-        return None
+# per database file: {'uses', 'connects', 'time', 'max'}, times in seconds
+database_stats = {}
+database_stats_lock = threading.Lock()
+
+class DatabasePool(threading.local):
+    """One open connection per database file per thread.
+
+    Connections are checked against the file on disk before reuse, so a
+    database that was deleted or replaced gets a fresh connection."""
+
+    def __init__(self):
+        self.connections = {}
+
+    def connect(self, path):
+        try:
+            stat = os.stat(path)
+            identity = (stat.st_dev, stat.st_ino)
+        except OSError:
+            identity = None
+
+        cached = self.connections.get(path)
+        if cached and identity and cached[1] == identity:
+            return cached[0], False
+
+        if cached:
+            cached[0].close()
+
+        connection = sqlite3.connect(
+            path,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            timeout=database_timeout
+        )
+        connection.execute('pragma journal_mode=wal')
+
+        if identity is None:
+            stat = os.stat(path)
+            identity = (stat.st_dev, stat.st_ino)
+
+        self.connections[path] = (connection, identity)
+        return connection, True
+
+    def close(self):
+        for connection, identity in self.connections.values():
+            connection.close()
+        self.connections.clear()
+
+database_pool = DatabasePool()
+
+def record_database_use(path, elapsed, connected):
+    with database_stats_lock:
+        stats = database_stats.setdefault(path, {'uses': 0, 'connects': 0, 'time': 0.0, 'max': 0.0})
+        stats['uses'] += 1
+        stats['connects'] += connected
+        stats['time'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
 
 class DatabaseCursor():
     def __init__(self, path):
         self.path = path
 
     def __enter__(self):
-        self.connection = sqlite3.connect(
-            self.path,
-            detect_types=sqlite3.PARSE_DECLTYPES,
-            isolation_level=None
-        )
+        self.started = perf_counter()
+
+        if self.path == ':memory:':
+            self.connection = sqlite3.connect(
+                self.path,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+                isolation_level=None
+            )
+            self.connected = True
+        else:
+            self.connection, self.connected = database_pool.connect(self.path)
+
         self.cursor = self.connection.cursor()
         return self.cursor
 
     def __exit__(self, *args):
         self.cursor.close()
-        self.connection.close()
+
+        if self.connection.in_transaction:
+            # don't leave a half-done transaction on a shared connection
+            self.connection.rollback()
+
+        if self.path == ':memory:':
+            self.connection.close()
+        else:
+            record_database_use(self.path, perf_counter() - self.started, self.connected)
+
+class Database(dict):
+    """A dict kept in SQLite, one row per key.
+
+    Changes are written by commit(), which takes the keys that changed; keys
+    no longer in the dict are deleted. Without arguments it checks every key
+    but still only writes the ones that differ from what's on disk. Without
+    a path nothing is ever written.
+
+    Subclasses that index the keys override on_set and on_delete, which
+    every method that adds or removes a key calls."""
+
+    def __init__(self, path=None):
+        dict.__init__(self)
+        self.path = path
+        # pickled key -> pickled value, as last written
+        self.stored = {}
+        self.lock = threading.RLock()
+
+        if path is None:
+            return
+
+        with DatabaseCursor(path) as cursor:
+            cursor.execute('''create table if not exists items (
+                key     blob primary key,
+                value   blob
+            );''')
+            cursor.execute('select key, value from items')
+
+            for key, value in cursor.fetchall():
+                dict.__setitem__(self, pickle.loads(key), pickle.loads(value))
+                self.stored[key] = value
+
+        for key in self:
+            self.on_set(key)
+
+    def on_set(self, key):
+        """Called after key is set, whether or not it was there before."""
+        pass
+
+    def on_delete(self, key):
+        """Called after key is removed."""
+        pass
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self.on_set(key)
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self.on_delete(key)
+
+    def pop(self, key, *default):
+        if key not in self:
+            return dict.pop(self, key, *default)
+
+        value = dict.pop(self, key)
+        self.on_delete(key)
+        return value
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.on_delete(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        keys = list(self)
+        dict.clear(self)
+        for key in keys:
+            self.on_delete(key)
+
+    @staticmethod
+    def dumps(obj):
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def commit(self, *keys):
+        with self.lock:
+            if not keys:
+                keys = list(self) + [pickle.loads(key) for key in self.stored]
+
+            upserts, deletes = {}, set()
+            for key in keys:
+                pickled = self.dumps(key)
+                if key in self:
+                    value = self.dumps(self[key])
+                    if self.stored.get(pickled) != value:
+                        upserts[pickled] = value
+                elif pickled in self.stored:
+                    deletes.add(pickled)
+
+            if not (upserts or deletes):
+                return
+
+            if self.path is not None and not debug:
+                with DatabaseCursor(self.path) as cursor:
+                    cursor.execute('begin')
+                    cursor.executemany('insert or replace into items (key, value) values (?, ?)',
+                                       upserts.items())
+                    cursor.executemany('delete from items where key = ?',
+                                       [(key,) for key in deletes])
+                    cursor.execute('commit')
+
+            self.stored.update(upserts)
+            for key in deletes:
+                del self.stored[key]
 
 socketserver.TCPServer.allow_reuse_address = True
 
@@ -219,8 +461,15 @@ class GrumbleError(Exception):
 def rephrase_errors(fn, *args, **kw):
     '''Simplfiy error messages for well-known exceptions'''
 
-    try:
+    with rephrased_errors():
         return fn(*args, **kw)
+
+@contextlib.contextmanager
+def rephrased_errors():
+    '''Like rephrase_errors, for code that can't be wrapped in a call'''
+
+    try:
+        yield
     except ConnectionError as e:
         raise GrumbleError("Can't connect to %s" % e.request.url)
     except HTTPError as e:
@@ -5,6 +5,9 @@ Author: Sean B. Palmer, inamidst.com
 About: http://inamidst.com/phenny/
 """
 
+import codecs
+import collections
+import concurrent.futures
 import functools
 import re
 import urllib
@@ -12,13 +15,19 @@ import requests
 import lxml.html as lhtml
 import unittest
 import inspect
+import os
 import socket
-from time import time
+import threading
+import weakref
+from time import perf_counter, time
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
 from html.entities import name2codepoint
-from urllib.parse import quote, unquote
-from tools import read_cache, write_cache
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+import httpcache
+from tools import dot_path
 from requests.packages import urllib3
+from urllib3.util.retry import Retry
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -30,6 +39,160 @@ default_headers = {'User-Agent': user_agent}
 
 up_down = {}
 
+# connections kept open per host, and how failed requests are retried:
+# connection errors and 502/503/504 on GET and HEAD, backing off 0.5s, 1s
+pool_size = 10
+retries = Retry(total=2, read=1, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']), raise_on_status=False)
+
+# per host: {'requests', 'handshakes', 'time', 'max'}, times in seconds
+host_stats = {}
+host_stats_lock = threading.Lock()
+
+def host_stat(host):
+    return host_stats.setdefault(host, {'requests': 0, 'handshakes': 0, 'time': 0.0, 'max': 0.0})
+
+def record_handshake(host):
+    with host_stats_lock:
+        host_stat(host)['handshakes'] += 1
+
+def record_request(host, elapsed):
+    with host_stats_lock:
+        stats = host_stat(host)
+        stats['requests'] += 1
+        stats['time'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+
+def stats():
+    """Per host counters, with pool_hits: requests that reused a connection."""
+    with host_stats_lock:
+        return {host: dict(stats, pool_hits=max(0, stats['requests'] - stats['handshakes']))
+                for host, stats in host_stats.items()}
+
+class CountingHTTPConnectionPool(urllib3.HTTPConnectionPool):
+    def _new_conn(self):
+        record_handshake(self.host)
+        return urllib3.HTTPConnectionPool._new_conn(self)
+
+class CountingHTTPSConnectionPool(urllib3.HTTPSConnectionPool):
+    def _new_conn(self):
+        record_handshake(self.host)
+        return urllib3.HTTPSConnectionPool._new_conn(self)
+
+class PooledAdapter(HTTPAdapter):
+    """Keeps a pool of keep-alive connections per host and counts the new
+    connections (TCP and TLS handshakes) each host needed."""
+
+    def __init__(self):
+        HTTPAdapter.__init__(self, pool_connections=pool_size, pool_maxsize=pool_size,
+                             max_retries=retries)
+
+    def init_poolmanager(self, *args, **kwargs):
+        HTTPAdapter.init_poolmanager(self, *args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+def new_session():
+    session = requests.Session()
+    adapter = PooledAdapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# shared by every module; requests sessions are safe to use from many threads
+session = new_session()
+
+# every SingleFlight, so their memos can be dropped together
+single_flights = weakref.WeakSet()
+
+class SingleFlight(object):
+    """Runs at most one call per key at a time. Callers asking for a key
+    that is already being fetched wait for that call and share its result,
+    or its exception. With memo, results are also reused for that many
+    seconds afterwards (for up to memo_size keys)."""
+
+    class Call(object):
+        __slots__ = ('done', 'result', 'error')
+
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self, memo=0, memo_size=256):
+        self.memo = memo
+        self.memo_size = memo_size
+        self.calls = {}
+        self.results = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = {'calls': 0, 'shared': 0, 'memo_hits': 0}
+        single_flights.add(self)
+
+    def forget(self):
+        with self.lock:
+            self.results.clear()
+
+    def do(self, key, fn, *args, **kwargs):
+        with self.lock:
+            if key in self.results:
+                expires, result = self.results[key]
+                if expires > time():
+                    self.stats['memo_hits'] += 1
+                    return result
+                del self.results[key]
+
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = self.Call()
+                self.stats['calls'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+                if self.memo and call.error is None:
+                    self.results[key] = (time() + self.memo, call.result)
+                    while len(self.results) > self.memo_size:
+                        self.results.popitem(last=False)
+            call.done.set()
+
+        return call.result
+
+def normalize_url(url):
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    return urlunsplit((scheme.lower(), netloc.lower(), path or '/', query, ''))
+
+# concurrent identical get()s share one request
+in_flight = SingleFlight()
+
+# for get(cache=True); see httpcache.py
+http_cache = httpcache.HTTPCache(lambda: dot_path('cache/http.db'))
+
+def request(method, url, headers={}, timeout=REQUEST_TIMEOUT, **kwargs):
+    """session.request with our headers and timeout, recording latency per host."""
+    headers = dict(headers, **default_headers)
+
+    started = perf_counter()
+    try:
+        return session.request(method, url, headers=headers, timeout=timeout, **kwargs)
+    finally:
+        record_request(urlsplit(url).hostname, perf_counter() - started)
+
 class ServerFault(Exception):
     def __init__(self, description):
         self.description = description
@@ -49,17 +212,26 @@ def is_up(url):
 
     if (url not in up_down) or (time() - up_down[url][1] > 600):
         try:
-            requests.get(url, timeout=REQUEST_TIMEOUT).raise_for_status()
+            request('GET', url).raise_for_status()
             up_down[url] = (True, time())
         except (HTTPError, ConnectionError, Timeout):
             up_down[url] = (False, time())
     return up_down[url][0]
 
 def catch_timeout(fn):
+    # with PHENNY_CASSETTES set to a directory, each wrapped test records its
+    # requests there on the first run and replays them after; see cassettes.py
     @functools.wraps(fn)
     def wrapper(*args, **kw):
         try:
-            return fn(*args, **kw)
+            directory = os.environ.get('PHENNY_CASSETTES')
+            if not directory:
+                return fn(*args, **kw)
+
+            import cassettes
+            name = '%s.%s.json' % (fn.__module__, fn.__qualname__)
+            with cassettes.use(os.path.join(directory, name)):
+                return fn(*args, **kw)
         except (ConnectionError, HTTPError, ServerFault, Timeout):
             raise unittest.SkipTest("The server is apparently down. Skipping test.")
 
@@ -73,7 +245,7 @@ def with_scraped_page(url, **kw):
                 doc = lhtml.document_fromstring(get(url, cache=True, **kw))
                 return fn(doc, *args, **kw)
             except Exception:
-                write_cache(url, None)
+                http_cache.invalidate(url)
                 doc = lhtml.document_fromstring(get(url, cache=True, **kw))
                 return fn(doc, *args, **kw)
 
@@ -89,7 +261,6 @@ def with_scraped_page_no_cache(url, **kw):
                 doc = lhtml.document_fromstring(get(url, cache=False, **kw))
                 return fn(doc, *args, **kw)
             except Exception:
-                write_cache(url, None)
                 doc = lhtml.document_fromstring(get(url, cache=False, **kw))
                 return fn(doc, *args, **kw)
 
@@ -101,18 +272,20 @@ def get(url, cache=False, headers={}, verify=True, timeout=REQUEST_TIMEOUT, **kw
     if not url.startswith('http'):
         return
 
-    if cache:
-        response = read_cache(url)
-    else:
-        response = None
+    key = (normalize_url(url), cache, tuple(sorted(headers.items())), verify,
+           repr(sorted(kwargs.items())))
+    return in_flight.do(key, fetch_text, url, cache, headers, verify, timeout, **kwargs)
 
-    if not response:
-        headers.update(default_headers)
-        response = requests.get(url, headers=headers, verify=verify, timeout=timeout, **kwargs)
-        response.raise_for_status()
+def fetch_text(url, cache, headers, verify, timeout, **kwargs):
+    def fetch(extra={}):
+        return request('GET', url, headers=dict(headers, **extra), verify=verify,
+                       timeout=timeout, **kwargs)
 
     if cache:
-        write_cache(url, response)
+        response = http_cache.get(url, fetch)
+    else:
+        response = fetch()
+        response.raise_for_status()
 
     # Fix charset if necessary
     if 'Content-Type' in response.headers:
@@ -135,19 +308,112 @@ def get(url, cache=False, headers={}, verify=True, timeout=REQUEST_TIMEOUT, **kw
                     return response.text
     return response.text
 
+# fan-out fetches: threads per call, and requests in flight to any one host
+fan_out_threads = 8
+fan_out_per_host = 4
+
+def fetch_all(urls, parse=None, cache=False, threads=fan_out_threads, per_host=fan_out_per_host, **kwargs):
+    """Fetch urls concurrently and yield (url, parse(text)) pairs in the order
+    they finish. Pages are parsed on the fetching threads; an error fetching
+    or parsing one is raised when its turn comes."""
+    urls = list(urls)
+    if not urls:
+        return
+
+    hosts = {urlsplit(url).netloc.lower(): threading.BoundedSemaphore(per_host) for url in urls}
+
+    def fetch(url):
+        with hosts[urlsplit(url).netloc.lower()]:
+            text = get(url, cache=cache, **kwargs)
+        return text if parse is None else parse(text)
+
+    # more threads than the hosts will take at once would only sit waiting
+    pool = concurrent.futures.ThreadPoolExecutor(min(threads, len(urls), per_host * len(hosts)),
+                                                 thread_name_prefix='fetch')
+    futures = {pool.submit(fetch, url): url for url in urls}
+
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+r_meta_charset = re.compile(rb'''<meta[^>]+charset\s*=\s*["']?([A-Za-z0-9._:-]+)''', re.I)
+
+def sniff_encoding(content_type, data):
+    """The charset from a Content-Type header, else from a BOM or <meta> in the
+    first kilobyte of an HTML document, else utf-8."""
+    candidates = []
+
+    _, _, charset = content_type.partition('charset=')
+    if charset:
+        candidates.append(charset.split(';')[0].strip(' "\''))
+
+    if data.startswith(codecs.BOM_UTF8):
+        candidates.append('utf-8-sig')
+    elif data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        candidates.append('utf-16')
+
+    match = r_meta_charset.search(data[:1024])
+    if match:
+        candidates.append(match.group(1).decode('ascii'))
+
+    for name in candidates:
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            continue
+    return 'utf-8'
+
+def peek(uri, limit, until=None, types=None, headers={}, verify=True, timeout=REQUEST_TIMEOUT):
+    """Stream the start of uri, following redirects over the pooled connection,
+    and stop after limit bytes or once until (bytes, any case) has been read.
+
+    Returns the final response's headers and the decoded text, or None for
+    the text if types is given and no element of it is in the Content-Type,
+    in which case the body isn't read at all."""
+    response = request('GET', uri, headers=headers, verify=verify, timeout=timeout, stream=True)
+
+    try:
+        response.raise_for_status()
+
+        content_type = response.headers.get('Content-Type', '')
+        if types is not None and not any(t in content_type for t in types):
+            return response.headers, None
+
+        data = bytearray()
+        if until is not None:
+            r_until = re.compile(re.escape(until), re.I)
+
+        for chunk in response.iter_content(4096):
+            searched = max(0, len(data) - len(until)) if until else 0
+            data += chunk
+
+            if len(data) >= limit:
+                break
+            if until is not None and r_until.search(data, searched):
+                break
+    finally:
+        # anything left unread means this connection can't be reused
+        response.close()
+
+    data = bytes(data[:limit])
+    return response.headers, data.decode(sniff_encoding(content_type, data), 'replace')
+
 def head(uri, headers={}, verify=True, **kwargs): 
     if not uri.startswith('http'): 
         return
-    headers.update(default_headers)
-    r = requests.head(uri, headers=headers, verify=verify, **kwargs)
+    kwargs.setdefault('allow_redirects', False)
+    r = request('HEAD', uri, headers=headers, verify=verify, **kwargs)
     r.raise_for_status()
     return r.headers
 
 def post(uri, data, headers={}, verify=True, **kwargs): 
     if not uri.startswith('http'): 
         return
-    headers.update(default_headers)
-    r = requests.post(uri, data=data, headers=headers, verify=verify, **kwargs)
+    r = request('POST', uri, data=data, headers=headers, verify=verify, **kwargs)
     r.raise_for_status()
     return r.text
 
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+workers.py - Phenny Worker Pools
+
+Threaded handlers run on a fixed number of worker threads per pool instead of
+a new thread per matched line. Each pool has a bounded queue; what happens to
+a job that doesn't fit is decided by the pool's overflow policy:
+
+    drop      discard the job
+    coalesce  replace a queued job for the same handler and channel, else drop
+    busy      tell the user we're busy (commands only), then drop
+"""
+
+import collections
+import logging
+import threading
+
+logger = logging.getLogger('phenny')
+
+overflow_policies = ('drop', 'coalesce', 'busy')
+
+
+class WorkerPool(object):
+    def __init__(self, name, threads=4, queue=100, overflow='drop'):
+        if overflow not in overflow_policies:
+            raise ValueError("Unknown overflow policy '%s' for pool '%s'" % (overflow, name))
+
+        self.name = name
+        self.size = threads
+        self.limit = queue
+        self.overflow = overflow
+
+        self.jobs = collections.deque()
+        self.ready = threading.Condition()
+        self.threads = []
+        self.idle = 0
+        self.stopped = False
+
+        self.dropped = 0
+        self.coalesced = 0
+
+    def submit(self, fn, args=(), name=None, key=None, busy=None):
+        """Queue fn(*args), returning False if the job overflowed the queue."""
+        with self.ready:
+            if self.stopped:
+                return False
+
+            if len(self.jobs) >= self.limit:
+                return self.overflowed(fn, args, name, key, busy)
+
+            self.jobs.append((key, name, fn, args))
+
+            if len(self.jobs) > self.idle and len(self.threads) < self.size:
+                self.spawn()
+
+            self.ready.notify()
+            return True
+
+    def overflowed(self, fn, args, name, key, busy):
+        if self.overflow == 'coalesce' and key is not None:
+            for i, job in enumerate(self.jobs):
+                if job[0] == key:
+                    self.jobs[i] = (key, name, fn, args)
+                    self.coalesced += 1
+                    return True
+
+        self.dropped += 1
+        logger.warning("Worker pool '%s' is full, dropped %s" % (self.name, name or fn))
+
+        if self.overflow == 'busy' and busy is not None:
+            busy()
+
+        return False
+
+    def spawn(self):
+        thread = threading.Thread(target=self.work, name=self.name)
+        thread.daemon = True
+        self.threads.append(thread)
+        thread.start()
+
+    def work(self):
+        thread = threading.current_thread()
+
+        while True:
+            with self.ready:
+                self.idle += 1
+                while not self.jobs and not self.stopped:
+                    self.ready.wait()
+                self.idle -= 1
+
+                if self.stopped:
+                    self.threads.remove(thread)
+                    return
+
+                key, name, fn, args = self.jobs.popleft()
+
+            # modules look for their refresh threads by name
+            thread.name = name or self.name
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Error in worker pool '%s'" % self.name)
+            finally:
+                thread.name = self.name
+
+    def shutdown(self):
+        with self.ready:
+            self.stopped = True
+            self.jobs.clear()
+            self.ready.notify_all()
+
+
+class Executor(object):
+    """Hands threaded handlers to per-priority pools, or to a per-module pool
+    for modules named in config.worker_pools."""
+
+    def __init__(self, config):
+        self.defaults = {
+            'threads': getattr(config, 'workers', 4),
+            'queue': getattr(config, 'worker_queue', 100),
+            'overflow': getattr(config, 'worker_overflow', 'drop'),
+        }
+        self.settings = getattr(config, 'worker_pools', {})
+        self.pools = {}
+        self.lock = threading.Lock()
+
+    def pool(self, func):
+        if func.__module__ in self.settings:
+            name = func.__module__
+        else:
+            name = func.priority
+
+        with self.lock:
+            if name not in self.pools:
+                settings = dict(self.defaults)
+                settings.update(self.settings.get(name, {}))
+                self.pools[name] = WorkerPool(name, **settings)
+
+            return self.pools[name]
+
+    def submit(self, func, fn, args=(), key=None, busy=None):
+        return self.pool(func).submit(fn, args, name=func.name, key=key, busy=busy)
+
+    def shutdown(self):
+        with self.lock:
+            for pool in self.pools.values():
+                pool.shutdown()
+
+
+if __name__ == '__main__':
+    print(__doc__.strip())